@@ -0,0 +1,74 @@
+'''
+Approximate power indices for games with many small players (oceanic games), with the same signatures as in helpers.
+
+Owen's multilinear extension writes the indices as probabilities over independent players that join with probability t:
+a player swings if the others' weight X(t) lies in (quota - weight, quota]. With many players X(t) is close to normal with
+mean t * (W - w_i) and variance t * (1 - t) * (S - w_i^2) (W the total weight, S the sum of squared weights), so
+    banzhaf_normal               t = 1/2
+    generalized_banzhaf_normal   t = decisiveness
+    shapley_normal               integrated over t in [0, 1]
+The error is O(1/sqrt(n)) relative when no player is large. limit_banzhaf is the saddle point limit of
+reverse_banzhaf_solver (the limit of the normalized Banzhaf index when every player is replicated many times).
+The normal approximations are continuous, so strict and non-strict quotas give the same values.
+'''
+import math
+import numpy as np
+from scipy.special import log_ndtr, roots_legendre
+from helpers import make_distribution
+from reverse_banzhaf_solver import get_limit_banzhaf_powers
+
+def _log_swing_probabilities(weights, quota, t):
+    ''' log P(quota - w_i < X_i(t) <= quota) in the normal approximation, per player i (last axis); t broadcasts against
+    the weights. The difference of the normal CDFs is taken in the tail it lies in (by symmetry), from log_ndtr, so it
+    neither cancels to 0 nor underflows far from the mean.'''
+    t = np.asarray(t, dtype = float)
+    means = t * (weights.sum() - weights)
+    deviations = np.sqrt(t * (1 - t) * np.maximum((weights**2).sum() - weights**2, 0))
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        upper = (quota - means) / deviations
+        lower = (quota - weights - means) / deviations
+        # Phi(upper) - Phi(lower) = Phi(-lower) - Phi(-upper), the upper tail is reflected to the lower one
+        reflected = lower > 0
+        upper, lower = np.where(reflected, -lower, upper), np.where(reflected, -upper, lower)
+        log_upper, log_lower = log_ndtr(upper), log_ndtr(lower)
+        difference = log_lower - log_upper
+        # log(1 - e^difference), accurate on both sides of -log(2)
+        log_probabilities = log_upper + np.where(difference > -math.log(2), np.log(-np.expm1(difference)), np.log1p(-np.exp(difference)))
+        certain = np.log(((quota - weights < means) & (means <= quota)).astype(float))
+        return np.where(deviations > 0, log_probabilities, certain)
+
+def _swing_probabilities(weights, quota, t):
+    return np.exp(_log_swing_probabilities(weights, quota, t))
+
+def generalized_banzhaf_normal(population, quota, decisivness, normalize = True):
+    weights = np.asarray(population, dtype = float)
+    log_index = _log_swing_probabilities(weights, quota, float(decisivness))
+    # normalized in log space, since all swing probabilities can be far below the smallest float
+    if normalize: return make_distribution(list(np.exp(log_index - log_index.max())), False)
+    return list(np.exp(log_index))
+
+def banzhaf_normal(population, quota, normalize = True):
+    return generalized_banzhaf_normal(population, quota, 0.5, normalize)
+
+def shapley_normal(population, quota, nodes = 64, widths = 8):
+    ''' Integral of the swing probability over t, with Gauss-Legendre nodes on the window around t = quota / W where the
+    integrand is not negligible: the mean crosses the quota there, and the window reaches widths standard deviations
+    plus the player's weight to both sides.'''
+    weights = np.asarray(population, dtype = float)
+    total = weights.sum()
+    others = total - weights
+    deviations = np.sqrt(np.maximum((weights**2).sum() - weights**2, 0)) / 2
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        center = np.where(others > 0, quota / others, 1)
+        half_width = np.where(others > 0, (widths * deviations + weights) / others, 1)
+    start, end = np.clip(center - half_width, 0, 1), np.clip(center + half_width, 0, 1)
+
+    points, point_weights = roots_legendre(nodes)
+    # one grid of nodes per player (columns)
+    t = start + (end - start) * (points[:, None] + 1) / 2
+    index = (end - start) / 2 * (point_weights @ _swing_probabilities(weights, quota, t))
+    return list(index)
+
+def limit_banzhaf(population, quota):
+    ''' Normalized limit Banzhaf index; the quota is absolute as in helpers.'''
+    return get_limit_banzhaf_powers(population, quota / sum(population))
@@ -0,0 +1,189 @@
+'''
+Command line entry point for the scripts in this repository:
+
+    python -m banzhaf_variants enumerate  --n-min 1 --n-max 6
+    python -m banzhaf_variants at-quota   --n-min 1 --n-max 6 --quotas 1/2 3/4 --workers 4
+    python -m banzhaf_variants index      --weights 4 3 2 1 --quota 6 --index banzhaf shapley --backend dp
+    python -m banzhaf_variants distortion --n-min 3 --n-max 4 --trials 1000 --workers 8 --output distortion.json
+    python -m banzhaf_variants reverse    --target 0.4 0.3 0.2 0.1 --quota 3/4 --index banzhaf
+
+Heavy modules (gurobipy, matplotlib, scipy) are only imported by the subcommand that needs them.
+Results of index, distortion and reverse are written as JSON to --output, or printed if it is not given.
+'''
+import argparse
+import functools
+import json
+import sys
+from fractions import Fraction
+
+INDEX_NAMES = ['banzhaf', 'shapley', 'no_veto']
+
+def number(text):
+    ''' Parses "3", "0.75" or "3/4" exactly.'''
+    return Fraction(text)
+
+def norm(text):
+    ''' Parses the norm p: an integer, or "inf"/"infty" for the maximum norm (p = "infty" in helpers).'''
+    if text in ('inf', 'infty'): return 'infty'
+    return int(text)
+
+def integral(value):
+    ''' Fractions with denominator 1 as ints, so the DP backend and the output stay readable.'''
+    if isinstance(value, Fraction) and value.denominator == 1: return int(value)
+    return value
+
+def jsonable(result):
+    ''' Dict keys (e.g. Fraction quotas) and exact values as strings.'''
+    if isinstance(result, dict): return {str(key): jsonable(value) for key, value in result.items()}
+    if isinstance(result, (list, tuple)): return [jsonable(value) for value in result]
+    return result
+
+def write_output(result, path):
+    text = json.dumps(jsonable(result), indent = 2, default = str)
+    if path is None: print(text)
+    else:
+        with open(path, 'w') as file:
+            file.write(text + '\n')
+
+
+def run_enumerate(args):
+    from find_all_wvgs import enumerate_wvgs
+    enumerate_wvgs(args.n_min, args.n_max, path = args.output or 'storage/all_wvgs.py', strict = args.strict)
+
+def run_at_quota(args):
+    from find_all_wvgs_at_quota import find_all_wvgs_at_quota, QUOTA_RANGE
+    find_all_wvgs_at_quota(args.n_min, args.n_max, args.quotas or QUOTA_RANGE, args.workers,
+                           path = args.output or 'storage/all_wvgs_at_quota.py', strict = args.strict)
+
+def run_index(args):
+    weights = [integral(weight) for weight in args.weights]
+    quota = integral(args.quota)
+    if args.backend == 'dp':
+        from counting import banzhaf_dp, shapley_dp
+        from integer_weights import integer_game
+        # the DP needs integer weights: rational ones are scaled exactly, which changes neither game nor indices
+        weights, quota = integer_game(weights, quota, args.strict)
+        indices = {'banzhaf': lambda: banzhaf_dp(weights, quota, True, args.exact, args.strict),
+                   'shapley': lambda: shapley_dp(weights, quota, args.exact, args.strict)}
+    else:
+        from helpers import banzhaf, shapley, no_veto_index
+        indices = {'banzhaf': lambda: banzhaf(weights, quota, True, args.exact, args.strict),
+                   'shapley': lambda: shapley(weights, quota, args.exact, args.strict),
+                   'no_veto': lambda: no_veto_index(weights, quota, args.strict)}
+    result = dict()
+    for index_name in args.index or indices:
+        if index_name not in indices: raise SystemExit(f"Index {index_name} is not available with the {args.backend} backend")
+        result[index_name] = indices[index_name]()
+    write_output(result, args.output)
+
+def run_distortion(args):
+    from biggest_veto_distortion import veto_distortions, plot_distortions, QUOTA_RANGE
+    trials = {n: args.trials for n in range(args.n_min, args.n_max + 1)}
+    distortions = veto_distortions(trials, args.quotas or QUOTA_RANGE, args.p, tuple(args.index), args.workers, args.seed, strict = args.strict)
+    if args.plot_dir:
+        for n in trials:
+            plot_distortions(n, distortions[n], trials[n], f'{args.plot_dir}/veto_distortion_n{n}.png')
+    write_output(distortions, args.output)
+
+def run_reverse(args):
+    if args.targets_file:
+        import numpy as np
+        targets = np.loadtxt(args.targets_file, ndmin = 2)
+    else: targets = [[float(ele) for ele in args.target]]
+    quota = float(args.quota)
+    results = []
+    if args.index == 'limit_banzhaf':
+        from reverse_banzhaf_solver import solve_reverse_limit_banzhaf_batch
+        solved = solve_reverse_limit_banzhaf_batch(targets, quota, args.tolerance, args.workers)
+        for row in solved:
+            results.append({'weights': row['weights'].tolist(), 'residual': float(row['residual']), 'success': bool(row['success'])})
+    else:
+        from reverse_banzhaf_solver import solve_reverse_index
+        solve = functools.partial(solve_reverse_index, index = args.index, quota = quota, decisiveness = args.decisiveness,
+                                  tolerance = args.tolerance, strict = args.strict)
+        if args.workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers = args.workers) as pool: solved = list(pool.map(solve, targets))
+        else: solved = [solve(target) for target in targets]
+        for weights, residual, success in solved:
+            results.append({'weights': [int(ele) for ele in weights], 'residual': float(residual), 'success': bool(success)})
+    write_output(results, args.output)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog = 'banzhaf_variants', description = 'Enumerate WVGs, compute power indices and solve the reverse problem.')
+    subparsers = parser.add_subparsers(dest = 'command', required = True)
+
+    def add_n_range(subparser, n_min, n_max):
+        subparser.add_argument('--n-min', type = int, default = n_min, help = 'smallest number of players')
+        subparser.add_argument('--n-max', type = int, default = n_max, help = 'largest number of players')
+
+    def add_common(subparser, workers = True):
+        if workers: subparser.add_argument('--workers', type = int, default = 1, help = 'number of worker processes')
+        subparser.add_argument('--output', help = 'output path')
+
+    def add_strict(subparser):
+        subparser.add_argument('--strict', action = argparse.BooleanOptionalAction,
+                               help = 'coalitions win with weight > quota (--no-strict: >= quota); default config.STRICT')
+
+    enumerate_parser = subparsers.add_parser('enumerate', help = 'enumerate all WVGs into storage/all_wvgs.py')
+    add_n_range(enumerate_parser, 1, 6)
+    add_strict(enumerate_parser)
+    add_common(enumerate_parser, workers = False)
+    enumerate_parser.set_defaults(func = run_enumerate)
+
+    at_quota_parser = subparsers.add_parser('at-quota', help = 'find the WVGs attainable at each quota (needs gurobipy)')
+    add_n_range(at_quota_parser, 1, 6)
+    at_quota_parser.add_argument('--quotas', type = number, nargs = '+', help = 'relative quotas, e.g. 1/2 3/4 (default 1/20, ..., 19/20, 2/3)')
+    add_strict(at_quota_parser)
+    add_common(at_quota_parser)
+    at_quota_parser.set_defaults(func = run_at_quota)
+
+    index_parser = subparsers.add_parser('index', help = 'power indices of one weighted voting game')
+    index_parser.add_argument('--weights', type = number, nargs = '+', required = True)
+    index_parser.add_argument('--quota', type = number, required = True, help = 'absolute quota')
+    index_parser.add_argument('--index', nargs = '+', choices = INDEX_NAMES, help = 'default: all indices of the backend')
+    index_parser.add_argument('--backend', choices = ['brute', 'dp'], default = 'brute',
+                              help = 'brute force over all coalitions (helpers) or counting DP for integer weights (counting)')
+    index_parser.add_argument('--exact', action = argparse.BooleanOptionalAction, help = 'Fractions or floats; default config.EXACT')
+    add_strict(index_parser)
+    add_common(index_parser, workers = False)
+    index_parser.set_defaults(func = run_index)
+
+    distortion_parser = subparsers.add_parser('distortion', help = 'veto distortion of the closest stored WVGs')
+    add_n_range(distortion_parser, 3, 3)
+    distortion_parser.add_argument('--trials', type = int, default = 10, help = 'random targets per (n, quota)')
+    distortion_parser.add_argument('--quotas', type = number, nargs = '+', help = 'relative quotas (default 1/2, ..., 19/20)')
+    distortion_parser.add_argument('--index', nargs = '+', choices = INDEX_NAMES, default = INDEX_NAMES)
+    distortion_parser.add_argument('--p', type = norm, default = 1, help = 'norm used to find the closest WVG: 1, 2, ... or inf')
+    distortion_parser.add_argument('--seed', type = int)
+    distortion_parser.add_argument('--plot-dir', help = 'directory to save one plot per n to')
+    add_strict(distortion_parser)
+    add_common(distortion_parser)
+    distortion_parser.set_defaults(func = run_distortion)
+
+    reverse_parser = subparsers.add_parser('reverse', help = 'weights whose power index is closest to a target')
+    targets = reverse_parser.add_mutually_exclusive_group(required = True)
+    targets.add_argument('--target', type = number, nargs = '+')
+    targets.add_argument('--targets-file', help = 'text file with one target per row')
+    reverse_parser.add_argument('--quota', type = number, default = Fraction(3, 4), help = 'relative quota')
+    reverse_parser.add_argument('--index', choices = ['limit_banzhaf', 'banzhaf', 'shapley', 'generalized_banzhaf'], default = 'limit_banzhaf')
+    reverse_parser.add_argument('--decisiveness', type = float, help = "decisiveness for 'generalized_banzhaf'")
+    reverse_parser.add_argument('--tolerance', type = float, default = None,
+                                help = 'residual below which a solve counts as successful (default 1e-8 for limit_banzhaf, else the weight granularity)')
+    add_strict(reverse_parser)
+    add_common(reverse_parser)
+    reverse_parser.set_defaults(func = run_reverse)
+    return parser
+
+def main(argv = None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, 'index', None) == 'generalized_banzhaf' and args.decisiveness is None:
+        parser.error("--index generalized_banzhaf requires --decisiveness")
+    if getattr(args, 'tolerance', 0) is None and args.index == 'limit_banzhaf':
+        args.tolerance = 1e-8
+    args.func(args)
+
+if __name__ == '__main__':
+    sys.exit(main())
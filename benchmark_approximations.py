@@ -0,0 +1,92 @@
+'''
+Error of the approximations in approximations.py against a float DP reference, to decide from which n on the
+approximations are good enough. Weights are integers so the reference comes from counting.windowed_swings in floats,
+which is not exact but has an a-priori error bound (reference_bound) that is reported with every row.
+
+    python benchmark_approximations.py --n 50 200 1000 --quotas 1/2 3/4
+'''
+import argparse
+import math
+import time
+from fractions import Fraction
+import numpy as np
+from approximations import banzhaf_normal, shapley_normal, limit_banzhaf
+from counting import windowed_swings
+from helpers import UNIT_ROUNDOFF, make_distribution
+
+# rng, n -> integer weights
+DISTRIBUTIONS = {
+    'uniform': lambda rng, n: [int(ele) for ele in rng.integers(1, 100, n)],
+    'skewed': lambda rng, n: [int(ele) for ele in np.ceil(rng.pareto(1.5, n) * 10)],
+    'one_large': lambda rng, n: [n * 10] + [int(ele) for ele in rng.integers(1, 20, n - 1)],
+}
+
+# name -> (reference by coalition size, approximation): the normalized Banzhaf index or the Shapley value
+INDICES = {
+    'banzhaf_normal': (False, banzhaf_normal),
+    'limit_banzhaf': (False, limit_banzhaf),
+    'shapley_normal': (True, shapley_normal),
+}
+
+def reference(weights, quota, by_size):
+    ''' The float DP reference: the normalized Banzhaf index, or (by_size) the Shapley value as the mean of the swing
+    probabilities swings / C(n-1, k) over the coalition sizes k.'''
+    swings = windowed_swings(weights, quota, by_size, scaled = True)
+    if by_size: return list(np.array(swings).mean(axis = 1))
+    return make_distribution(swings, False)
+
+def reference_bound(weights, by_size):
+    ''' Bound on the L1 error of reference (up to first order). Every swing probability of windowed_swings(scaled = True)
+    sums non-negative terms, with at most n - 1 additions (each followed by an exact halving) and a window sum of at most
+    max(weights) terms, so its relative error is below (n + max(weights)) u. By size, the factors 2^(n-1) / C(n-1, k)
+    are applied in log space: exp then turns the absolute error of the exponent into a relative one, and the exponent
+    sums log(swings) (below 745 in size) and lgamma terms (below n log n each) with a few ulps each.
+    Normalizing the Banzhaf index doubles the relative error and the sum over the players adds n u. Beyond about
+    1000 players the smallest by-size probabilities (2^-(n-1)) are subnormal, so there is no bound.'''
+    n = len(weights)
+    if by_size and n > 1000: return math.inf
+    relative = n + max(weights) + (4 * (2 * n * math.log(n) + n + 745) if by_size else 0)
+    return ((1 if by_size else 2) * relative + n) * UNIT_ROUNDOFF
+
+def run(n_values, quotas, distributions = tuple(DISTRIBUTIONS), indices = tuple(INDICES), seed = 0):
+    ''' One row per (n, distribution, quota, index) with the L1 and maximal error against the float DP reference, the
+    error bound of the reference and the timings of the reference and the approximation, each measured on its own.
+    The two Banzhaf approximations share one reference, so their rows report the same reference time.'''
+    rng = np.random.default_rng(seed)
+    rows = []
+    for n in n_values:
+        for distribution in distributions:
+            weights = DISTRIBUTIONS[distribution](rng, n)
+            for relative_quota in quotas:
+                quota = float(relative_quota) * sum(weights)
+                references = dict()
+                for index_name in indices:
+                    by_size, approximation = INDICES[index_name]
+                    if by_size not in references:
+                        start = time.perf_counter()
+                        exact = np.array(reference(weights, quota, by_size))
+                        references[by_size] = (exact, time.perf_counter() - start)
+                    exact, reference_seconds = references[by_size]
+                    start = time.perf_counter()
+                    approximate = np.array(approximation(weights, quota))
+                    approximate_seconds = time.perf_counter() - start
+                    rows.append({'n': n, 'distribution': distribution, 'quota': str(relative_quota), 'index': index_name,
+                                 'l1_error': float(np.abs(approximate - exact).sum()), 'max_error': float(np.abs(approximate - exact).max()),
+                                 'reference_bound': reference_bound(weights, by_size),
+                                 'reference_seconds': reference_seconds, 'approximate_seconds': approximate_seconds})
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Error of the approximate indices against a float DP reference.')
+    parser.add_argument('--n', type = int, nargs = '+', default = [25, 100, 400])
+    parser.add_argument('--quotas', type = Fraction, nargs = '+', default = [Fraction(1, 2), Fraction(2, 3), Fraction(3, 4)])
+    parser.add_argument('--distributions', nargs = '+', choices = list(DISTRIBUTIONS), default = list(DISTRIBUTIONS))
+    parser.add_argument('--indices', nargs = '+', choices = list(INDICES), default = list(INDICES))
+    parser.add_argument('--seed', type = int, default = 0)
+    args = parser.parse_args()
+
+    print(f"{'n':>6} {'distribution':12} {'quota':>5} {'index':16} {'L1 error':>10} {'max error':>10} {'ref bound':>10} {'reference':>9} {'approx':>9}")
+    for row in run(args.n, args.quotas, args.distributions, args.indices, args.seed):
+        print(f"{row['n']:6} {row['distribution']:12} {row['quota']:>5} {row['index']:16} {row['l1_error']:10.2e} {row['max_error']:10.2e} "
+              f"{row['reference_bound']:10.2e} {row['reference_seconds']:8.3f}s {row['approximate_seconds']:8.4f}s")
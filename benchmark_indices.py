@@ -0,0 +1,165 @@
+'''
+Benchmark of the power index implementations in helpers.py (and the counting DP engines for integer weights).
+
+Every index runs over a grid of player numbers, weight distributions, relative quotas and exact/float mode.
+For each case the minimum time over a few repeats and the peak memory (tracemalloc, in a separate run) are recorded,
+and the (normalized) outputs are cross-validated against identities between the indices:
+    banzhaf == banzhaf_fast == generalized_banzhaf(decisiveness 1/2) == banzhaf_sentiment(sentiments 1/2) == banzhaf_dp == banzhaf_mitm
+    shapley == semivalue(uniform size distribution) == shapley_dp
+    no_veto_index sums to one
+Results are written as JSON; with --baseline, cases that got slower than threshold times the baseline are reported
+and the script exits with status 1, so it can guard against performance regressions.
+
+    python benchmark_indices.py --n 4 8 12 --output benchmark.json
+    python benchmark_indices.py --n 4 8 12 --baseline benchmark.json --threshold 1.5
+'''
+import argparse
+import json
+import math
+import sys
+import time
+import tracemalloc
+from fractions import Fraction
+import numpy as np
+from helpers import banzhaf, banzhaf_fast, shapley, semivalue, generalized_banzhaf, banzhaf_sentiment, no_veto_index, make_distribution
+from counting import banzhaf_dp, shapley_dp
+from meet_in_the_middle import banzhaf_mitm
+
+QUOTAS = [Fraction(1, 2), Fraction(2, 3), Fraction(3, 4)]
+
+# Weight distributions: rng, n -> weights
+DISTRIBUTIONS = {
+    'uniform': lambda rng, n: list(rng.uniform(0, 1, n)),
+    'dirichlet': lambda rng, n: list(rng.dirichlet([1]*n)),
+    'skewed': lambda rng, n: list(rng.pareto(1.5, n) + 0.01),
+    'integer': lambda rng, n: [int(ele) for ele in rng.integers(1, 10*n, n)],
+    'ties': lambda rng, n: [int(ele) for ele in rng.integers(1, 4, n)],
+}
+
+# name -> (function(weights, quota, exact), largest n it is run for)
+INDICES = {
+    'banzhaf': (lambda weights, quota, exact: banzhaf(weights, quota, False, exact), 16),
+    'banzhaf_fast': (lambda weights, quota, exact: banzhaf_fast(weights, quota/sum(weights), exact), 16),
+    'generalized_banzhaf': (lambda weights, quota, exact: generalized_banzhaf(weights, quota, Fraction(1, 2) if exact else 0.5, False, exact), 16),
+    'banzhaf_sentiment': (lambda weights, quota, exact: banzhaf_sentiment(weights, quota, [Fraction(1, 2) if exact else 0.5]*len(weights), False, exact), 12),
+    'shapley': (lambda weights, quota, exact: shapley(weights, quota, exact), 16),
+    'semivalue': (lambda weights, quota, exact: semivalue(weights, quota, [Fraction(1, len(weights)) if exact else 1/len(weights)]*len(weights), False, exact), 16),
+    'no_veto': (lambda weights, quota, exact: no_veto_index(weights, quota), 10),
+    'banzhaf_dp': (lambda weights, quota, exact: banzhaf_dp(weights, quota, False, exact), 64),
+    'shapley_dp': (lambda weights, quota, exact: shapley_dp(weights, quota, exact), 64),
+    'banzhaf_mitm': (lambda weights, quota, exact: banzhaf_mitm(weights, quota, False, exact), 40),
+}
+
+# Indices that have to agree after normalization (banzhaf_fast only gives normalized values; the DP engines only run on integer weights)
+AGREEING = [['banzhaf', 'banzhaf_fast', 'generalized_banzhaf', 'banzhaf_sentiment', 'banzhaf_dp', 'banzhaf_mitm'], ['shapley', 'semivalue', 'shapley_dp']]
+
+def _time(func, repeats):
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def _peak_memory(func):
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+def _normalized(result, exact):
+    if not any(result): return result
+    return make_distribution(result, exact)
+
+def _agree(result, reference, exact):
+    if exact: return [Fraction(ele) for ele in result] == [Fraction(ele) for ele in reference]
+    return all(math.isclose(float(ele), float(ele_ref), rel_tol = 1e-9, abs_tol = 1e-12) for ele, ele_ref in zip(result, reference))
+
+def run(n_values, distributions = tuple(DISTRIBUTIONS), quotas = QUOTAS, exact_modes = (True, False), indices = tuple(INDICES),
+        repeats = 3, memory = True, seed = 0):
+    ''' Runs the benchmark grid. Returns (cases, mismatches): one dict per case with its timing and peak memory,
+    and a list of the cases whose outputs violate one of the identities.'''
+    rng = np.random.default_rng(seed)
+    cases, mismatches = [], []
+    for n in n_values:
+        for distribution in distributions:
+            weights = DISTRIBUTIONS[distribution](rng, n)
+            integral = all(isinstance(ele, int) for ele in weights)
+            for relative_quota in quotas:
+                for exact in exact_modes:
+                    quota = relative_quota*sum(weights) if integral or exact else float(relative_quota)*sum(weights)
+                    results = dict()
+                    for index_name in indices:
+                        func, max_n = INDICES[index_name]
+                        if n > max_n or (index_name.endswith('_dp') and not integral): continue
+                        seconds, results[index_name] = _time(lambda: func(weights, quota, exact), repeats)
+                        case = {'index': index_name, 'n': n, 'distribution': distribution, 'quota': str(relative_quota),
+                                'exact': exact, 'seconds': seconds}
+                        if memory: case['peak_bytes'] = _peak_memory(lambda: func(weights, quota, exact))
+                        cases.append(case)
+
+                    description = {'n': n, 'distribution': distribution, 'quota': str(relative_quota), 'exact': exact}
+                    for group in AGREEING:
+                        present = [index_name for index_name in group if index_name in results]
+                        for index_name in present[1:]:
+                            if not _agree(_normalized(results[index_name], exact), _normalized(results[present[0]], exact), exact):
+                                mismatches.append(dict(description, index = index_name, reference = present[0]))
+                    if 'no_veto' in results and any(results['no_veto']) and not _agree([sum(results['no_veto'])], [1], exact):
+                        mismatches.append(dict(description, index = 'no_veto', reference = 'sum'))
+    return cases, mismatches
+
+def _key(case):
+    return (case['index'], case['n'], case['distribution'], case['quota'], case['exact'])
+
+def regressions(cases, baseline, threshold = 1.5, min_seconds = 1e-4):
+    ''' Cases that take more than threshold times as long as in the baseline (ignoring cases faster than min_seconds).'''
+    previous = {_key(case): case for case in baseline}
+    slower = []
+    for case in cases:
+        old = previous.get(_key(case))
+        if old and case['seconds'] > min_seconds and case['seconds'] > threshold * old['seconds']:
+            slower.append(dict(case, baseline_seconds = old['seconds']))
+    return slower
+
+def summary(cases):
+    ''' Total time per index and mode, as printed lines.'''
+    totals = dict()
+    for case in cases:
+        key = (case['index'], 'exact' if case['exact'] else 'float')
+        totals[key] = totals.get(key, 0) + case['seconds']
+    return [f'{index_name:20} {mode:5} {seconds:10.4f}s' for (index_name, mode), seconds in sorted(totals.items())]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Benchmark and cross-validate the power index implementations.')
+    parser.add_argument('--n', type = int, nargs = '+', default = [4, 8, 12])
+    parser.add_argument('--distributions', nargs = '+', choices = list(DISTRIBUTIONS), default = list(DISTRIBUTIONS))
+    parser.add_argument('--quotas', type = Fraction, nargs = '+', default = QUOTAS)
+    parser.add_argument('--modes', nargs = '+', choices = ['exact', 'float'], default = ['exact', 'float'])
+    parser.add_argument('--indices', nargs = '+', choices = list(INDICES), default = list(INDICES))
+    parser.add_argument('--repeats', type = int, default = 3)
+    parser.add_argument('--no-memory', action = 'store_true', help = 'skip the tracemalloc runs')
+    parser.add_argument('--seed', type = int, default = 0)
+    parser.add_argument('--output', help = 'JSON file for the results')
+    parser.add_argument('--baseline', help = 'JSON file of an earlier run to compare against')
+    parser.add_argument('--threshold', type = float, default = 1.5)
+    args = parser.parse_args()
+
+    cases, mismatches = run(args.n, args.distributions, args.quotas, [mode == 'exact' for mode in args.modes], args.indices,
+                            args.repeats, not args.no_memory, args.seed)
+    print('\n'.join(summary(cases)))
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({'cases': cases, 'mismatches': mismatches}, file, indent = 2)
+    status = 0
+    for mismatch in mismatches:
+        print('Mismatch:', mismatch)
+        status = 1
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)['cases']
+        for case in regressions(cases, baseline, args.threshold):
+            print(f"Slower: {_key(case)} {case['baseline_seconds']:.4g}s -> {case['seconds']:.4g}s")
+            status = 1
+    sys.exit(status)
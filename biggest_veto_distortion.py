@@ -1,67 +1,89 @@
-from storage.all_wvgs_at_quota import all_wvgs_at_quota as ALL_WVGS_AT_QUOTA
+from storage.loader import all_wvgs_at_quota as ALL_WVGS_AT_QUOTA
 from helpers import *
-import sympy as sp
+from fractions import Fraction
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from config import EXACT, STRICT
-import matplotlib.pyplot as plt
+from config import get_exact, get_strict
 
 
+INDICES = {'banzhaf': lambda weights, q, exact, strict: banzhaf(weights, q, True, exact, strict), 'shapley': shapley, "no_veto": lambda weights, q, exact, strict: no_veto_index(weights, q, strict)}#'generalized_banzhaf': lambda weights, q, exact, strict: generalized_banzhaf(weights, q, q, True, exact, strict)}
 
-p = 1
-trials = {3:10}#, 4:10000, 5: 10000, 6: 10000}
+QUOTA_RANGE = [Fraction(i, 20) for i in range(10,20)]
 
-indices = {'banzhaf': lambda weights, q: banzhaf(weights, q, True), 'shapley': shapley, "no_veto": no_veto_index}#'generalized_banzhaf': lambda weights, q: generalized_banzhaf(weights, q, q, True)}
 
-QUOTA_RANGE = [i/sp.Rational(20) for i in range(10,20)] 
+def veto_distortion(n, quota, trials, p = 1, index_names = tuple(INDICES), seed = None, exact = None, strict = None):
+    ''' For random targets, the largest amount by which a veto player (weight > 1-quota) of the closest stored WVG
+    has a target share below 1-quota, per index. Indices are passed by name so this can run in worker processes.'''
+    rng = np.random.default_rng(seed)
+    distortion = {index_name: 0 for index_name in index_names}
+    funcs = list(ALL_WVGS_AT_QUOTA[n][quota])
+    candidates = {index_name: [INDICES[index_name](ALL_WVGS_AT_QUOTA[n][quota][func], quota, exact, strict) for func in funcs] for index_name in index_names}
+    float_candidates = {index_name: np.array([[float(ele) for ele in powers] for powers in candidates[index_name]]) for index_name in index_names}
 
+    for progress in range(trials):
+        target = rng.dirichlet(alpha=[1]*n) # [1-quota-0.001] + [(quota+0.001)/(n-1)]*(n-1)
+        target.sort()
 
-for n in trials.keys():
-    print(n)
-    distortions = {index_name: dict() for index_name in indices.keys()}
-    for quota in QUOTA_RANGE:
-        distortion = {index_name: 0 for index_name in indices.keys()}
-        all_powers = {index_name: dict() for index_name in indices.keys()}
+        for index_name in index_names:
+            # float pre-screen, exact confirmation of the near-ties
+            best_func = funcs[find_closest_indices(target, candidates[index_name], p, exact, float_candidates[index_name])[0]]
 
-        for func, weights in ALL_WVGS_AT_QUOTA[n][quota].items():
-            for index_name, index in indices.items():
-                all_powers[index_name][func] = index(weights, quota)
-            
-        for progress in range(trials[n]):
-            target = np.random.dirichlet(alpha=[1]*n) # [1-quota-0.001] + [(quota+0.001)/(n-1)]*(n-1) 
-            target.sort()
+            best_weights = ALL_WVGS_AT_QUOTA[n][quota][best_func]
+            veto_indices = [i for i in range(len(best_weights)) if best_weights[i] > 1-quota]
 
-            for index_name in indices.keys():
-                best_dist = None
-                best_func = None
-                for func, powers in all_powers[index_name].items():
-                    dist = distance(target, powers, p, EXACT)
-                    if best_dist == None or best_dist > dist:
-                        best_dist = dist
-                        best_func = func
+            for i in veto_indices:
+                if (1 - quota) - (target[i]) > 0 and index_name =='no_veto': print(i,target, best_weights, quota)
+                distortion[index_name] = max(distortion[index_name], (1 - quota) - (target[i]))
 
-                best_weights = ALL_WVGS_AT_QUOTA[n][quota][best_func]
-                veto_indices = [i for i in range(len(best_weights)) if best_weights[i] > 1-quota]
+        print_progress(progress, trials, f'n={n}, quota={quota}')
+    return distortion
 
-                for i in veto_indices:
-                    if (1 - quota) - (target[i]) > 0 and index_name =='no_veto': print(i,target, best_weights, quota)
-                    distortion[index_name] = max(distortion[index_name], (1 - quota) - (target[i]))
-    
-            print_progress(progress,trials[n])
+def veto_distortions(trials, quota_range = QUOTA_RANGE, p = 1, index_names = tuple(INDICES), workers = 1, seed = None, exact = None, strict = None):
+    ''' veto_distortion for every n in trials (a dict n -> number of trials) and every quota, as {n: {index_name: {quota: distortion}}}.
+    With workers > 1 the (n, quota) pairs run in parallel; each pair gets its own random stream derived from seed.'''
+    exact, strict = get_exact(exact), get_strict(strict)
+    tasks = [(n, quota) for n in trials for quota in quota_range]
+    seeds = np.random.SeedSequence(seed).spawn(len(tasks))
+    arguments = [(n, quota, trials[n], p, index_names, task_seed, exact, strict) for (n, quota), task_seed in zip(tasks, seeds)]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers = workers) as pool:
+            results = list(pool.map(veto_distortion, *zip(*arguments)))
+    else: results = [veto_distortion(*args) for args in arguments]
 
-        for index_name in indices.keys():
-            distortions[index_name][quota] = distortion[index_name]
-    for index_name in indices.keys(): 
-        print(distortions[index_name])
+    distortions = {n: {index_name: dict() for index_name in index_names} for n in trials}
+    for (n, quota), distortion in zip(tasks, results):
+        for index_name in index_names:
+            distortions[n][index_name][quota] = distortion[index_name]
+    return distortions
 
-    for index_name in indices.keys():
+def plot_distortions(n, distortions, trials, path = None):
+    import matplotlib.pyplot as plt
+    for index_name in distortions.keys():
         plt.plot(distortions[index_name].keys(), distortions[index_name].values(), 'o-', label=index_name)
     plt.xlabel('Quota')
     plt.ylabel('Distortion')
-    plt.title(f'Veto Distortion for n={n}, trials = {trials[n]}')
+    plt.title(f'Veto Distortion for n={n}, trials = {trials}')
     plt.grid(True)
     plt.legend()
-    # plt.savefig(f'plots/veto_distortion/veto_distortion_n{n}_nv.png')
+    if path:
+        plt.savefig(path)
+        print(f"Plot saved as {path}")
     plt.close()
-    print(f"Plot saved as veto_distortion_n{n}.png")
 
-        
+
+if __name__ == '__main__':
+    p = 1
+    print("Running tests:")
+    # The same seed gives the same distortions, in one process or spread over workers
+    reference = veto_distortions({3: 5, 4: 5}, QUOTA_RANGE[:2], p, seed = 0)
+    assert veto_distortions({3: 5, 4: 5}, QUOTA_RANGE[:2], p, seed = 0) == reference
+    assert veto_distortions({3: 5, 4: 5}, QUOTA_RANGE[:2], p, workers = 2, seed = 0) == reference
+    print("Success")
+
+    trials = {3:10}#, 4:10000, 5: 10000, 6: 10000}
+
+    distortions = veto_distortions(trials, QUOTA_RANGE, p)
+    for n in trials.keys():
+        for index_name in INDICES.keys():
+            print(distortions[n][index_name])
+        plot_distortions(n, distortions[n], trials[n]) # f'plots/veto_distortion/veto_distortion_n{n}_nv.png'
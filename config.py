@@ -1,10 +1,42 @@
+import contextlib
+import contextvars
+
+# Defaults for functions that are called without exact/strict (i.e. with None).
+# They are read at call time, so they can be changed at runtime; use settings() to change them temporarily.
+
 # If True, winning coalitions need to have weight strictly greater than the threshold.
 # If False, only greater or equal.
-STRICT = True 
+STRICT = True
 
-# If True, uses sp.Rational for exact calculations.
+# If True, uses fractions.Fraction for exact calculations.
 # If False, uses floats (faster but not exact).
-EXACT = True 
+EXACT = True
+
+
+_OVERRIDES = contextvars.ContextVar('overrides', default = dict())
+
+@contextlib.contextmanager
+def settings(exact = None, strict = None):
+    ''' Overrides EXACT and/or STRICT within the block, for the current thread or asyncio task only:
+
+        with settings(exact = False):
+            banzhaf(weights, quota)  # floats
+
+    Explicit exact/strict arguments still take precedence. Worker processes do not inherit the overrides,
+    so pass exact/strict explicitly to functions that run there.'''
+    overrides = dict(_OVERRIDES.get())
+    if exact is not None: overrides['exact'] = exact
+    if strict is not None: overrides['strict'] = strict
+    token = _OVERRIDES.set(overrides)
+    try: yield
+    finally: _OVERRIDES.reset(token)
 
+def get_exact(exact = None):
+    ''' exact if given, otherwise the current setting.'''
+    if exact is not None: return exact
+    return _OVERRIDES.get().get('exact', EXACT)
 
-if STRICT == False: raise NotImplementedError
\ No newline at end of file
+def get_strict(strict = None):
+    ''' strict if given, otherwise the current setting.'''
+    if strict is not None: return strict
+    return _OVERRIDES.get().get('strict', STRICT)
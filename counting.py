@@ -0,0 +1,671 @@
+import functools
+import math
+import numpy as np
+from fractions import Fraction
+from config import get_exact, get_strict
+from helpers import make_distribution
+
+# Coalition counts are bounded by 2**n, so int64 tables are exact up to this many players.
+INT64_MAX_PLAYERS = 62
+
+# Modular tables: residues below primes in (2^61, 2^62) are split into limbs of this many bits for sums, so nothing overflows int64
+LIMB_BITS = 31
+LIMB_MASK = 2**LIMB_BITS - 1
+
+# Removing a player from a float table (remove_weight) amplifies its rounding errors, so scaled CountingTables are rebuilt
+# from the weights after this many removals, or as soon as an entry drops below -SCALED_DRIFT times the largest one
+SCALED_RESYNC_UPDATES = 8
+SCALED_DRIFT = 1e-12
+
+def integer_threshold(quota, strict = None):
+    ''' Smallest integer coalition weight that wins at the given quota.'''
+    strict = get_strict(strict)
+    if strict: return int(math.floor(quota)) + 1
+    return int(math.ceil(quota))
+
+def as_integer_weights(weights):
+    int_weights = [int(w) for w in weights]
+    for int_weight, weight in zip(int_weights, weights):
+        if int_weight != weight or int_weight < 0:
+            raise ValueError(f"DP engines need non-negative integer weights, got {weight}")
+    return int_weights
+
+def is_prime(number):
+    ''' Deterministic Miller-Rabin (the bases are enough for all numbers below 3.3 * 10^24).'''
+    if number < 2: return False
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for prime in bases:
+        if number % prime == 0: return number == prime
+    d, s = number - 1, 0
+    while d % 2 == 0: d, s = d // 2, s + 1
+    for base in bases:
+        x = pow(base, d, number)
+        if x in (1, number - 1): continue
+        for _ in range(s - 1):
+            x = x * x % number
+            if x == number - 1: break
+        else: return False
+    return True
+
+@functools.lru_cache(maxsize = None)
+def modular_primes(count):
+    ''' The count largest primes below 2^62.'''
+    primes, candidate = [], 2**62 - 1
+    while len(primes) < count:
+        if is_prime(candidate): primes.append(candidate)
+        candidate -= 2
+    return primes
+
+def _shift_mod(values, prime):
+    ''' values * 2^LIMB_BITS modulo a prime in (2^61, 2^62), for residues: with values = high 2^31 + low the product is
+    high 2^62 + low 2^31, and 2^62 is congruent to the small 2^62 - prime.'''
+    return (((values >> LIMB_BITS) * (2**62 - prime)) + ((values & LIMB_MASK) << LIMB_BITS)) % prime
+
+def _reduce_mod(reduce, values, prime):
+    ''' reduce (a sum or cumulative sum) of residues modulo the prime, applied to both 31-bit limbs separately.'''
+    return (reduce(values & LIMB_MASK) % prime + _shift_mod(reduce(values >> LIMB_BITS) % prime, prime)) % prime
+
+def chinese_remainder(residues, primes):
+    ''' The integers in [0, prod(primes)) with the given residues (one array per prime), as Python ints in an object array.'''
+    result, modulus = np.zeros(np.shape(residues[0]), dtype = object), 1
+    for residue, prime in zip(residues, primes):
+        residue = residue.astype(object)
+        result = result + modulus * ((residue - result) * pow(modulus, -1, prime) % prime)
+        modulus *= prime
+    return result
+
+def count_dtype(n, scaled = False):
+    if scaled: return np.float64
+    if n <= INT64_MAX_PLAYERS: return np.int64
+    return object
+
+def add_weight(counts, weight, prime = None):
+    ''' Multiply the counting table in place by (1 + y x^weight). The table needs room for the new total.
+    With a prime, the table holds residues modulo that prime.'''
+    length = counts.shape[-1]
+    if counts.ndim == 1:
+        counts[weight:] += counts[:length-weight]
+    else:
+        counts[1:, weight:] += counts[:-1, :length-weight]
+    if prime is not None: counts %= prime
+
+def remove_weight(counts, weight):
+    ''' Divide the counting table in place by (1 + y x^weight), i.e. remove one player with that weight.'''
+    length = counts.shape[-1]
+    if counts.ndim == 1:
+        if weight == 0:
+            if counts.dtype.kind == 'f': counts /= 2
+            else: counts //= 2
+            return
+        for start in range(weight, length, weight):
+            end = min(start + weight, length)
+            counts[start:end] -= counts[start-weight:end-weight]
+    else:
+        for k in range(1, counts.shape[0]):
+            counts[k, weight:] -= counts[k-1, :length-weight]
+
+def coalition_weight_counts(weights, by_size = False, scaled = False, prime = None):
+    ''' Coefficients of prod_i (1 + y x^{w_i}): counts[s] is the number of coalitions of weight s,
+    or counts[k][s] the number of coalitions with k players and weight s if by_size.
+    If scaled, the counts are float fractions of all 2^n coalitions instead; with a prime, int64 residues modulo it.'''
+    weights = as_integer_weights(weights)
+    n = len(weights)
+    shape = (n+1, sum(weights)+1) if by_size else (sum(weights)+1,)
+    counts = np.zeros(shape, dtype = np.int64 if prime is not None else count_dtype(n, scaled))
+    counts[(0,)*len(shape)] = 1
+    total = 0
+    for players, weight in enumerate(weights, 1):
+        # only coalitions of the players added so far are counted yet, the rest of the table is still zero
+        total += weight
+        reached = counts[:players+1, :total+1] if by_size else counts[:total+1]
+        add_weight(reached, weight, prime)
+        if scaled: reached /= 2
+    return counts
+
+def cumulative_counts(counts, prime = None):
+    ''' Cumulative sums along the weight axis (modulo the prime for residues).'''
+    if prime is None: return np.cumsum(counts, axis = -1)
+    return _reduce_mod(lambda values: np.cumsum(values, axis = -1), counts, prime)
+
+def cumulative_at(cumulative, index):
+    ''' Reads the cumulative table (along the last axis) at possibly out of range indices.'''
+    index = np.asarray(index)
+    length = cumulative.shape[-1]
+    values = cumulative[..., np.clip(index, 0, length-1)]
+    return np.where(index < 0, 0, values)
+
+def window_counts(cumulative, weight, threshold, prime = None):
+    ''' Number of coalitions without a player of the given weight whose weight lies in
+    [threshold - weight, threshold), read from the cumulative table of all players.
+
+    Uses 1/(1 + x^w) = sum_j (-1)^j x^{jw}, so the player never has to be removed explicitly.
+    For a table by size, returns the counts per coalition size (of the coalitions without the player).
+    With a prime, the table holds residues and so does the result.'''
+    n = cumulative.shape[0] - 1 if cumulative.ndim == 2 else None
+    if weight == 0 or threshold <= 0 or threshold > cumulative.shape[-1] - 1:
+        return 0 if n is None else np.zeros(n, dtype = cumulative.dtype)
+    terms_needed = (threshold - 1) // weight + 1
+    if n is not None: terms_needed = min(terms_needed, n)
+    upper = threshold - 1 - weight * np.arange(terms_needed)
+    terms = cumulative_at(cumulative, upper) - cumulative_at(cumulative, upper - weight)
+    if n is None:
+        terms[1::2] *= -1
+        if prime is not None: return _reduce_mod(np.sum, terms % prime, prime)
+        return terms.sum()
+    # result[k] = sum_j (-1)^j terms[k-j, j]
+    j = np.arange(min(terms.shape[1], n))
+    rows = np.arange(n)[:, None] - j[None, :]
+    shifted = np.where(rows >= 0, terms[np.maximum(rows, 0), j[None, :]], 0)
+    shifted[:, 1::2] *= -1
+    if prime is not None: return _reduce_mod(lambda values: values.sum(axis = 1), shifted % prime, prime)
+    return shifted.sum(axis = 1).astype(cumulative.dtype)
+
+def all_window_counts(cumulative, weights, threshold, prime = None, lowest = 0):
+    ''' window_counts for every player of a table not by size at once, as one gather and one segmented sum.
+    The alternating sums stop at windows ending below lowest, for tables that are (negligibly close to) zero there.'''
+    weights = np.asarray(weights, dtype = np.int64)
+    if threshold <= 0 or threshold > cumulative.shape[-1] - 1:
+        return np.zeros(len(weights), dtype = cumulative.dtype)
+    lengths = np.where(weights > 0, (threshold - 1 - min(lowest, threshold - 1)) // np.maximum(weights, 1) + 1, 0)
+    starts = np.cumsum(lengths) - lengths
+    players = np.repeat(np.arange(len(weights)), lengths)
+    j = np.arange(lengths.sum()) - np.repeat(starts, lengths)
+    upper = threshold - 1 - weights[players] * j
+    terms = cumulative_at(cumulative, upper) - cumulative_at(cumulative, upper - weights[players])
+    terms[j % 2 == 1] *= -1
+    result = np.zeros(len(weights), dtype = cumulative.dtype)
+    nonempty = lengths > 0
+    if nonempty.any():
+        if prime is not None: result[nonempty] = _reduce_mod(lambda values: np.add.reduceat(values, starts[nonempty]), terms % prime, prime)
+        else: result[nonempty] = np.add.reduceat(terms, starts[nonempty])
+    return result
+
+
+def banzhaf_from_swings(swings, normalize = True, exact = None):
+    exact = get_exact(exact)
+    n = len(swings)
+    if exact: index = [Fraction(int(ele), 2**(n-1)) for ele in swings]
+    else: index = [ele/(2**(n-1)) for ele in swings]
+
+    if normalize: return make_distribution(index, exact)
+    return index
+
+def _swing_matrix(swings_by_size, exact):
+    ''' The swing table as an array for matrix products: Python ints if exact (so nothing overflows), floats otherwise.'''
+    if exact: return np.array([[int(ele) for ele in row] for row in swings_by_size] or [[]], dtype = object)
+    return np.array(swings_by_size, dtype = float).reshape(len(swings_by_size), -1)
+
+def semivalues_from_swings(swings_by_size, distributions, normalize = True, exact = None):
+    ''' Semivalues for several distributions over coalition sizes at once: the value of player i is
+    sum_k swings_by_size[i][k] * distribution[k] / C(n-1, k), so all of them are one matrix product of the swing table
+    with the matrix of size factors. Returns one index per distribution.'''
+    exact = get_exact(exact)
+    n = len(swings_by_size)
+    if exact: factors = np.array([[distribution[k] / Fraction(math.comb(n-1, k)) for distribution in distributions] for k in range(n)], dtype = object)
+    else: factors = np.array([[distribution[k] / math.comb(n-1, k) for distribution in distributions] for k in range(n)], dtype = float)
+    indices = (_swing_matrix(swings_by_size, exact) @ factors.reshape(n, len(distributions))).T
+    if normalize: return [make_distribution(index.tolist(), exact) for index in indices]
+    return [index.tolist() for index in indices]
+
+def semivalue_from_swings(swings_by_size, distribution, normalize = True, exact = None):
+    return semivalues_from_swings(swings_by_size, [distribution], normalize, exact)[0]
+
+def shapley_from_swings(swings_by_size, exact = None):
+    ''' The Shapley value is the semivalue with the uniform distribution over coalition sizes.'''
+    exact = get_exact(exact)
+    n = len(swings_by_size)
+    return semivalue_from_swings(swings_by_size, [Fraction(1, n) if exact else 1/n]*n, False, exact)
+
+def generalized_banzhaf_from_swings(swings_by_size, decisivness, normalize = True, exact = None):
+    ''' As helpers.generalized_banzhaf: the semivalue with the binomial distribution of coalition sizes.'''
+    n = len(swings_by_size)
+    distribution = [math.comb(n-1, k) * decisivness**k * (1-decisivness)**(n-1-k) for k in range(n)]
+    return semivalue_from_swings(swings_by_size, distribution, normalize, exact)
+
+def generalized_banzhaf_polynomials(swings_by_size):
+    ''' Exact integer coefficients c[i][j] such that the (not normalized) generalized Banzhaf value of player i at
+    decisiveness p is sum_j c[i][j] p^j: sum_k swings_by_size[i][k] p^k (1-p)^(n-1-k) expanded in powers of p.'''
+    n = len(swings_by_size)
+    # expansion[k][j] is the coefficient of p^j in p^k (1-p)^(n-1-k)
+    expansion = np.array([[(-1)**(j-k) * math.comb(n-1-k, j-k) if j >= k else 0 for j in range(n)] for k in range(n)], dtype = object)
+    return (_swing_matrix(swings_by_size, True) @ expansion).tolist()
+
+def generalized_banzhaf_sweep_from_swings(swings_by_size, decisivnesses, normalize = True, exact = None):
+    ''' generalized_banzhaf at every decisiveness at once, one index per decisiveness.
+    Floats: the per-size swing probabilities times the binomial size probabilities, one matrix product. This Bernstein form
+    is stable, while the polynomials of generalized_banzhaf_polynomials cancel badly in floats for more than a few players.
+    Exact: Horner's rule on those polynomials, vectorized over the players.'''
+    from scipy.stats import binom
+    exact = get_exact(exact)
+    n = len(swings_by_size)
+    if exact:
+        coefficients = np.array(generalized_banzhaf_polynomials(swings_by_size), dtype = object).reshape(n, n)
+        indices = []
+        for decisivness in decisivnesses:
+            index = np.zeros(n, dtype = object)
+            for j in range(n-1, -1, -1):
+                index = index * decisivness + coefficients[:, j]
+            indices.append(index.tolist())
+    else:
+        probabilities = np.array([[int(ele) / math.comb(n-1, k) for k, ele in enumerate(row)] for row in swings_by_size]).reshape(n, n)
+        sizes = binom.pmf(np.arange(n)[:, None], n-1, np.asarray(decisivnesses, dtype = float)[None, :])
+        indices = (probabilities @ sizes).T.tolist()
+    if normalize:
+        return [make_distribution(_sweep_limit(swings_by_size, decisivness) if decisivness in (0, 1) and not any(index) else index, exact)
+                for decisivness, index in zip(decisivnesses, indices)]
+    return indices
+
+def _sweep_limit(swings_by_size, decisivness):
+    ''' At decisiveness 0 (1) only coalitions of size 0 (n-1) count, so all values can be 0 even though the normalized
+    index has a limit: it is proportional to the swings at the smallest (largest) coalition size with any swings.'''
+    n = len(swings_by_size)
+    sizes = [k for k in range(n) if any(int(row[k]) for row in swings_by_size)]
+    if not sizes: return [0]*n
+    size = sizes[-1] if decisivness == 1 else sizes[0]
+    return [int(row[size]) for row in swings_by_size]
+
+
+class CountingTable:
+    ''' Subset-sum counting table of a weighted voting game with non-negative integer weights.
+
+    Keeps the coefficients of prod_i (1 + x^{w_i}) (also by coalition size if by_size, which Shapley needs),
+    so changing one player's weight costs O(W) (O(nW) by size) instead of a full recomputation,
+    and changing the quota only re-reads the cached cumulative table.
+
+    Counts are exact integers (int64 up to 62 players, Python ints beyond). A scaled table keeps float
+    fractions of all 2^n coalitions instead, which is approximate but much faster for large n, as needed
+    in the inner loops of solvers. Scaled tables give float indices only and no integer swing counts, and are
+    rebuilt every SCALED_RESYNC_UPDATES removals, since removing players from floats accumulates rounding errors.
+    '''
+
+    def __init__(self, weights, quota, by_size = False, strict = None, scaled = False):
+        strict = get_strict(strict)
+        self.weights = as_integer_weights(weights)
+        self.by_size = by_size
+        self.strict = strict
+        self.scaled = scaled
+        self.counts = coalition_weight_counts(self.weights, by_size, scaled)
+        self._removals = 0
+        self._cumulative = None
+        self.set_quota(quota)
+
+    @property
+    def n(self):
+        return len(self.weights)
+
+    @property
+    def total(self):
+        return self.counts.shape[-1] - 1
+
+    def set_quota(self, quota):
+        self.quota = quota
+        self.threshold = integer_threshold(quota, self.strict)
+
+    def _resize(self, total, n):
+        dtype = count_dtype(n, self.scaled)
+        if self.by_size: shape = (n+1, total+1)
+        else: shape = (total+1,)
+        counts = np.zeros(shape, dtype = dtype)
+        rows = min(shape[0], self.counts.shape[0])
+        columns = min(shape[-1], self.counts.shape[-1])
+        if self.by_size: counts[:rows, :columns] = self.counts[:rows, :columns]
+        else: counts[:columns] = self.counts[:columns]
+        self.counts = counts
+
+    def add_player(self, weight):
+        weight, = as_integer_weights([weight])
+        self._resize(self.total + weight, self.n + 1)
+        add_weight(self.counts, weight)
+        if self.scaled: self.counts /= 2
+        self.weights.append(weight)
+        self._cumulative = None
+
+    def remove_player(self, player):
+        weight = self.weights.pop(player)
+        remove_weight(self.counts, weight)
+        if self.scaled: self.counts *= 2
+        self._resize(self.total - weight, self.n)
+        self._resync()
+        self._cumulative = None
+
+    def set_weight(self, player, weight):
+        weight, = as_integer_weights([weight])
+        old_weight = self.weights[player]
+        if weight == old_weight: return
+        remove_weight(self.counts, old_weight)
+        if weight > old_weight: self._resize(self.total - old_weight + weight, self.n)
+        add_weight(self.counts, weight)
+        if weight < old_weight: self._resize(self.total - old_weight + weight, self.n)
+        self.weights[player] = weight
+        self._resync()
+        self._cumulative = None
+
+    def _resync(self):
+        ''' Counts a removal on a scaled table, and rebuilds it after SCALED_RESYNC_UPDATES of them or once it has drifted
+        (its entries are non-negative). Exact tables are updated exactly.'''
+        if not self.scaled: return
+        self._removals += 1
+        if self._removals >= SCALED_RESYNC_UPDATES or self.counts.min() < -SCALED_DRIFT * self.counts.max():
+            self.counts = coalition_weight_counts(self.weights, self.by_size, True)
+            self._removals = 0
+
+    def copy(self):
+        table = object.__new__(CountingTable)
+        table.__dict__.update(self.__dict__)
+        table.weights = list(self.weights)
+        table.counts = self.counts.copy()
+        return table
+
+    def cumulative(self):
+        if self._cumulative is None:
+            self._cumulative = np.cumsum(self.counts, axis = -1)
+        return self._cumulative
+
+    def swings(self):
+        ''' Number of coalitions each player is a swing player for.'''
+        if self.scaled: raise ValueError("Scaled CountingTables have no integer swing counts")
+        cumulative = self.cumulative()
+        if self.by_size:
+            return [sum(int(ele) for ele in row) for row in self.swings_by_size()]
+        return [int(ele) for ele in all_window_counts(cumulative, self.weights, self.threshold)]
+
+    def swings_by_size(self):
+        ''' swings_by_size()[i][k] is the number of coalitions of k other players that player i is a swing player for.'''
+        if self.scaled: raise ValueError("Scaled CountingTables have no integer swing counts")
+        return [[int(ele) for ele in row] for row in self._windows_by_size()]
+
+    def _windows_by_size(self):
+        if not self.by_size: raise ValueError("CountingTable needs by_size = True for counts by coalition size")
+        cumulative = self.cumulative()
+        windows = np.array([window_counts(cumulative, weight, self.threshold) for weight in self.weights]).reshape(self.n, self.n)
+        if self.scaled:
+            # The alternating sums lose all relative precision for coalitions of more than half the players,
+            # so count those through their complements: S is a swing at threshold t iff the other players
+            # outside S have size n-1-|S| and are a swing at threshold W - t + 1.
+            complement = self.total - self.threshold + 1
+            flipped = np.array([window_counts(cumulative, weight, complement)[::-1] for weight in self.weights]).reshape(self.n, self.n)
+            windows[:, self.n // 2:] = flipped[:, self.n // 2:]
+        return windows
+
+    def _scaled_size_probabilities(self):
+        ''' Swing probabilities per player and coalition size, swings / C(n-1, k), from the scaled table: its window sums
+        are swings / 2^n. The factors 2^n / C(n-1, k) overflow beyond about 1000 players, so they are applied in log space.'''
+        n = self.n
+        log_factors = np.array([n * math.log(2) - math.lgamma(n) + math.lgamma(k+1) + math.lgamma(n-k) for k in range(n)])
+        windows = np.maximum(self._windows_by_size(), 0)
+        with np.errstate(divide = 'ignore'):
+            return np.exp(np.log(windows) + log_factors)
+
+    def banzhaf(self, normalize = True, exact = None):
+        exact = get_exact(exact)
+        if self.scaled:
+            # window sums of the scaled table are swings / 2^n
+            if self.by_size: index = list(2 * self._windows_by_size().sum(axis = 1))
+            else:
+                # above the mean weight the alternating sums cancel, so count the complements there (see _windows_by_size)
+                threshold = min(self.threshold, self.total - self.threshold + 1)
+                index = list(2 * np.maximum(all_window_counts(self.cumulative(), self.weights, threshold), 0))
+            if normalize: return make_distribution(index, False)
+            return index
+        return banzhaf_from_swings(self.swings(), normalize, exact)
+
+    def shapley(self, exact = None):
+        exact = get_exact(exact)
+        if self.scaled: return list(self._scaled_size_probabilities().sum(axis = 1) / self.n)
+        return shapley_from_swings(self.swings_by_size(), exact)
+
+    def semivalue(self, distribution, normalize = True, exact = None):
+        exact = get_exact(exact)
+        if self.scaled:
+            index = list(self._scaled_size_probabilities() @ np.array([float(ele) for ele in distribution]))
+            if normalize: return make_distribution(index, False)
+            return index
+        return semivalue_from_swings(self.swings_by_size(), distribution, normalize, exact)
+
+def _tilt(weights, threshold, iterations = 100):
+    ''' theta <= 0 such that players joining independently with probabilities t^w / (1 + t^w), t = e^theta, have the
+    expected coalition weight threshold (at most half the total weight), by bisection.'''
+    from scipy.special import expit
+    weights = np.asarray(weights, dtype = float)
+    positive = weights[weights > 0]
+    low, high = -(math.log(weights.sum()) + 1) / positive.min(), 0.0
+    for _ in range(iterations):
+        middle = (low + high) / 2
+        if (weights * expit(middle * weights)).sum() > threshold: high = middle
+        else: low = middle
+    return (low + high) / 2
+
+def _tilted_counts(weights, threshold, theta):
+    ''' The tilted distribution of banzhaf_scaled: probabilities of the coalition weights 0, ..., min(W, threshold) when
+    every player joins independently with probability t^w / (1 + t^w), t = e^theta (heavier coalitions are dropped).'''
+    from scipy.special import expit
+    length = min(sum(weights), threshold) + 1
+    tilted = np.zeros(length)
+    tilted[0] = 1
+    for weight in weights:
+        if weight == 0: continue
+        joining = expit(theta * weight)
+        shifted = joining * tilted[:length - weight] if weight < length else 0
+        tilted *= 1 - joining
+        if weight < length: tilted[weight:] += shifted
+    return tilted
+
+def _tilted_windows(tilted, weights, threshold, theta):
+    ''' Window sums of tilted(s) t^{T-s} per player, which are the swings up to a common factor (see banzhaf_scaled).'''
+    cumulative = np.cumsum(tilted * np.exp(theta * (threshold - np.arange(threshold + 1))))
+    # the terms of the alternating sums decrease, so they can stop where the cumulative table is negligible
+    lowest = int(np.searchsorted(cumulative, cumulative[-1] * 2.0**-60))
+    return np.maximum(all_window_counts(cumulative, weights, threshold, lowest = lowest), 0)
+
+def _scaled_index(windows, weights, threshold, theta, normalize, log):
+    with np.errstate(divide = 'ignore'):
+        log_scale = np.logaddexp(0, theta * np.array(weights, dtype = float)).sum() - theta * threshold - (len(weights) - 1) * math.log(2)
+        if log: return list(np.log(windows) + log_scale)
+    if normalize: return make_distribution(list(windows), False)
+    return list(windows * math.exp(log_scale))
+
+def _scaled_threshold(weights, quota, strict):
+    ''' The threshold reflected to at most W / 2 by complements, or None if no player is ever a swing player.'''
+    total = sum(weights)
+    threshold = integer_threshold(quota, strict)
+    if threshold <= 0 or threshold > total or total == 0: return None
+    return min(threshold, total - threshold + 1)
+
+def _no_swings(n, normalize, log):
+    if log: return [-math.inf]*n
+    if normalize: raise ZeroDivisionError("No player is ever a swing player")
+    return [0.0]*n
+
+def banzhaf_scaled(population, quota, normalize = True, strict = None, log = False):
+    ''' Float Banzhaf index for very many players (tens of thousands, with small integer weights), where 2^n overflows
+    and the scaled CountingTable underflows away from the mean weight.
+
+    By complements the swings at threshold T are those at W - T + 1, so the threshold is at most W / 2. The DP then runs
+    on the tilted distribution in which every player joins with probability t^w / (1 + t^w), normalized at every step
+    and with t chosen so that the mean is the threshold; the counts near the threshold are O(1/sqrt(n)) there. Since
+    count(s) = prod_i (1 + t^{w_i}) t^{-s} tilted(s), the window sums of tilted(s) t^{T-s} give the swings up to a common
+    factor, and their alternating sums (see window_counts) have decreasing terms. Only weights below T are tracked.
+    With log, returns the logarithms of the (not normalized) index, which can be far below the smallest float.
+    Banzhaf only: Shapley needs the n x W table by coalition size (see approximations.shapley_normal for large n).'''
+    strict = get_strict(strict)
+    weights = as_integer_weights(population)
+    threshold = _scaled_threshold(weights, quota, strict)
+    if threshold is None: return _no_swings(len(weights), normalize, log)
+    theta = _tilt(weights, threshold)
+    windows = _tilted_windows(_tilted_counts(weights, threshold, theta), weights, threshold, theta)
+    return _scaled_index(windows, weights, threshold, theta, normalize, log)
+
+def swings_by_size(population, quota, strict = None):
+    ''' The n x n table of exact swing counts per player and coalition size: swings_by_size(...)[i][k] is the number of
+    coalitions of k other players that player i is a swing player for. It is computed by one DP pass (windowed_swings,
+    or modular_swings beyond INT64_MAX_PLAYERS players) and determines every semivalue, see semivalues_from_swings,
+    shapley_from_swings and generalized_banzhaf_from_swings, and the Banzhaf index through its row sums.'''
+    if len(population) > INT64_MAX_PLAYERS: return modular_swings(population, quota, True, strict)
+    return windowed_swings(population, quota, True, strict)
+
+def generalized_banzhaf_sweep(population, quota, decisivnesses, normalize = True, exact = None, strict = None):
+    ''' generalized_banzhaf (as in helpers) at every decisiveness, from one swings_by_size table.'''
+    return generalized_banzhaf_sweep_from_swings(swings_by_size(population, quota, strict), decisivnesses, normalize, exact)
+
+def windowed_swings(population, quota, by_size = False, strict = None, scaled = False):
+    ''' Swing counts of every player (by coalition size if by_size, as CountingTable.swings_by_size) from tables that
+    only track the coalition weights that can still matter, with the pruning of numPartitions applied to whole tables.
+
+    The players are split in halves recursively. For a group of players with total weight R, the table of the players
+    outside the group only needs the weights in [T - R, T): a lighter coalition cannot reach the swing window [T - w_i, T)
+    of any player i in the group, a heavier one already wins. A half's table is its parent's with the other half added,
+    cut to that range, and a single player's table is exactly its window. So there are no alternating sums (which lose
+    all precision in floats away from the mean weight) and the largest table has min(T, W - T + 1) weights, as swings
+    at T are the swings of the complements at W - T + 1. This saves memory, not time, which is up to about 2.5 times that of the full DP.
+    If scaled, returns swing probabilities (swings / 2^(n-1), or swings / C(n-1, k) by size) as floats instead.'''
+    strict = get_strict(strict)
+    weights = as_integer_weights(population)
+    n, total = len(weights), sum(weights)
+    threshold = integer_threshold(quota, strict)
+    swings = np.zeros((n, n) if by_size else n, dtype = count_dtype(n, scaled))
+    if threshold <= 0 or threshold > total: return swings.tolist()
+    reflected = threshold > total - threshold + 1
+    if reflected: threshold = total - threshold + 1
+
+    def add(table, weight):
+        ''' Adds a player to a table of the weights [lower, threshold) in place.'''
+        if weight >= table.shape[-1]: pass
+        elif by_size: table[1:, weight:] += table[:-1, :table.shape[-1] - weight]
+        else: table[weight:] += table[:table.shape[-1] - weight]
+        if scaled: table /= 2
+
+    def solve(players, table, lower):
+        if len(players) == 1:
+            player = players[0]
+            window = table[..., max(threshold - weights[player] - lower, 0):]
+            swings[player] = window.sum(axis = -1)
+            return
+        middle = len(players) // 2
+        for group, others in ((players[:middle], players[middle:]), (players[middle:], players[:middle])):
+            group_lower = max(threshold - sum(weights[player] for player in group), 0)
+            group_table = table.copy()
+            for player in others:
+                add(group_table, weights[player])
+            solve(group, group_table[..., group_lower - lower:], group_lower)
+
+    # at the top every coalition weight below the threshold counts, starting from the empty coalition
+    table = np.zeros((n, threshold) if by_size else threshold, dtype = swings.dtype)
+    table[(0,)*table.ndim] = 1
+    solve(list(range(n)), table, 0)
+
+    if scaled and by_size:
+        # swings / 2^(n-1) to swings / C(n-1, k), in log space as in CountingTable._scaled_size_probabilities
+        log_factors = np.array([(n-1) * math.log(2) - math.lgamma(n) + math.lgamma(k+1) + math.lgamma(n-k) for k in range(n)])
+        with np.errstate(divide = 'ignore'):
+            swings = np.exp(np.log(swings) + log_factors)
+    if reflected and by_size: swings = swings[:, ::-1]
+    return swings.tolist()
+
+def modular_swings(population, quota, by_size = False, strict = None):
+    ''' Exact swing counts (by coalition size if by_size, as CountingTable.swings_by_size) for any number of players,
+    with the vectorized int64 DP run modulo enough 62-bit primes to reconstruct counts below 2^(n-1) by Chinese remaindering.'''
+    strict = get_strict(strict)
+    weights = as_integer_weights(population)
+    threshold = integer_threshold(quota, strict)
+    primes = modular_primes(len(weights) // 61 + 1)
+    residues = []
+    for prime in primes:
+        cumulative = cumulative_counts(coalition_weight_counts(weights, by_size, prime = prime), prime)
+        if by_size: residues.append(np.array([window_counts(cumulative, weight, threshold, prime) for weight in weights]).reshape(len(weights), len(weights)))
+        else: residues.append(all_window_counts(cumulative, weights, threshold, prime))
+    return chinese_remainder(residues, primes).tolist()
+
+def banzhaf_dp(population, quota, normalize = True, exact = None, strict = None):
+    ''' Beyond INT64_MAX_PLAYERS players the counts are exact through modular_swings instead of Python int tables.'''
+    if len(population) > INT64_MAX_PLAYERS: return banzhaf_from_swings(modular_swings(population, quota, False, strict), normalize, exact)
+    return CountingTable(population, quota, False, strict).banzhaf(normalize, exact)
+
+def shapley_dp(population, quota, exact = None, strict = None):
+    if len(population) > INT64_MAX_PLAYERS: return shapley_from_swings(modular_swings(population, quota, True, strict), exact)
+    return CountingTable(population, quota, True, strict).shapley(exact)
+
+if __name__ == "__main__":
+    # every engine against the brute force indices of helpers on random small games, strict and not
+    import random
+    from helpers import banzhaf, shapley
+    from generating_functions import banzhaf_fft, banzhaf_swings_ntt
+    from meet_in_the_middle import banzhaf_mitm, banzhaf_swings_mitm
+    from quota_profile import banzhaf_profile, shapley_profile
+    print("Running tests:")
+    def close(first, second):
+        return np.allclose(np.array(first, dtype = float), np.array(second, dtype = float), rtol = 1e-9, atol = 1e-12)
+    random.seed(0)
+    for trial in range(200):
+        n = random.randint(1, 8)
+        population = [random.randint(0, 6) for _ in range(n)]
+        if sum(population) == 0: continue
+        # half-integer quotas, so that strict and non-strict games differ
+        quota = Fraction(random.randint(1, 2 * sum(population) - 1), 2)
+        for strict in (False, True):
+            swings = [int(ele * 2**(n-1)) for ele in banzhaf(population, quota, False, True, strict)]
+            exact_shapley = shapley(population, quota, True, strict)
+            table = CountingTable(population, quota, True, strict)
+            assert table.swings() == swings and CountingTable(population, quota, False, strict).swings() == swings
+            assert table.shapley(True) == exact_shapley and shapley_dp(population, quota, True, strict) == exact_shapley
+            assert banzhaf_dp(population, quota, False, True, strict) == banzhaf_from_swings(swings, False, True)
+            scaled = CountingTable(population, quota, True, strict, scaled = True)
+            assert close(scaled.banzhaf(False), banzhaf_from_swings(swings, False, False))
+            assert close(scaled.shapley(), exact_shapley)
+            assert close(CountingTable(population, quota, False, strict, scaled = True).banzhaf(False), banzhaf_from_swings(swings, False, False))
+            # the same tables reached by incremental updates from other weights
+            for by_size in (False, True):
+                for scaled in (False, True):
+                    table = CountingTable([random.randint(0, 6) for _ in range(n)], quota, by_size, strict, scaled)
+                    table.remove_player(0)
+                    table.add_player(random.randint(0, 6))
+                    for _ in range(3):
+                        for player, weight in enumerate(population): table.set_weight(player, random.randint(0, 6))
+                        for player, weight in enumerate(population): table.set_weight(player, weight)
+                    assert close(table.banzhaf(False), banzhaf_from_swings(swings, False, False))
+                    if by_size: assert close(table.shapley(), exact_shapley)
+                    if not scaled: assert table.swings() == swings
+            by_size = windowed_swings(population, quota, True, strict)
+            assert [int(ele) for ele in windowed_swings(population, quota, False, strict)] == swings
+            assert [sum(int(ele) for ele in row) for row in by_size] == swings
+            assert modular_swings(population, quota, True, strict) == [[int(ele) for ele in row] for row in by_size]
+            assert [int(ele) for ele in modular_swings(population, quota, False, strict)] == swings
+            assert swings_by_size(population, quota, strict) == [[int(ele) for ele in row] for row in by_size]
+            assert close(windowed_swings(population, quota, False, strict, scaled = True), banzhaf_from_swings(swings, False, False))
+            assert shapley_from_swings(by_size, True) == exact_shapley
+            assert banzhaf_swings_mitm(population, quota, strict) == swings
+            assert banzhaf_mitm([Fraction(ele, 3) for ele in population], quota / 3, False, True, strict) == banzhaf_from_swings(swings, False, True)
+            assert banzhaf_swings_ntt(population, quota, strict) == swings
+            assert banzhaf_fft(population, quota, False, True, strict) == banzhaf_from_swings(swings, False, True)
+            if any(swings):
+                normalized = banzhaf(population, quota, True, True, strict)
+                assert generalized_banzhaf_sweep(population, quota, [Fraction(1, 2)], True, True, strict)[0] == normalized
+                # at decisiveness 0 and 1 all values can be 0, the normalized sweep returns its limit there
+                ends = generalized_banzhaf_sweep(population, quota, [Fraction(0), Fraction(1)], True, True, strict)
+                assert close(ends, generalized_banzhaf_sweep(population, quota, [Fraction(1, 10**15), 1 - Fraction(1, 10**15)], True, True, strict))
+                assert close(generalized_banzhaf_sweep(population, quota, np.linspace(0, 1, 5), True, False, strict)[::4], ends)
+                assert close(banzhaf_scaled(population, quota, True, strict), normalized)
+                assert close(banzhaf_fft(population, quota, True, False, strict), normalized)
+                assert banzhaf_profile(population, True, True, strict)(quota) == normalized
+                assert banzhaf_profile([ele / 10 for ele in population], True, True, strict)(float(quota / 10)) == normalized
+                assert shapley_profile(population, True, strict)(quota) == exact_shapley
+    # real weights are scaled to integers, also where coalitions weigh exactly the quota
+    for strict in (False, True):
+        profile = shapley_profile([0.2, 0.3, 0.5], True, strict)
+        assert profile(0.5) == profile(0.5, True) == shapley([2, 3, 5], 5, True, strict)
+        assert banzhaf_profile([0.2, 0.3, 0.5], True, True, strict)(0.3) == banzhaf([2, 3, 5], 3, True, True, strict)
+    print("Counting Success")
+    # away from the mean weight the scaled table has to count complements, or its alternating sums cancel
+    population = [random.randint(1, 20) for _ in range(300)]
+    for quota in (Fraction(3, 4), Fraction(9, 10)):
+        exact_index = banzhaf_dp(population, quota * sum(population), True, True)
+        assert close(CountingTable(population, quota * sum(population), scaled = True).banzhaf(), exact_index)
+        assert close(banzhaf_scaled(population, quota * sum(population)), exact_index)
+    # incremental updates of scaled tables must not drift away from a fresh build
+    population = [random.randint(1, 100) for _ in range(150)]
+    table = CountingTable(population, 0, scaled = True)
+    for _ in range(300):
+        player = random.randrange(len(population))
+        population[player] = max(0, population[player] + random.randint(-10, 10))
+        table.set_weight(player, population[player])
+    assert np.abs(table.counts - CountingTable(population, 0, scaled = True).counts).sum() < 1e-12
+    print("Scaled Success")
@@ -1,9 +1,12 @@
 from helpers import *
-from config import EXACT, STRICT
-from storage.all_wvgs import all_wvgs
+from config import get_strict
+import runpy
 import tqdm
+from fractions import Fraction
 
 
+MAXIMUM_WEIGHTS = {1:1, 2:1, 3:2, 4:3, 5:5, 6:9, 7:20}
+
 CORRECT_NUMBERS = {0:2, 1:3, 2:6, 3:20, 4:150, 5:3_287, 6:244_158, 7:66_291_591} # from Enumeration of Threshold Functions of Eight Variables by MUROGA, TSUBOI, BAUGH
 
 
@@ -23,7 +26,8 @@ def all_ordered_wvgs(n, largest_weight):
 
 
 
-def get_equivalent_players(weights, quota, strict = STRICT):
+def get_equivalent_players(weights, quota, strict = None):
+    strict = get_strict(strict)
     n = len(weights)
     p1 = 0
     equivalent_players = {p1: []}
@@ -50,11 +54,11 @@ def get_equivalent_players(weights, quota, strict = STRICT):
             equivalent_players[p1] = []
     return equivalent_players
 
-if __name__ == '__main__':
-    LOWEST_N = 1
-    HIGHEST_N = 6
-    MAXIMUM_WEIGHTS = {1:1, 2:1, 3:2, 4:3, 5:5, 6:9, 7:20}
-    for n in range(LOWEST_N, HIGHEST_N + 1):
+def enumerate_wvgs(lowest_n = 1, highest_n = 6, maximum_weights = MAXIMUM_WEIGHTS, path = 'storage/all_wvgs.py', strict = None):
+    ''' Enumerates all WVGs for each n in the range that is not stored in path yet and appends them to that file.'''
+    all_wvgs = runpy.run_path(path)['all_wvgs']
+    strict = get_strict(strict)
+    for n in range(lowest_n, highest_n + 1):
         # Only run this if n is not in the list yet
         if n in all_wvgs: continue
 
@@ -63,37 +67,40 @@ if __name__ == '__main__':
         possible_functions_with_wvs = set()
         number_of_function_with_multiplicity = 0
         seen = set()
-        for weights in tqdm.tqdm(all_ordered_wvgs(n, MAXIMUM_WEIGHTS[n])): 
+        for weights in tqdm.tqdm(all_ordered_wvgs(n, maximum_weights[n])): 
             if sum(weights)==0: continue
             for q in range(sum(weights)):
                 quota = q + 0.5
-                func = to_function(weights, quota, STRICT)
+                func = to_function(weights, quota, strict)
                 if func not in seen:
                     seen.add(func)
                     possible_functions_with_wvs.add((func, (tuple(weights), quota)))
 
-                    # Get multiplicacy
-                    equivalent_players = get_equivalent_players(weights, q, STRICT)
+                    # Get multiplicacy (the half-integer quota gives the same game whether or not the quota is strict)
+                    equivalent_players = get_equivalent_players(weights, quota, strict)
                     multiplicacy = Factorials[n]
                     for equivalence_set in equivalent_players.values():
-                        multiplicacy= multiplicacy/sp.Rational(Factorials[len(equivalence_set) + 1])
+                        multiplicacy= multiplicacy/Fraction(Factorials[len(equivalence_set) + 1])
                     number_of_function_with_multiplicity += multiplicacy
 
         print(f'Found {len(possible_functions_with_wvs)} unique ordered WVGs for n={n}. Including permutations, found {number_of_function_with_multiplicity}')
         if CORRECT_NUMBERS[n] != number_of_function_with_multiplicity +2: # +2 because the paper also considers the function where all coalitions (cinluding the empty one) are winning and where no coalition (including the grand coalition) is winning
-            print(f"Error: maximum weight {MAXIMUM_WEIGHTS[n]} not big enough for n={n} - not all WVGs found.")
+            print(f"Error: maximum weight {maximum_weights[n]} not big enough for n={n} - not all WVGs found.")
             print(f"Only found {number_of_function_with_multiplicity} of {CORRECT_NUMBERS[n]-2}.")
             continue
 
-        with open(f'storage/all_wvgs.py', "r") as file:
+        with open(path, "r") as file:
             content = file.readlines()
         last_line = content.pop()
         if last_line != "}": raise ValueError
-        with open(f'storage/all_wvgs.py', 'w') as file:
+        with open(path, 'w') as file:
             file.writelines(content)
-        with open(f'storage/all_wvgs.py', 'a') as file:
+        with open(path, 'a') as file:
             file.write("\t"+str(n)+": {\n")
             for (func, weights_with_quota) in possible_functions_with_wvs:
                 file.write(f'\t\t"{func}": {weights_with_quota} ,\n')
             file.write('\t},\n') 
             file.write('}')
+
+if __name__ == '__main__':
+    enumerate_wvgs()
@@ -1,11 +1,15 @@
 import gurobipy as gp
 from helpers import *
-from config import EXACT, STRICT
+from config import get_exact, get_strict
 from find_all_wvgs import to_function, get_equivalent_players
 from storage.all_wvgs import all_wvgs as ALL_WVGS
 import tqdm
+from fractions import Fraction
+from concurrent.futures import ProcessPoolExecutor
 ALL_INDICES = dict()
 
+QUOTA_RANGE = [Fraction(i, 20) for i in range(1,20)] + [Fraction(2, 3)]
+
 CORRECT_NUMBERS_AT_HALF = {1:1, 2:2, 3:4, 4:12, 5:81, 6:1684, 7:123565} # from Enumeration of Threshold Functions of Eight Variables by MUROGA, TSUBOI, BAUGH
 
 def function_to_winning_coalitions(func, to_loosing = False):
@@ -47,119 +51,131 @@ def get_maximal_loosing_coalitions(loosing):
         if is_critical: critical.append(coalition)
     return critical
 
-if __name__ == "__main__":
-    LOWEST_N = 1
-    HIGHEST_N = 6
-    QUOTA_RANGE = [i/sp.Rational(20) for i in range(1,20)] + [2/sp.Rational(3)]
-    N_RANGE = list(range(LOWEST_N, HIGHEST_N + 1))
-    all_wvgs_at_quota = dict()
-    for n in N_RANGE:
-        print(f"n={n}")
-        all_wvgs_at_quota[n] = dict()
-        for quota in QUOTA_RANGE:
-            all_wvgs_at_quota[n][quota] = dict()
-
-            quota_numer = sp.numer(quota)
-            quota_denom = sp.denom(quota)
-
-            if n not in ALL_WVGS: raise NotImplementedError
-            wvgs = ALL_WVGS[n]
+def wvgs_at_quotas(n, quota_range = QUOTA_RANGE, strict = None):
+    ''' All WVGs with n players from storage/all_wvgs.py that are attainable at each quota, as {quota: {function: weights}}.'''
+    strict = get_strict(strict)
+    print(f"n={n}")
+    wvgs_at_quota = dict()
+    for quota in quota_range:
+        wvgs_at_quota[quota] = dict()
+
+        quota_numer = quota.numerator
+        quota_denom = quota.denominator
+
+        if n not in ALL_WVGS: raise NotImplementedError
+        wvgs = ALL_WVGS[n]
+        
+        for function, (weights_here, quota_here) in tqdm.tqdm(wvgs.items()):
+            if not get_exact(): raise NotImplementedError
+
+            # Check if this function is attainable at this quota:
+            minimal_winning_coalitions = get_minimal_winning_coalitions(function_to_winning_coalitions(function))
+            maximal_loosing_coalitions = get_maximal_loosing_coalitions(function_to_winning_coalitions(function, to_loosing=True))
+
+            m = gp.Model()
+            m.setParam('OutputFlag', 0)  # Suppress output to speed up batch solving
+            # print(weights, quota_here/sum(weights))
+            # print(banzhaf(weights,quota_here))
             
-            for function, (weights_here, quota_here) in tqdm.tqdm(wvgs.items()):
-                if not EXACT: raise NotImplementedError
+            slack = m.addVar(name=f"slack", vtype=gp.GRB.CONTINUOUS)
+            weight_vars = []
+            for player in range(n):
+                weight_vars.append(m.addVar(name=f"weight{player}", vtype=gp.GRB.CONTINUOUS))
+            m.update()
 
-                # Check if this function is attainable at this quota:
-                minimal_winning_coalitions = get_minimal_winning_coalitions(function_to_winning_coalitions(function))
-                maximal_loosing_coalitions = get_maximal_loosing_coalitions(function_to_winning_coalitions(function, to_loosing=True))
+            total_weight = gp.LinExpr()
+            for weight_var in weight_vars:
+                total_weight += weight_var
+            m.addConstr(total_weight == 1, 'total_weight')
 
-                m = gp.Model()
-                m.setParam('OutputFlag', 0)  # Suppress output to speed up batch solving
-                # print(weights, quota_here/sum(weights))
-                # print(banzhaf(weights,quota_here))
-                
-                slack = m.addVar(name=f"slack", vtype=gp.GRB.CONTINUOUS)
-                weight_vars = []
+            m.addConstr(slack >= 0, 'non-negative_slack')
+
+            for i, winning_coalition in enumerate(minimal_winning_coalitions):
+                winning_set = gp.LinExpr()
+                for player in range(n):
+                    if player in winning_coalition:
+                        winning_set += weight_vars[player]
+                m.addConstr(quota_denom * winning_set - slack >= quota_numer, "winning_coaliltion_{i}") # TODO: The + 0.000001 is a bit hacky, since guorbi doesn't allow strict inequalities
+            
+            for i, loosing_coalition in enumerate(maximal_loosing_coalitions):
+                loosing_set = gp.LinExpr()
                 for player in range(n):
-                    weight_vars.append(m.addVar(name=f"weight{player}", vtype=gp.GRB.CONTINUOUS))
-                m.update()
-
-                total_weight = gp.LinExpr()
-                for weight_var in weight_vars:
-                    total_weight += weight_var
-                m.addConstr(total_weight == 1, 'total_weight')
-
-                m.addConstr(slack >= 0, 'non-negative_slack')
-
-                for i, winning_coalition in enumerate(minimal_winning_coalitions):
-                    winning_set = gp.LinExpr()
-                    for player in range(n):
-                        if player in winning_coalition:
-                            winning_set += weight_vars[player]
-                    m.addConstr(quota_denom * winning_set - slack >= quota_numer, "winning_coaliltion_{i}") # TODO: The + 0.000001 is a bit hacky, since guorbi doesn't allow strict inequalities
+                    if player in loosing_coalition:
+                        loosing_set += weight_vars[player]
+                m.addConstr(quota_denom * loosing_set + slack <= quota_numer, "loosing_coaliltion_{i}") 
+            
+            m.setObjective(slack, gp.GRB.MAXIMIZE)
+
+            # Solve the model
+            m.optimize()
+
+            # Process results
+            found_weights = []
+            if m.status == gp.GRB.OPTIMAL:
+
+                for v in m.getVars():
+                    if v.VarName =='slack':
+                        slack_value = v.X  
+                    else:
+                        found_weights.append(v.X)
+                # Winning coalitions need weight > quota if strict and losing ones weight < quota otherwise,
+                # so in both cases the game is only attainable with a positive slack
+                if slack_value == 0: 
+                    continue
+
+                if slack_value < 0.001:
+                    raise NotImplementedError #this shouldn't happen
                 
-                for i, loosing_coalition in enumerate(maximal_loosing_coalitions):
-                    loosing_set = gp.LinExpr()
-                    for player in range(n):
-                        if player in loosing_coalition:
-                            loosing_set += weight_vars[player]
-                    m.addConstr(quota_denom * loosing_set + slack <= quota_numer, "loosing_coaliltion_{i}") 
+                found_weights.sort()
+
+                # Sanity Check
+                assert to_function(found_weights, quota, strict) == function
                 
-                m.setObjective(slack, gp.GRB.MAXIMIZE)
-
-                # Solve the model
-                m.optimize()
-
-                # Process results
-                found_weights = []
-                if m.status == gp.GRB.OPTIMAL:
-
-                    for v in m.getVars():
-                        if v.VarName =='slack':
-                            slack_value = v.X  
-                        else:
-                            found_weights.append(v.X)
-                    if STRICT and slack_value == 0: 
-                        continue
-
-                    if slack_value < 0.001:
-                        raise NotImplementedError #this shouldn't happen
-                    
-                    found_weights.sort()
-
-                    # Sanity Check
-                    assert to_function(found_weights, quota) == function
-                    
-                    all_wvgs_at_quota[n][quota][function] = tuple(found_weights)   
-        output_string = "Found: "
-        for quota in QUOTA_RANGE:
-            output_string+= f'({quota}: {len(all_wvgs_at_quota[n][quota])}), '
-        print(output_string)   
+                wvgs_at_quota[quota][function] = tuple(found_weights)   
+    output_string = "Found: "
+    for quota in quota_range:
+        output_string+= f'({quota}: {len(wvgs_at_quota[quota])}), '
+    print(output_string)
+    return wvgs_at_quota
+
+def find_all_wvgs_at_quota(lowest_n = 1, highest_n = 6, quota_range = QUOTA_RANGE, workers = 1, path = 'storage/all_wvgs_at_quota.py', strict = None):
+    ''' Runs wvgs_at_quotas for every n in the range (in parallel if workers > 1) and writes the result to path.'''
+    n_range = list(range(lowest_n, highest_n + 1))
+    strict = get_strict(strict)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers = workers) as pool:
+            tables = list(pool.map(wvgs_at_quotas, n_range, [quota_range]*len(n_range), [strict]*len(n_range)))
+    else: tables = [wvgs_at_quotas(n, quota_range, strict) for n in n_range]
+    all_wvgs_at_quota = dict(zip(n_range, tables))
 
     # for sanity check
-    Factorials = {k : math.factorial(k) for k in range(0,HIGHEST_N+1)}
-    quota = 1/sp.Rational(2)
-    for n in N_RANGE:
+    Factorials = {k : math.factorial(k) for k in range(0,highest_n+1)}
+    quota = Fraction(1, 2)
+    for n in n_range:
         if quota in all_wvgs_at_quota[n]:
             number_of_function_with_multiplicity = 0 
             for function, weights in all_wvgs_at_quota[n][quota].items():
-                        equivalent_players = get_equivalent_players(weights, quota, STRICT)
+                        equivalent_players = get_equivalent_players(weights, quota, strict)
                         multiplicacy = Factorials[n]
                         for equivalence_set in equivalent_players.values():
-                            multiplicacy= multiplicacy/sp.Rational(Factorials[len(equivalence_set) + 1]) 
+                            multiplicacy= multiplicacy/Fraction(Factorials[len(equivalence_set) + 1]) 
                         number_of_function_with_multiplicity += multiplicacy
             # print(number_of_function_with_multiplicity, CORRECT_NUMBERS_AT_HALF[n])
             assert number_of_function_with_multiplicity == CORRECT_NUMBERS_AT_HALF[n]
 
     # Write all_wvgs_at_quota to file
-    with open(f'storage/all_wvgs_at_quota.py', "w") as file:
-        file.write("import sympy as sp\n")
+    with open(path, "w") as file:
+        file.write("from fractions import Fraction\n")
         file.write("all_wvgs_at_quota = {\n")
-        for n in N_RANGE:
+        for n in n_range:
             file.write(f'\t{n}: '+'{\n')
-            for quota in QUOTA_RANGE:
-                file.write(f'\t\t{sp.numer(quota)}/sp.Rational({sp.denom(quota)}): '+'{\n')
+            for quota in quota_range:
+                file.write(f'\t\tFraction({quota.numerator}, {quota.denominator}): '+'{\n')
                 for func, weights in all_wvgs_at_quota[n][quota].items():
                     file.write(f'\t\t\t"{func}": {weights},\n')
                 file.write('\t\t},\n')
             file.write('\t},\n')
-        file.write('}')
\ No newline at end of file
+        file.write('}')
+
+if __name__ == "__main__":
+    find_all_wvgs_at_quota()
@@ -0,0 +1,238 @@
+'''
+The generating function prod_i (1 + x^{w_i}) of the coalition weights by divide and conquer with fast polynomial products,
+for games with a large total weight W (e.g. shareholder votes), where the O(n W) subset-sum DP of counting.py is too slow.
+The players are split in halves recursively, small groups use the DP and the halves are multiplied with
+    ntt    number theoretic transforms modulo primes p = c 2^k + 1 below 3 * 10^9 (exact, int64 throughout), combined by
+           Chinese remaindering; for Banzhaf the swings are counted per prime and only the n swing counts are combined
+    fft    float FFTs (scipy.signal.fftconvolve) on the counts scaled by 1/2 per player (approximate); rounded to integers
+           when the counts are small enough to be exact, and then verified at a random point modulo a prime
+Both take O(W log W log n) time. The NTTs run in numpy int64 arithmetic, which makes them a few times slower than the
+float FFTs per prime, and about n / 30 primes are needed.
+
+Float Banzhaf indices cannot be read from the counts scaled by 2^-n: away from the mean weight the swings are far below
+the rounding errors of the table, and their alternating sums cancel. banzhaf_fft instead multiplies out the tilted
+distribution of counting.banzhaf_scaled, cut at the threshold, and bounds its rounding errors a priori; if the bound
+does not give every index to FFT_TOLERANCE, it falls back to banzhaf_scaled.
+'''
+import functools
+import math
+import random
+import numpy as np
+from config import get_exact, get_strict
+from counting import add_weight, all_window_counts, as_integer_weights, banzhaf_from_swings, banzhaf_scaled, count_dtype, integer_threshold, is_prime
+from counting import _no_swings, _scaled_index, _scaled_threshold, _tilt, _tilted_counts, _tilted_windows
+
+# Groups of at most this many players are multiplied out with the DP
+LEAF_PLAYERS = 16
+
+# Float FFT products are rounded to exact integers up to this many players (rounding errors grow like 2^n * 1e-16 * log W)
+FFT_EXACT_PLAYERS = 40
+
+# The 2-norm of the rounding error of fftconvolve(a, b) is below FFT_ROUNDING * eps * log2(len) * (|a|_2 |b|_1 + |a|_1 |b|_2)
+# (measured up to 0.13 on random, exponentially decaying and peaked inputs)
+FFT_ROUNDING = 4
+
+# Relative accuracy of every float index that banzhaf_fft guarantees before falling back to the DP
+FFT_TOLERANCE = 1e-6
+
+def _prime_factors(number):
+    factors, divisor = set(), 2
+    while divisor * divisor <= number:
+        while number % divisor == 0:
+            factors.add(divisor)
+            number //= divisor
+        divisor += 1
+    if number > 1: factors.add(number)
+    return factors
+
+# Residues stay below this bound, so products of two residues (plus a residue) fit in int64
+MAX_NTT_PRIME = 3 * 10**9
+
+@functools.lru_cache(maxsize = None)
+def ntt_primes(bits, log_length):
+    ''' Primes p = c 2^k + 1 below MAX_NTT_PRIME with k >= log_length and a product above 2^bits, with a primitive root each,
+    as [(p, root)]. They are taken from the largest down, so as few primes as possible are needed.'''
+    primes, product = [], 1
+    step = 2**log_length
+    c = (MAX_NTT_PRIME - 1) // step
+    while product <= 2**bits:
+        if c == 0: raise ValueError(f"Not enough NTT primes for {bits} bits and transforms of length 2^{log_length}")
+        prime = c * step + 1
+        if is_prime(prime):
+            factors = _prime_factors(prime - 1)
+            root = next(g for g in range(2, prime) if all(pow(g, (prime - 1) // q, prime) != 1 for q in factors))
+            primes.append((prime, root))
+            product *= prime
+        c -= 1
+    return primes
+
+@functools.lru_cache(maxsize = None)
+def _bit_reversal(length):
+    levels = length.bit_length() - 1
+    indices = np.arange(length)
+    reversed_indices = np.zeros(length, dtype = np.int64)
+    for bit in range(levels):
+        reversed_indices |= ((indices >> bit) & 1) << (levels - 1 - bit)
+    return reversed_indices
+
+@functools.lru_cache(maxsize = None)
+def _twiddles(prime, root, size, inverse):
+    ''' Powers 0, ..., size/2 - 1 of the size-th root of unity (or of its inverse).'''
+    step = pow(root, (prime - 1) // size, prime)
+    if inverse: step = pow(step, prime - 2, prime)
+    twiddles = np.ones(1, dtype = np.int64)
+    while len(twiddles) < size // 2:
+        twiddles = np.concatenate([twiddles, twiddles * pow(step, len(twiddles), prime) % prime])
+    return twiddles
+
+def _ntt(values, prime, root, inverse = False):
+    ''' Iterative radix-2 number theoretic transform of an int64 array whose length is a power of two.'''
+    length = len(values)
+    values = values[_bit_reversal(length)]
+    size = 2
+    while size <= length:
+        half = size // 2
+        blocks = values.reshape(-1, size)
+        even, odd = blocks[:, :half], blocks[:, half:]
+        products = odd * _twiddles(prime, root, size, inverse) % prime
+        odd[:] = (even - products) % prime
+        even[:] = (even + products) % prime
+        size *= 2
+    if inverse: values = values * pow(length, prime - 2, prime) % prime
+    return values
+
+def _multiply_ntt(first, second, prime, root):
+    length = len(first) + len(second) - 1
+    size = 1 << (length - 1).bit_length()
+    transforms = [_ntt(np.pad(factor, (0, size - len(factor))), prime, root) for factor in (first, second)]
+    return _ntt(transforms[0] * transforms[1] % prime, prime, root, inverse = True)[:length]
+
+def _product_tree(weights, leaf, multiply):
+    ''' prod_i (1 + x^{w_i}) with leaf(weights) for small groups and multiply(first, second) above them.'''
+    if len(weights) <= LEAF_PLAYERS: return leaf(weights)
+    middle = len(weights) // 2
+    return multiply(_product_tree(weights[:middle], leaf, multiply), _product_tree(weights[middle:], leaf, multiply))
+
+def _counts_mod(weights, prime, root):
+    def leaf(group):
+        counts = np.zeros(sum(group) + 1, dtype = np.int64)
+        counts[0] = 1
+        for weight in group:
+            add_weight(counts, weight)
+            counts %= prime
+        return counts
+    return _product_tree(weights, leaf, lambda first, second: _multiply_ntt(first, second, prime, root))
+
+def crt(residues, primes):
+    ''' The numbers in [0, prod(primes)) with the given residues (one array per prime), as an object array of Python ints.
+    Garner's algorithm: the mixed radix digits are computed in int64, only their combination needs big integers.'''
+    digits = []
+    for j, prime in enumerate(primes):
+        # value of the digits so far modulo this prime, and the product of the earlier primes modulo it
+        value, radix = np.zeros_like(residues[j]), 1
+        for digit, previous in zip(digits, primes):
+            value = (value + digit * radix) % prime
+            radix = radix * previous % prime
+        digits.append((residues[j] - value) % prime * pow(radix, prime - 2, prime) % prime)
+    result, radix = np.zeros(len(residues[0]), dtype = object), 1
+    for digit, prime in zip(digits, primes):
+        result += digit.astype(object) * radix
+        radix *= prime
+    return result
+
+def _log_length(weights):
+    ''' log2 of the transform length of the full product.'''
+    return max(1, sum(weights).bit_length())
+
+def coalition_weight_counts_ntt(weights):
+    ''' Exact coalition weight counts as coalition_weight_counts (not by size) in counting.py, via NTT products.'''
+    weights = as_integer_weights(weights)
+    primes = ntt_primes(len(weights), _log_length(weights))
+    counts = crt([_counts_mod(weights, prime, root) for prime, root in primes], [prime for prime, _ in primes])
+    return counts.astype(count_dtype(len(weights)))
+
+def coalition_weight_counts_fft(weights, scaled = True):
+    ''' Coalition weight counts via float FFT products. If scaled, as fractions of all 2^n coalitions (approximate).
+    Otherwise exact integer counts (up to FFT_EXACT_PLAYERS players): the rounded product is verified at a random point
+    modulo a prime, and recomputed with NTTs if the check fails.'''
+    from scipy.signal import fftconvolve
+    weights = as_integer_weights(weights)
+    def leaf(group):
+        counts = np.zeros(sum(group) + 1)
+        counts[0] = 1
+        for weight in group:
+            add_weight(counts, weight)
+            counts /= 2
+        return counts
+    counts = np.maximum(_product_tree(weights, leaf, fftconvolve), 0)
+    if scaled: return counts
+    n = len(weights)
+    if n > FFT_EXACT_PLAYERS: raise ValueError(f"Float FFT counts are only exact up to {FFT_EXACT_PLAYERS} players, use the NTT")
+    counts = np.rint(counts * 2**n).astype(np.int64)
+    if not verify_counts(counts, weights): return coalition_weight_counts_ntt(weights)
+    return counts
+
+def verify_counts(counts, weights, rounds = 2):
+    ''' Checks counts against prod_i (1 + x^{w_i}) at random points modulo a prime; a wrong table passes
+    a round with probability at most W / p < 2^-30 * W.'''
+    prime = 2**61 - 1
+    coefficients = [int(ele) % prime for ele in counts]
+    for _ in range(rounds):
+        point = random.randrange(2, prime)
+        expected = 1
+        for weight in weights:
+            expected = expected * (1 + pow(point, weight, prime)) % prime
+        value = 0
+        for coefficient in reversed(coefficients):
+            value = (value * point + coefficient) % prime
+        if value != expected: return False
+    return True
+
+def banzhaf_swings_ntt(population, quota, strict = None):
+    ''' Exact swing counts: the swings are linear in the counts, so they are counted modulo every prime
+    (with the cumulative table reduced modulo the prime, so the alternating sums stay in int64) and then combined.'''
+    strict = get_strict(strict)
+    weights = as_integer_weights(population)
+    threshold = integer_threshold(quota, strict)
+    primes = ntt_primes(len(weights), _log_length(weights))
+    residues = []
+    for prime, root in primes:
+        cumulative = np.cumsum(_counts_mod(weights, prime, root)) % prime
+        residues.append(all_window_counts(cumulative, weights, threshold) % prime)
+    return [int(ele) for ele in crt(residues, [prime for prime, _ in primes])]
+
+def _tilted_counts_fft(weights, threshold, theta):
+    ''' The tilted distribution of counting._tilted_counts via float FFT products cut at the threshold, with a bound on
+    the 1-norm of the rounding errors of the products (the leaves have the relative rounding errors of the DP). The
+    tables are probability distributions, so an error e of a factor adds at most |e|_1 |other|_1 to the product.'''
+    from scipy.signal import fftconvolve
+    def multiply(first, second):
+        (first, first_error), (second, second_error) = first, second
+        product = fftconvolve(first, second)
+        rounding = FFT_ROUNDING * 2.0**-53 * math.log2(len(product)) * math.sqrt(min(len(product), threshold + 1)) * (
+            np.linalg.norm(first) * second.sum() + first.sum() * np.linalg.norm(second))
+        return np.maximum(product[:threshold + 1], 0), first_error * second.sum() + second_error * first.sum() + rounding
+    return _product_tree([weight for weight in weights if weight > 0], lambda group: (_tilted_counts(group, threshold, theta), 0.0), multiply)
+
+def banzhaf_fft(population, quota, normalize = True, exact = None, strict = None):
+    ''' Banzhaf index from the generating function. Exact: from verified float FFT counts up to FFT_EXACT_PLAYERS players,
+    beyond that from NTTs. Float: from the tilted distribution of counting.banzhaf_scaled by FFT products, or from
+    banzhaf_scaled itself if the error bound does not give every index to FFT_TOLERANCE.'''
+    exact = get_exact(exact)
+    strict = get_strict(strict)
+    weights = as_integer_weights(population)
+    if exact:
+        if len(weights) > FFT_EXACT_PLAYERS:
+            return banzhaf_from_swings(banzhaf_swings_ntt(weights, quota, strict), normalize, exact)
+        cumulative = np.cumsum(coalition_weight_counts_fft(weights, scaled = False))
+        return banzhaf_from_swings(all_window_counts(cumulative, weights, integer_threshold(quota, strict)), normalize, exact)
+    threshold = _scaled_threshold(weights, quota, strict)
+    if threshold is None: return _no_swings(len(weights), normalize, False)
+    theta = _tilt(weights, threshold)
+    tilted, error = _tilted_counts_fft(weights, threshold, theta)
+    windows = _tilted_windows(tilted, weights, threshold, theta)
+    # the factors t^{T-s} are at most 1, so the product errors move every alternating sum by at most their 1-norm (the
+    # rounding of the window sums is that of banzhaf_scaled)
+    if np.any((np.asarray(weights) > 0) & (error > FFT_TOLERANCE * windows)):
+        return banzhaf_scaled(weights, quota, normalize, strict)
+    return _scaled_index(windows, weights, threshold, theta, normalize, False)
@@ -1,8 +1,6 @@
 import math
-import sympy as sp
-import numpy as np
-from config import EXACT, STRICT
-import tqdm
+from fractions import Fraction
+from config import get_exact, get_strict
 
 ALL_INDICES = dict()
 
@@ -15,9 +13,10 @@ def coalition_weight(coalition, weights):
     ''' Coalition is set/list of indices'''
     return sum([weights[i] for i in coalition])
 
-def make_distribution(vector, exact = EXACT):
+def make_distribution(vector, exact = None):
+    exact = get_exact(exact)
     tot = sum(vector)
-    if exact: return [ele/sp.Rational(tot) for ele in vector]
+    if exact: return [ele/Fraction(tot) for ele in vector]
     return [ele/(tot) for ele in vector]
 
 def round_vector(vector, digits = 3):
@@ -36,15 +35,19 @@ def coalition_prob(coalition, probs):
     ''' Coalition is set/list of indices'''
     return prod([probs[i] for i in coalition])
 
-def mean(vector, exact = EXACT):
-    if exact: return sum(vector)/sp.Rational(len(vector))
+def mean(vector, exact = None):
+    exact = get_exact(exact)
+    if exact: return sum(vector)/Fraction(len(vector))
     return sum(vector)/len(vector)
 
-def distance(vec1, vec2, p = 1, exact = EXACT):
+def distance(vec1, vec2, p = 1, exact = None):
+    exact = get_exact(exact)
     if p == 1: return sum(abs(ele1-ele2) for ele1, ele2 in zip(vec1, vec2))
     if exact:
+        # sympy is only needed for the exact p-th root, so it is not imported with this module
+        import sympy as sp
         distances = [abs(sp.Rational(ele1)-sp.Rational(ele2)) for ele1, ele2 in zip(vec1, vec2)]
-        p = sp.Rational(p)
+        if p != "infty": p = sp.Rational(p)
     else:
         distances = [abs(ele1-ele2) for ele1, ele2 in zip(vec1, vec2)]
 
@@ -64,8 +67,9 @@ def compare_print(benchmark, colored):
             print(", ", end="")
     print(']')
 
-def to_function(wvg, quota, strict = STRICT):
+def to_function(wvg, quota, strict = None):
     '''Convert a WVG to a boolean function (as string)'''
+    strict = get_strict(strict)
     output = ""
     n = len(wvg)
     if n not in ALL_INDICES: ALL_INDICES[n] = powerset(list(range(n)))
@@ -80,12 +84,14 @@ def to_function(wvg, quota, strict = STRICT):
             else: output += "0"
     return output
 
-def generalized_banzhaf(population, quota, decisivness, normalize = True, exact = EXACT, strict = STRICT):
+def generalized_banzhaf(population, quota, decisivness, normalize = True, exact = None, strict = None):
     n = len(population)
     distribution = [math.comb(n-1, i) * decisivness**i * (1-decisivness)**(n-1-i) for i in range(0,n)]
     return semivalue(population, quota, distribution, normalize, exact, strict)
 
-def semivalue(population, quota, distribution, normalize = True, exact = EXACT, strict = STRICT):
+def semivalue(population, quota, distribution, normalize = True, exact = None, strict = None):
+    exact = get_exact(exact)
+    strict = get_strict(strict)
     n = len(population) 
     results = [0]*n
     coalitions = powerset(list(range(n)))
@@ -98,7 +104,7 @@ def semivalue(population, quota, distribution, normalize = True, exact = EXACT,
                     if person not in coalition:
                         if weight + person_weight >= quota:
                             if exact:
-                                results[person] += distribution[k]/sp.Rational(math.comb(n-1, k))
+                                results[person] += distribution[k]/Fraction(math.comb(n-1, k))
                             else: 
                                 results[person] += distribution[k]/(math.comb(n-1, k))
         else:
@@ -107,7 +113,7 @@ def semivalue(population, quota, distribution, normalize = True, exact = EXACT,
                     if person not in coalition:
                         if weight + person_weight > quota:
                             if exact:
-                                results[person] += distribution[k]/sp.Rational(math.comb(n-1, k))
+                                results[person] += distribution[k]/Fraction(math.comb(n-1, k))
                             else: 
                                 results[person] += distribution[k]/(math.comb(n-1, k))
     index = results
@@ -130,7 +136,9 @@ def semivalue(population, quota, distribution, normalize = True, exact = EXACT,
     #                     results[person] += (distribution[k] / (math.comb(n-1, k)))
     # return make_distribution(results)
 
-def banzhaf(population, quota, normalize = True, exact = EXACT, strict = STRICT):
+def banzhaf(population, quota, normalize = True, exact = None, strict = None):
+    exact = get_exact(exact)
+    strict = get_strict(strict)
     n = len(population) 
     results = [0]*n
     coalitions = powerset(list(range(n)))
@@ -148,13 +156,14 @@ def banzhaf(population, quota, normalize = True, exact = EXACT, strict = STRICT)
                     if person not in coalition:
                         if weight + person_weight > quota:
                             results[person] += 1
-    if exact: index = [ele/sp.Rational(2**(n-1)) for ele in results]
+    if exact: index = [ele/Fraction(2**(n-1)) for ele in results]
     else: index = [ele/(2**(n-1)) for ele in results]
 
     if normalize: return make_distribution(index, exact)
     return index
 
-def banzhaf_sentiment(population, quota, sentiments, normalize = True, exact = EXACT, strict = STRICT):
+def banzhaf_sentiment(population, quota, sentiments, normalize = True, exact = None, strict = None):
+    strict = get_strict(strict)
     n = len(population) 
     results = [0]*n
     coalitions = powerset(list(range(n)))
@@ -174,13 +183,15 @@ def banzhaf_sentiment(population, quota, sentiments, normalize = True, exact = E
                     if person not in coalition:
                         if weight + person_weight > quota:
                             results[person] += coalition_prob(coalition, sentiments) * coalition_prob([i for i in range(n) if (i != person) and i not in coalition], inverted_sentiments)
-    # if exact: index = [ele/sp.Rational(2**(n-1)) for ele in results]
+    # if exact: index = [ele/Fraction(2**(n-1)) for ele in results]
     # else: index = [ele/(2**(n-1)) for ele in results]
 
     if normalize: return make_distribution(results, exact)
     return results
 
-def shapley(population, quota, exact = EXACT, strict = STRICT):
+def shapley(population, quota, exact = None, strict = None):
+    exact = get_exact(exact)
+    strict = get_strict(strict)
     n = len(population) 
     Factorials = {k : math.factorial(k) for k in range(0,n)}
     results = [0]*n
@@ -203,7 +214,7 @@ def shapley(population, quota, exact = EXACT, strict = STRICT):
                     if person not in coalition:
                         if weight + person_weight > quota:
                             results[person] += Factorials[k]*Factorials[n-k-1]
-    if exact: index = [ele/sp.Rational(math.factorial(n)) for ele in results]
+    if exact: index = [ele/Fraction(math.factorial(n)) for ele in results]
     else: index = [ele/(math.factorial(n)) for ele in results]
 
     return index
@@ -225,10 +236,11 @@ def get_minimal_winning_coalitions(winning):
     return critical
 
 
-def no_veto_index(population, quota, strict = STRICT):
+def no_veto_index(population, quota, strict = None):
+    strict = get_strict(strict)
     n = len(population) 
     coalitions = powerset(list(range(n)))
-    if STRICT:
+    if strict:
         winning_coalitions = [coalition for coalition in coalitions if coalition_weight(coalition, population) > quota]
     else: 
         winning_coalitions = [coalition for coalition in coalitions if coalition_weight(coalition, population) >= quota]
@@ -243,9 +255,9 @@ def no_veto_index(population, quota, strict = STRICT):
     for mwc in mwcs:
         total_value = sum(values[player] for player in mwc)
         for player in mwc:
-            powers[player] += values[player]/sp.Rational(total_value)
+            powers[player] += values[player]/Fraction(total_value)
     nr_mwcs = len(mwcs)
-    return [power/sp.Rational(nr_mwcs) for power in powers]
+    return [power/Fraction(nr_mwcs) for power in powers]
     
    
 def print_progress(progress, trials, msg = None):
@@ -258,33 +270,63 @@ def print_progress(progress, trials, msg = None):
     if progress == trials:
         print("Done.", msg, "                 ")
     
-def find_closest(target, candidates, p = 1, exact = EXACT, return_list = False):
-    min_vec = None
-    if return_list: min_vecs = []
-    min_distance = len(target)
-
-    for vec in candidates:
-        distance_here = distance(vec, target, p, exact)
-        if return_list and (distance_here == min_distance or ((not EXACT) and math.isclose(distance_here, min_distance))):
-            min_vecs.append(vec)
-        elif distance_here < min_distance:
-            min_distance = distance(vec, target, p, exact)
-            min_vec = vec
-            if return_list: min_vecs = [vec]
-    if return_list: return min_vecs
-    return min_vec
+# Unit roundoff of float64, for the error bound of the float pre-screen in find_closest_indices
+UNIT_ROUNDOFF = 2.0**-53
+
+def exact_distance_key(vec1, vec2, p = 1):
+    ''' Exact value that orders vectors like their p-distance: the distance to the power p for integer p, so no roots are needed.'''
+    distances = [abs(Fraction(ele1)-Fraction(ele2)) for ele1, ele2 in zip(vec1, vec2)]
+    if p == "infty": return max(distances)
+    if isinstance(p, int): return sum([ele**p for ele in distances])
+    return distance(vec1, vec2, p, True)
+
+def find_closest_indices(target, candidates, p = 1, exact = None, float_candidates = None):
+    ''' Indices of the candidates closest to target (all of them if there are ties).
+    All distances are computed in float64 first. If exact, only the candidates whose float distance is within a rigorous
+    rounding error bound of the minimum are compared exactly, otherwise ties are decided with math.isclose.
+    float_candidates can hold the candidates as a float array when they are screened against many targets.'''
+    import numpy as np
+    exact = get_exact(exact)
+    candidates = list(candidates)
+    if not candidates: return []
+    if float_candidates is None: float_candidates = np.array([[float(ele) for ele in vec] for vec in candidates])
+    float_target = np.array([float(ele) for ele in target])
+    distances = np.linalg.norm(float_candidates - float_target, ord = np.inf if p == "infty" else p, axis = 1)
+    if not exact:
+        return [int(i) for i in np.flatnonzero(np.isclose(distances, distances.min(), rtol = 1e-9, atol = 0))]
+
+    # Rounding the inputs, the differences and the norm each cost at most a few ulps of the magnitudes involved
+    magnitudes = np.abs(float_candidates).sum(axis = 1) + np.abs(float_target).sum()
+    bounds = 4 * (len(float_target) + 2) * UNIT_ROUNDOFF * (magnitudes + distances)
+    screened = [int(i) for i in np.flatnonzero(distances - bounds <= (distances + bounds).min())]
+    keys = {i: exact_distance_key(candidates[i], target, p) for i in screened}
+    min_key = min(keys.values())
+    return [i for i in screened if keys[i] == min_key]
+
+def find_closest(target, candidates, p = 1, exact = None, return_list = False):
+    candidates = list(candidates)
+    closest = find_closest_indices(target, candidates, p, exact)
+    if return_list: return [candidates[i] for i in closest]
+    if not closest: return None
+    return candidates[closest[0]]
 
 ### I tried and this version of Banzhaf seems faster for large instances - from Jamie's web app
-def numPartitions(a, iEnd, iSkip, vMin, vMax, vSum):
+def numPartitions(a, iEnd, iSkip, vMin, vMax, vSum, strict = True):
     """
-    Counts subsets of a whose sum is > vMin and <= vMax, where a contains the first
+    Counts subsets of a whose sum is > vMin and <= vMax (>= vMin and < vMax if not strict), where a contains the first
     iEnd elements of a but ignoring index iSkip, and vSum is the sum of all elements of a'.
     """
-    if vMin >= vSum or vMax < 0: 
-        return 0
+    if strict:
+        if vMin >= vSum or vMax < 0:
+            return 0
+        everything = vMin < 0 and vMax >= vSum
+    else:
+        if vMin > vSum or vMax <= 0:
+            return 0
+        everything = vMin <= 0 and vMax > vSum
     
     iEnd -= 1
-    if vMin < 0 and vMax >= vSum:
+    if everything:
         if iSkip > iEnd:
             iEnd += 1
         return 2 ** iEnd
@@ -296,14 +338,15 @@ def numPartitions(a, iEnd, iSkip, vMin, vMax, vSum):
         return 1
     x = a[iEnd]
     vSum -= x
-    return numPartitions(a, iEnd, iSkip, vMin, vMax, vSum) + numPartitions(a, iEnd, iSkip, vMin - x, vMax - x, vSum)
+    return numPartitions(a, iEnd, iSkip, vMin, vMax, vSum, strict) + numPartitions(a, iEnd, iSkip, vMin - x, vMax - x, vSum, strict)
 
-def banzhaf_fast(weights, threshold, exact):
+def banzhaf_fast(weights, threshold, exact = None, strict = None):
+    strict = get_strict(strict)
     n = len(weights)
     totalWeight = sum(weights)
     enoughToWin = totalWeight * threshold
     # console.log([weights, n, 0, enoughToWin - weights[0], enoughToWin, totalWeight - weights[0]]);
-    bpiRaw = [numPartitions(weights, n, i, enoughToWin - w, enoughToWin, totalWeight - w) if w else 0 for (i,w) in enumerate(weights)]
+    bpiRaw = [numPartitions(weights, n, i, enoughToWin - w, enoughToWin, totalWeight - w, strict) if w else 0 for (i,w) in enumerate(weights)]
 
     return make_distribution(bpiRaw, exact)
 
@@ -327,12 +370,12 @@ def banzhaf_fast(weights, threshold, exact):
 #             for size in range(n):
 #                 if invert:
 #                     if exact:
-#                         pivotal_vectors[size][player] *= 1/sp.Rational(math.comb(n-1, size))
+#                         pivotal_vectors[size][player] *= 1/Fraction(math.comb(n-1, size))
 #                     else:
 #                         pivotal_vectors[size][player] *= 1/(math.comb(n-1, size))
 #                 else: 
 #                     if exact:
-#                         pivotal_vectors[player][size] *= 1/sp.Rational(math.comb(n-1, size))
+#                         pivotal_vectors[player][size] *= 1/Fraction(math.comb(n-1, size))
 #                     else:
 #                         pivotal_vectors[player][size] *= 1/(math.comb(n-1, size))
 #     else:
@@ -343,12 +386,12 @@ def banzhaf_fast(weights, threshold, exact):
 #             for player in range(n):
 #                 if invert:
 #                     if exact:
-#                         pivotal_vectors[size][player] *= 1/sp.Rational(total)
+#                         pivotal_vectors[size][player] *= 1/Fraction(total)
 #                     else:
 #                         pivotal_vectors[size][player] *= 1/total
 #                 else: 
 #                     if exact:
-#                         pivotal_vectors[player][size] *= 1/sp.Rational(total)
+#                         pivotal_vectors[player][size] *= 1/Fraction(total)
 #                     else:
 #                         pivotal_vectors[player][size] *= 1/(total)
     
@@ -372,23 +415,33 @@ def banzhaf_fast(weights, threshold, exact):
 
 if __name__ == "__main__":
     print("Running tests:")
+    # coalitions of weight exactly the quota win only with non-strict quotas
     population = [3,2,1,1]
     quota = 4
-    assert shapley(population, 4, True) == [1/sp.Rational(2), 1/sp.Rational(6), 1/sp.Rational(6), 1/sp.Rational(6)]
+    assert shapley(population, 4, True, False) == [1/Fraction(2), 1/Fraction(6), 1/Fraction(6), 1/Fraction(6)]
+    assert shapley(population, 4, True, True) == [7/Fraction(12), 1/Fraction(4), 1/Fraction(12), 1/Fraction(12)]
     print("Shapley Success")
     population = [4,3,2,1]
     quota = 6
-    assert banzhaf(population, quota, False, True) == [5/sp.Rational(8), 3/sp.Rational(8), 3/sp.Rational(8), 1/sp.Rational(8)]
-    assert banzhaf(population, quota, True, True) == [5/sp.Rational(12), 3/sp.Rational(12), 3/sp.Rational(12), 1/sp.Rational(12)]
+    assert banzhaf(population, quota, False, True, False) == [5/Fraction(8), 3/Fraction(8), 3/Fraction(8), 1/Fraction(8)]
+    assert banzhaf(population, quota, True, True, False) == [5/Fraction(12), 3/Fraction(12), 3/Fraction(12), 1/Fraction(12)]
+    assert banzhaf(population, quota, False, True, True) == [5/Fraction(8), 3/Fraction(8), 1/Fraction(8), 1/Fraction(8)]
+    assert banzhaf(population, quota, True, True, True) == [1/Fraction(2), 3/Fraction(10), 1/Fraction(10), 1/Fraction(10)]
+    assert to_function(population, quota, False) != to_function(population, quota, True)
+    from config import settings
+    for strict in (False, True):
+        with settings(strict = strict):
+            assert banzhaf(population, quota, True, True) == banzhaf(population, quota, True, True, strict)
     print("Banzhaf Success")
 
-    # assert get_pivotal_vectors([5,5,3,3,3], 19/sp.Rational(2), True, False, False) == [[0, 1/sp.Rational(4), 1, 1/sp.Rational(4), 0], [0, 1/sp.Rational(4), 1, 1/sp.Rational(4), 0], [0, 0, 2/sp.Rational(3),0, 0], [0, 0, 2/sp.Rational(3),0, 0], [0, 0, 2/sp.Rational(3),0, 0]]
-    # assert get_pivotal_vectors([5,3,2,1], 11/sp.Rational(2), True, False, False) == [[0, 1, 1, 0], [0, 1/sp.Rational(3), 1/sp.Rational(3), 0], [0, 1/sp.Rational(3), 1/sp.Rational(3), 0], [0, 1/sp.Rational(3), 1/sp.Rational(3), 0]]
+    # assert get_pivotal_vectors([5,5,3,3,3], 19/Fraction(2), True, False, False) == [[0, 1/Fraction(4), 1, 1/Fraction(4), 0], [0, 1/Fraction(4), 1, 1/Fraction(4), 0], [0, 0, 2/Fraction(3),0, 0], [0, 0, 2/Fraction(3),0, 0], [0, 0, 2/Fraction(3),0, 0]]
+    # assert get_pivotal_vectors([5,3,2,1], 11/Fraction(2), True, False, False) == [[0, 1, 1, 0], [0, 1/Fraction(3), 1/Fraction(3), 0], [0, 1/Fraction(3), 1/Fraction(3), 0], [0, 1/Fraction(3), 1/Fraction(3), 0]]
    
+    import numpy as np
     weights = np.random.dirichlet(alpha=[1]*6)
     # assert get_pivotal_vectors(weights, 1/2, True, True, False) == [semivalue(weights, 1/2, [0]*(i) + [1] + [0]*(5-i), False, True) for i in range (6)]
     print("Semivalue success")
 
-    assert banzhaf(weights, 1/sp.Rational(2), True, True) == generalized_banzhaf(weights,1/sp.Rational(2), 1/sp.Rational(2), True, True)
-    assert banzhaf(weights, 2/sp.Rational(3), True, True) == generalized_banzhaf(weights,2/sp.Rational(3), 1/sp.Rational(2), True, True)
-    assert [0,0,0,0,0] == generalized_banzhaf([1,1,1,1,1],1/sp.Rational(2), 1, False, True)
+    assert banzhaf(weights, 1/Fraction(2), True, True) == generalized_banzhaf(weights,1/Fraction(2), 1/Fraction(2), True, True)
+    assert banzhaf(weights, 2/Fraction(3), True, True) == generalized_banzhaf(weights,2/Fraction(3), 1/Fraction(2), True, True)
+    assert [0,0,0,0,0] == generalized_banzhaf([1,1,1,1,1],1/Fraction(2), 1, False, True)
@@ -0,0 +1,132 @@
+'''
+Integer representations of weighted voting games, to keep the tables of the counting DP engines (size ~ total weight W) small.
+
+    scale_to_integers            exact: multiplies rational (or float) weights and the quota by the LCM of the denominators
+    reduce_gcd                   exact: divides integer weights and the quota by the GCD of the weights
+    minimal_integer_realization  the same game (the same winning coalitions) with the smallest integer total weight, by an ILP
+    integer_game                 the above in sequence, as preprocessing for banzhaf_dp, shapley_dp and CountingTable
+
+Floats are converted exactly (0.047619047619047596 is a dyadic rational with denominator 2^57), so scaling stored float
+weights gives huge integers; the minimal realization then finds the small integer weights of the same game.
+'''
+import math
+from fractions import Fraction
+import numpy as np
+from config import get_strict
+from counting import integer_threshold
+
+# The realization enumerates all 2^n coalitions for the minimal winning and maximal losing ones
+MAX_REALIZATION_PLAYERS = 20
+
+def scale_to_integers(population, quota):
+    ''' Integer weights and the correspondingly scaled (rational) quota of the same game.'''
+    rationals = [Fraction(ele) for ele in population]
+    if any(ele < 0 for ele in rationals): raise ValueError("Weights need to be non-negative")
+    denominator = math.lcm(*[ele.denominator for ele in rationals]) if rationals else 1
+    return [int(ele * denominator) for ele in rationals], Fraction(quota) * denominator
+
+def reduce_gcd(weights, quota):
+    ''' Divides integer weights and the quota by the GCD of the weights.'''
+    divisor = math.gcd(*weights)
+    if divisor <= 1: return list(weights), quota
+    return [ele // divisor for ele in weights], Fraction(quota) / divisor
+
+def _coalition_weights(weights):
+    ''' Weights of all coalitions, indexed by their bitmask (the order of helpers.powerset).'''
+    dtype = np.int64 if sum(weights) < 2**62 else object
+    sums = np.zeros(1, dtype = dtype)
+    for weight in weights:
+        sums = np.concatenate([sums, sums + weight])
+    return sums
+
+def _critical_coalitions(weights, threshold):
+    ''' Bitmask matrices (coalitions x players) of the minimal winning and the maximal losing coalitions.'''
+    n = len(weights)
+    sums = _coalition_weights(weights)
+    members = (np.arange(2**n)[:, None] >> np.arange(n)) & 1 == 1
+    winning = sums >= threshold
+    weights = np.array(weights, dtype = sums.dtype)
+    # minimal winning: winning and losing without its lightest member; maximal losing: losing and winning with the lightest other player
+    lightest = np.where(members, weights, sums[-1] + 1).min(axis = 1)
+    lightest_other = np.where(members, sums[-1] + 1, weights).min(axis = 1)
+    minimal_winning = winning & ((sums - lightest < threshold) | ~members.any(axis = 1))
+    maximal_losing = ~winning & ((lightest_other > sums[-1]) | (sums + lightest_other >= threshold))
+    return members[minimal_winning], members[maximal_losing]
+
+def minimal_integer_realization(population, quota, strict = None):
+    ''' Non-negative integer weights and an integer quota of the same game (the same winning coalitions at the same
+    strictness) with the smallest total weight, from an ILP over the minimal winning and maximal losing coalitions.
+    The weights keep the order of the original ones (some minimal realization always does), which helps the solver.'''
+    from scipy.optimize import LinearConstraint, milp
+    strict = get_strict(strict)
+    n = len(population)
+    if n > MAX_REALIZATION_PLAYERS: raise ValueError(f"The realization enumerates all coalitions, so it is limited to {MAX_REALIZATION_PLAYERS} players")
+    weights, quota = scale_to_integers(population, quota)
+    threshold = integer_threshold(quota, strict)
+
+    # games where every or no coalition wins
+    def result(new_weights, new_threshold):
+        return new_weights, new_threshold - 1 if strict else new_threshold
+    if threshold <= 0: return result([0]*n, 0)
+    if threshold > sum(weights): return result([0]*n, 1)
+
+    minimal_winning, maximal_losing = _critical_coalitions(weights, threshold)
+    # variables: n weights and the threshold t; winning coalitions weigh at least t, losing ones at most t - 1
+    rows = [np.hstack([minimal_winning, -np.ones((len(minimal_winning), 1))]),
+            np.hstack([maximal_losing, -np.ones((len(maximal_losing), 1))])]
+    lower = [np.zeros(len(minimal_winning)), np.full(len(maximal_losing), -np.inf)]
+    upper = [np.full(len(minimal_winning), np.inf), np.full(len(maximal_losing), -1)]
+    order = np.argsort(weights, kind = 'stable')
+    if n > 1:
+        ordering = np.zeros((n-1, n+1))
+        ordering[np.arange(n-1), order[1:]] = 1
+        ordering[np.arange(n-1), order[:-1]] = -1
+        rows.append(ordering)
+        lower.append(np.zeros(n-1))
+        upper.append(np.full(n-1, np.inf))
+    constraints = LinearConstraint(np.vstack(rows), np.concatenate(lower), np.concatenate(upper))
+    objective = np.concatenate([np.ones(n), [0]])
+    solution = milp(objective, constraints = constraints, integrality = np.ones(n+1), bounds = (0, np.inf))
+    if not solution.success: raise RuntimeError(f"No integer realization found: {solution.message}")
+    new_weights = [int(round(ele)) for ele in solution.x[:n]]
+    new_threshold = int(round(solution.x[n]))
+
+    # the ILP solver works in floats, so check the game exactly
+    sums, new_sums = _coalition_weights(weights), _coalition_weights(new_weights)
+    if not np.array_equal(sums >= threshold, new_sums >= new_threshold): raise RuntimeError("The integer realization is not the same game")
+    return result(new_weights, new_threshold)
+
+def integer_game(population, quota, strict = None, minimal = False):
+    ''' Integer weights and quota of the same game for the DP engines: exact scaling and GCD reduction,
+    and the minimal integer realization if minimal (up to MAX_REALIZATION_PLAYERS players).'''
+    if minimal: return minimal_integer_realization(population, quota, strict)
+    return reduce_gcd(*scale_to_integers(population, quota))
+
+if __name__ == "__main__":
+    import itertools
+    import random
+    from helpers import to_function
+    print("Running tests:")
+    assert scale_to_integers([Fraction(1, 2), 0.25], Fraction(1, 2)) == ([2, 1], 2)
+    assert reduce_gcd([6, 4, 2], 7) == ([3, 2, 1], Fraction(7, 2))
+    assert integer_game([Fraction(1, 2), Fraction(1, 4)], Fraction(1, 2)) == ([2, 1], 2)
+    assert minimal_integer_realization([49, 49, 2], 51, False) == ([1, 1, 1], 2)
+    assert minimal_integer_realization([4, 3, 2, 1], 6, False) == ([3, 2, 2, 1], 5)
+    assert minimal_integer_realization([4, 3, 2, 1], 6, True) == ([3, 2, 1, 1], 4)
+    print("Known games Success")
+
+    # the same game, and no integer realization with a smaller total weight (by brute force over small weights)
+    random.seed(0)
+    for trial in range(40):
+        n = random.randint(1, 4)
+        population = [random.randint(0, 9) / random.choice([1, 2, 3]) for _ in range(n)]
+        quota = Fraction(random.randint(1, 2 * int(sum(population)) + 1), 2)
+        for strict in (False, True):
+            game = to_function(population, quota, strict)
+            weights, new_quota = reduce_gcd(*scale_to_integers(population, quota))
+            assert to_function(weights, new_quota, strict) == game
+            weights, new_quota = minimal_integer_realization(population, quota, strict)
+            assert to_function(weights, new_quota, strict) == game
+            smaller = [candidate for candidate in itertools.product(range(sum(weights)), repeat = n) if sum(candidate) < sum(weights)]
+            assert not any(to_function(candidate, t, strict) == game for candidate in smaller for t in range(sum(candidate) + 2))
+    print("Realization Success")
@@ -0,0 +1,139 @@
+'''
+Exact Banzhaf index by meet in the middle, for real or rational weights and about 30 to 50 players
+(2^n enumeration stops at about 25 players, and the counting DP engines need small integer weights).
+
+The players are split into two halves and the 2^(n/2) coalition weights of each half are sorted once. For a player i
+in one half, its swing coalitions are the pairs (a, b) of a coalition a of its own half without i and a coalition b of
+the other half with a + b in the swing interval, so they are counted with one binary search per a in the sorted other half.
+That is O(n 2^(n/2) log) time and O(2^(n/2)) memory; n = 40 takes seconds, n = 50 minutes and a few GB.
+
+Ints, Fractions and floats (exactly, by the LCM of their dyadic denominators) are scaled to integers and counted
+exactly in int64 whenever the scaled total fits. Otherwise the sums are computed in float64: pairs whose sum is further
+than a rigorous rounding error bound from the boundaries of the swing interval are counted directly, the ones within
+the bound are decided with exact rational sums, once per pair of distinct sums (tied weights give few of them).
+'''
+import collections
+import functools
+import math
+from fractions import Fraction
+import numpy as np
+from config import get_exact, get_strict
+from counting import banzhaf_from_swings, integer_threshold
+
+def _half_sums(weights, dtype):
+    ''' Weights of all coalitions of the given players, indexed by the bitmask of the coalition, sorted.
+    Returns (sums, masks) with the sorted sums and the bitmask of each.'''
+    sums = np.zeros(1, dtype = dtype)
+    for weight in weights:
+        sums = np.concatenate([sums, sums + weight])
+    masks = np.argsort(sums, kind = 'stable')
+    return sums[masks], masks
+
+def _integer_weights(weights, quota):
+    ''' Common integer scaling of the weights (floats taken exactly, with their dyadic denominators) and the quota,
+    or None if the scaled total weight does not fit in int64.'''
+    rationals = [Fraction(float(weight)) if isinstance(weight, (float, np.floating)) else Fraction(weight) for weight in weights]
+    denominator = math.lcm(*[ele.denominator for ele in rationals])
+    int_weights = [int(ele * denominator) for ele in rationals]
+    if sum(int_weights) >= 2**62: return None
+    return int_weights, Fraction(quota) * denominator
+
+def _split(n):
+    return list(range(n // 2)), list(range(n // 2, n))
+
+def _integer_swings(weights, quota, strict):
+    n = len(weights)
+    threshold = integer_threshold(quota, strict)
+    halves = _split(n)
+    sorted_halves = [_half_sums([weights[player] for player in half], np.int64) for half in halves]
+    swings = [0]*n
+    for side, half in enumerate(halves):
+        own_sums, own_masks = sorted_halves[side]
+        other_sums = sorted_halves[1 - side][0]
+        for bit, player in enumerate(half):
+            # reversed, so the searched values below ascend (numpy's searchsorted is much faster on sorted values)
+            without = own_sums[(own_masks >> bit) & 1 == 0][::-1]
+            # swing iff threshold - w <= a + b < threshold
+            upper = np.searchsorted(other_sums, threshold - without, 'left')
+            lower = np.searchsorted(other_sums, threshold - weights[player] - without, 'left')
+            swings[player] = int((upper - lower).sum())
+    return swings
+
+def _float_swings(weights, quota, strict):
+    n = len(weights)
+    float_weights = np.array([float(ele) for ele in weights])
+    float_quota = float(quota)
+    exact_weights = [Fraction(ele) for ele in weights]
+    exact_quota = Fraction(quota)
+    # every float sum of at most n + 1 terms below is within this distance of its exact value
+    epsilon = 4 * (n + 2) * 2.0**-53 * (np.abs(float_weights).sum() + abs(float_quota))
+    halves = _split(n)
+    sorted_halves = [_half_sums(float_weights[half], np.float64) for half in halves]
+
+    # runs[side][position] numbers the distinct float sums in sorted order; ties are common (e.g. equal weights), so the
+    # ambiguous pairs are decided once per pair of distinct exact sums
+    runs = [np.concatenate([[0], np.cumsum(sums[1:] != sums[:-1])]) for sums, _ in sorted_halves]
+
+    @functools.lru_cache(maxsize = None)
+    def run_members(side, run):
+        ''' (mask, exact sum) of the coalitions of a half in one run of equal float sums.'''
+        sums, masks = sorted_halves[side]
+        start, end = np.searchsorted(runs[side], [run, run + 1])
+        members = []
+        for mask in masks[start:end]:
+            mask = int(mask)
+            members.append((mask, sum((exact_weights[player] for bit, player in enumerate(halves[side]) if mask >> bit & 1), Fraction(0))))
+        return members
+
+    @functools.lru_cache(maxsize = None)
+    def run_counts(side, run):
+        return collections.Counter(value for _, value in run_members(side, run))
+
+    def is_swing(coalition_weight, weight):
+        if strict: return coalition_weight <= exact_quota < coalition_weight + weight
+        return coalition_weight < exact_quota <= coalition_weight + weight
+
+    swings = [0]*n
+    for side, half in enumerate(halves):
+        own_sums, own_masks = sorted_halves[side]
+        other_sums = sorted_halves[1 - side][0]
+        for bit, player in enumerate(half):
+            keep = (own_masks >> bit) & 1 == 0
+            without, without_runs = own_sums[keep][::-1], runs[side][keep][::-1]
+            # b within epsilon of the upper boundary quota - a or the lower boundary quota - w - a is ambiguous
+            upper_boundary = float_quota - without
+            lower_boundary = float_quota - float_weights[player] - without
+            lower_start = np.searchsorted(other_sums, lower_boundary - epsilon, 'left')
+            lower_end = np.searchsorted(other_sums, lower_boundary + epsilon, 'right')
+            upper_start = np.searchsorted(other_sums, upper_boundary - epsilon, 'left')
+            upper_end = np.searchsorted(other_sums, upper_boundary + epsilon, 'right')
+            certain = np.maximum(upper_start - lower_end, 0)
+            swings[player] = int(certain.sum())
+
+            # the ambiguous ranges: [lower_start, lower_end) and [upper_start, upper_end), or their hull if they overlap;
+            # they only depend on the float sum a and consist of whole runs of the other half
+            overlap = lower_end >= upper_start
+            ranges = [(lower_start, np.where(overlap, upper_end, lower_end)),
+                      (np.where(overlap, upper_end, upper_start), upper_end)]
+            ambiguous = np.flatnonzero((ranges[0][1] > ranges[0][0]) | (ranges[1][1] > ranges[1][0]))
+            _, first = np.unique(without_runs[ambiguous], return_index = True)
+            for index in ambiguous[first]:
+                own_counts = collections.Counter(value for mask, value in run_members(side, int(without_runs[index])) if not mask >> bit & 1)
+                for starts, ends in ranges:
+                    if ends[index] <= starts[index]: continue
+                    for run in range(runs[1 - side][starts[index]], runs[1 - side][ends[index] - 1] + 1):
+                        for b, other_count in run_counts(1 - side, run).items():
+                            for a, own_count in own_counts.items():
+                                if is_swing(a + b, exact_weights[player]): swings[player] += own_count * other_count
+    return swings
+
+def banzhaf_swings_mitm(population, quota, strict = None):
+    ''' Number of swing coalitions of every player, computed exactly.'''
+    strict = get_strict(strict)
+    integer = _integer_weights(population, quota)
+    if integer is not None: return _integer_swings(*integer, strict)
+    return _float_swings(population, quota, strict)
+
+def banzhaf_mitm(population, quota, normalize = True, exact = None, strict = None):
+    exact = get_exact(exact)
+    return banzhaf_from_swings(banzhaf_swings_mitm(population, quota, strict), normalize, exact)
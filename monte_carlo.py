@@ -0,0 +1,158 @@
+from collections import namedtuple
+import numpy as np
+from scipy.stats import binom, norm
+from config import get_strict
+
+# Default number of (sample, player) pairs per batch
+BATCH_ELEMENTS = 1_000_000
+
+Estimate = namedtuple('Estimate', ['values', 'lower', 'upper', 'samples'])
+Estimate.__doc__ = ''' Monte Carlo estimate of a power index: point estimates with a confidence interval [lower, upper] per player,
+and the number of sampled coalitions or permutations they are based on.'''
+
+def _swings(others, weights, quota, strict):
+    ''' Whether adding a player of the given weight to a coalition of the given (others') weight makes it winning.'''
+    if strict: return (others <= quota) & (others + weights > quota)
+    return (others < quota) & (others + weights >= quota)
+
+
+class _SwingAccumulator:
+    ''' Running sums of swing indicators per stratum (coalition size) and player, enough for the mean of every
+    stratum and for the delta method variance of the normalized index.'''
+
+    def __init__(self, strata, n):
+        self.samples = np.zeros(strata)
+        self.counts = np.zeros((strata, n))
+        self.cross = np.zeros((strata, n))
+        self.squares = np.zeros(strata)
+
+    def add(self, stratum, swings):
+        totals = swings.sum(axis = 1)
+        self.samples[stratum] += len(swings)
+        self.counts[stratum] += swings.sum(axis = 0)
+        self.cross[stratum] += totals @ swings
+        self.squares[stratum] += totals @ totals
+
+    def estimate(self, strata_weights, normalize, z):
+        ''' Point estimates and half-widths of the confidence intervals.'''
+        used = self.samples > 0
+        d, m = strata_weights[used], self.samples[used][:, None]
+        counts, cross, squares = self.counts[used], self.cross[used], self.squares[used][:, None]
+        values = d @ (counts / m)
+        # Agresti-Coull intervals per stratum, so strata without any swing yet do not look certain
+        adjusted = (counts + z**2/2) / (m + z**2)
+        half_widths = z * np.sqrt((d**2) @ (adjusted * (1 - adjusted) / (m + z**2)))
+        total = values.sum()
+        if not normalize or total == 0: return values, half_widths
+
+        # Delta method for values / total with y = swing_i - ratio_i * (number of swings in the sample)
+        ratios = values / total
+        sums = counts.sum(axis = 1, keepdims = True)
+        mean_y = (counts - ratios * sums) / m
+        variance_y = np.maximum((counts - 2 * ratios * cross + ratios**2 * squares) / m - mean_y**2, 0)
+        half_widths = z * np.sqrt((d**2) @ (variance_y / m)) / total
+        return ratios, half_widths
+
+
+def _estimate(sample_batch, strata_weights, n, normalize, precision, confidence, batch_size, max_samples, seed):
+    ''' Samples batches until every confidence interval is at most precision wide on each side (or max_samples is reached).
+    sample_batch(rng, accumulator, samples) adds about samples new samples to the accumulator.
+    By default batches hold BATCH_ELEMENTS (sample, player) pairs, so the arrays of a batch stay small.'''
+    rng = np.random.default_rng(seed)
+    if batch_size is None: batch_size = max(100, BATCH_ELEMENTS // n)
+    strata_weights = np.asarray(strata_weights, dtype = float)
+    accumulator = _SwingAccumulator(len(strata_weights), n)
+    z = norm.ppf(1 - (1 - confidence) / 2)
+    while True:
+        sample_batch(rng, accumulator, min(batch_size, max_samples - int(accumulator.samples.sum())))
+        values, half_widths = accumulator.estimate(strata_weights, normalize, z)
+        if half_widths.max() <= precision or accumulator.samples.sum() >= max_samples: break
+    lower = np.clip(values - half_widths, 0, None)
+    return Estimate(list(values), list(lower), list(values + half_widths), int(accumulator.samples.sum()))
+
+
+def banzhaf_mc(population, quota, normalize = True, precision = 1e-3, confidence = 0.95, batch_size = None, max_samples = 10**7,
+               strict = None, seed = None):
+    ''' Banzhaf index from uniformly random coalitions. Every sampled coalition is used for all players at once:
+    without player i it is a uniformly random coalition of the others.'''
+    strict = get_strict(strict)
+    weights = np.asarray(population, dtype = float)
+    n = len(weights)
+
+    def sample_batch(rng, accumulator, samples):
+        members = rng.random((samples, n)) < 0.5
+        others = (members @ weights)[:, None] - members * weights
+        accumulator.add(0, _swings(others, weights, quota, strict))
+
+    return _estimate(sample_batch, [1], n, normalize, precision, confidence, batch_size, max_samples, seed)
+
+def _random_orders(rng, samples, n):
+    return rng.permuted(np.tile(np.arange(n), (samples, 1)), axis = 1)
+
+def semivalue_mc(population, quota, distribution, normalize = True, precision = 1e-3, confidence = 0.95, batch_size = None,
+                 max_samples = 10**7, strict = None, seed = None):
+    ''' Semivalue (as helpers.semivalue) stratified by coalition size: per size k the swing probability over random
+    size-k coalitions of the others is estimated and weighted with distribution[k]. Samples are allocated to the sizes
+    in proportion to distribution. A random order of all players gives a random size-k coalition of the others of every
+    player: the first k players of the order without that player.'''
+    strict = get_strict(strict)
+    weights = np.asarray(population, dtype = float)
+    n = len(weights)
+    strata_weights = np.array([float(ele) for ele in distribution])
+    allocation = strata_weights / strata_weights.sum()
+
+    def sample_batch(rng, accumulator, samples):
+        for k in np.flatnonzero(allocation):
+            size = max(1, int(round(samples * allocation[k])))
+            orders = _random_orders(rng, size, n)
+            prefix = np.concatenate([np.zeros((size, 1)), np.cumsum(weights[orders], axis = 1)], axis = 1)
+            positions = np.argsort(orders, axis = 1)
+            others = np.where(positions >= k, prefix[:, [k]], prefix[:, [min(k+1, n)]] - weights)
+            accumulator.add(k, _swings(others, weights, quota, strict))
+
+    return _estimate(sample_batch, strata_weights, n, normalize, precision, confidence, batch_size, max_samples, seed)
+
+def shapley_mc(population, quota, precision = 1e-3, confidence = 0.95, batch_size = None, max_samples = 10**7, stratified = False,
+               strict = None, seed = None):
+    ''' Shapley value from random orders of the players (a player's predecessors are a random coalition of the others),
+    or, if stratified, as the semivalue with the uniform distribution over coalition sizes.'''
+    n = len(population)
+    if stratified:
+        return semivalue_mc(population, quota, [1/n]*n, False, precision, confidence, batch_size, max_samples, strict, seed)
+    strict = get_strict(strict)
+    weights = np.asarray(population, dtype = float)
+
+    def sample_batch(rng, accumulator, samples):
+        orders = _random_orders(rng, samples, n)
+        ordered_weights = weights[orders]
+        predecessors = np.cumsum(ordered_weights, axis = 1) - ordered_weights
+        swings = np.zeros((samples, n))
+        np.put_along_axis(swings, orders, _swings(predecessors, ordered_weights, quota, strict), axis = 1)
+        accumulator.add(0, swings)
+
+    return _estimate(sample_batch, [1], n, False, precision, confidence, batch_size, max_samples, seed)
+
+def generalized_banzhaf_mc(population, quota, decisivness, normalize = True, precision = 1e-3, confidence = 0.95, batch_size = None,
+                           max_samples = 10**7, strict = None, seed = None):
+    n = len(population)
+    distribution = binom.pmf(np.arange(n), n-1, float(decisivness))
+    return semivalue_mc(population, quota, distribution, normalize, precision, confidence, batch_size, max_samples, strict, seed)
+
+if __name__ == "__main__":
+    from fractions import Fraction
+    from helpers import banzhaf, shapley
+    print("Running tests:")
+    # seeded estimates against the brute force indices, strict and not
+    for population, quota in (([4, 3, 2, 1], 6), ([0.41, 0.29, 0.17, 0.08, 0.05], 0.5), ([5, 5, 3, 3, 3, 1], Fraction(19, 2))):
+        for strict in (False, True):
+            exact_banzhaf = [float(ele) for ele in banzhaf(population, quota, True, True, strict)]
+            exact_shapley = [float(ele) for ele in shapley(population, quota, True, strict)]
+            estimates = [(banzhaf_mc(population, quota, precision = 5e-3, batch_size = 10000, strict = strict, seed = 0), exact_banzhaf),
+                         (generalized_banzhaf_mc(population, quota, 0.5, precision = 5e-3, batch_size = 10000, strict = strict, seed = 0), exact_banzhaf),
+                         (shapley_mc(population, quota, precision = 5e-3, batch_size = 10000, strict = strict, seed = 0), exact_shapley),
+                         (shapley_mc(population, quota, precision = 5e-3, batch_size = 10000, stratified = True, strict = strict, seed = 0), exact_shapley)]
+            for estimate, exact in estimates:
+                assert all(abs(value - ele) <= 1e-2 for value, ele in zip(estimate.values, exact))
+                assert all(lower <= value <= upper for lower, value, upper in zip(estimate.lower, estimate.values, estimate.upper))
+    assert banzhaf_mc([4, 3, 2, 1], 6, precision = 5e-3, seed = 1) == banzhaf_mc([4, 3, 2, 1], 6, precision = 5e-3, seed = 1)
+    print("Monte Carlo Success")
@@ -0,0 +1,86 @@
+import bisect
+from fractions import Fraction
+import numpy as np
+from config import get_strict
+from counting import (as_integer_weights, coalition_weight_counts, cumulative_at, integer_threshold, remove_weight,
+                      banzhaf_from_swings, shapley_from_swings, semivalue_from_swings)
+from integer_weights import integer_game
+
+def _decimal(value):
+    ''' Floats are read as the decimal they print as (0.2 is 1/5), otherwise their binary expansion would scale to ~2^54.'''
+    return Fraction(str(value)) if isinstance(value, float) else value
+
+def threshold_swings(population, by_size = False):
+    ''' Swing counts for every integer threshold t = 0..W+1 (a coalition wins iff its weight is >= t):
+    swings[t][i] for player i, or swings[t][i][k] per coalition size k if by_size. Needs integer weights.
+    Builds the counting table once and removes each player from it once.'''
+    weights = as_integer_weights(population)
+    n = len(weights)
+    counts = coalition_weight_counts(weights, by_size)
+    thresholds = np.arange(counts.shape[-1] + 1)
+    swings = np.zeros((len(thresholds), n, n) if by_size else (len(thresholds), n), dtype = counts.dtype)
+    for player, weight in enumerate(weights):
+        if weight == 0: continue
+        without = counts.copy()
+        remove_weight(without, weight)
+        cumulative = np.cumsum(without, axis = -1)
+        window = cumulative_at(cumulative, thresholds - 1) - cumulative_at(cumulative, thresholds - 1 - weight)
+        if by_size: swings[:, player, :] = window[:n].T
+        else: swings[:, player] = window
+    return swings
+
+
+class QuotaProfile:
+    ''' A power index as a piecewise-constant function of the (absolute) quota.
+
+    The index only changes when the integer threshold crosses a coalition weight, so it is stored as
+    one index vector per piece: pieces[j] holds for all thresholds in [starts[j], starts[j+1]).
+    Thresholds at which no player is ever a swing player (everyone or no one wins) get the all-zero vector.
+    Rational weights are scaled to integers (integer_weights.integer_game), so quotas are multiplied by scale,
+    and total is the total of the scaled weights.
+    '''
+
+    def __init__(self, starts, pieces, total, strict = None, scale = 1):
+        strict = get_strict(strict)
+        self.starts = starts
+        self.pieces = pieces
+        self.total = total
+        self.strict = strict
+        self.scale = scale
+
+    def __call__(self, quota, relative = False):
+        ''' Index at the given quota, or at the given fraction of the total weight if relative.'''
+        quota = _decimal(quota) * (self.total if relative else self.scale)
+        threshold = integer_threshold(quota, self.strict)
+        return self.pieces[max(bisect.bisect_right(self.starts, threshold) - 1, 0)]
+
+    def evaluate(self, quotas, relative = False):
+        return [self(quota, relative) for quota in quotas]
+
+    def breakpoints(self):
+        ''' Quotas at which the index changes. With strict quotas a piece starting at threshold t
+        begins at quota t - 1 (inclusive), otherwise it begins just after quota t - 1.'''
+        if self.scale == 1: return [start - 1 for start in self.starts[1:]]
+        return [Fraction(start - 1) / self.scale for start in self.starts[1:]]
+
+
+def _profile(population, by_size, index, strict):
+    weights, scale = integer_game([_decimal(ele) for ele in population], 1)
+    swings = threshold_swings(weights, by_size)
+    flat = swings.reshape(len(swings), -1)
+    starts = [0] + [t for t in range(1, len(flat)) if (flat[t] != flat[t-1]).any()]
+    pieces = []
+    for start in starts:
+        rows = [[int(ele) for ele in row] for row in swings[start]] if by_size else [int(ele) for ele in swings[start]]
+        if not flat[start].any(): pieces.append([0]*len(population))
+        else: pieces.append(index(rows))
+    return QuotaProfile(starts, pieces, sum(weights), strict, scale)
+
+def banzhaf_profile(population, normalize = True, exact = None, strict = None):
+    return _profile(population, False, lambda swings: banzhaf_from_swings(swings, normalize, exact), strict)
+
+def shapley_profile(population, exact = None, strict = None):
+    return _profile(population, True, lambda swings: shapley_from_swings(swings, exact), strict)
+
+def semivalue_profile(population, distribution, normalize = True, exact = None, strict = None):
+    return _profile(population, True, lambda swings: semivalue_from_swings(swings, distribution, normalize, exact), strict)
@@ -8,28 +8,216 @@ Author: AI Assistant
 Date: 2024
 """
 
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-import sympy as sp
-from scipy.optimize import root
+from scipy.optimize import root, OptimizeResult
+from scipy.special import expit
 from helpers import make_distribution
+from counting import CountingTable, SCALED_RESYNC_UPDATES, banzhaf_dp, semivalue_from_swings, shapley_from_swings, swings_by_size
 
-def get_saddle_point(weights, q, guess=1.0):
-    """Find the saddle point for the limit Banzhaf computation."""
-    weights = make_distribution(weights, False)
-    x = sp.symbols('x', positive=True)
-    expr = sum(w * x**w / (1 + x**w) for w in weights) - q * sum(weights)
-    try:
-        return float(sp.nsolve(expr, guess))
-    except:
-        return guess
+# Players whose power derivative is below this fraction of the largest one are treated as saturated in Newton steps
+SATURATION = 1e-8
 
-def get_limit_banzhaf_powers(weights, q):
-    """Compute limit Banzhaf powers for given weights and quota."""
-    s = get_saddle_point(weights, q)
-    print(s)
-    return make_distribution([(1-s**w)/(1+s**w) for w in weights], False)
+def _normalized_weights(weights):
+    weights = np.atleast_2d(np.asarray(weights, dtype=float))
+    totals = weights.sum(axis=1, keepdims=True)
+    if np.any(weights < 0) or np.any(totals <= 0):
+        raise ValueError("Weights need to be non-negative with a positive total")
+    return weights / totals
 
-def solve_reverse_limit_banzhaf(target, quota=3/4, tolerance=1e-8, verbose=False):
+def _saddle_equation(u, weights, q):
+    """Value and derivative in u = log(x) of sum_j w_j x^w_j / (1 + x^w_j) - q for normalized weights."""
+    sigma = expit(weights * u[:, None])
+    value = (weights * sigma).sum(axis=1) - q
+    derivative = (weights**2 * sigma * (1 - sigma)).sum(axis=1)
+    return value, derivative
+
+def _solve_saddle_log(weights, q, guess=1.0, tolerance=1e-14, max_iterations=200, trace=None):
+    """
+    Solve the saddle point equation in u = log(x) for every row of normalized weights.
+
+    The left hand side increases monotonically from 0 to 1 in u, so the root is bracketed first
+    and then found with Newton steps, falling back to bisection whenever a step leaves the bracket.
+    If given, trace is called once per solve with a dict of the diagnostics 'iterations',
+    'saddle_point' and 'residual' (the value of the saddle point equation, per row).
+    """
+    m = weights.shape[0]
+    q = np.broadcast_to(np.asarray(q, dtype=float), (m,)).copy()
+    if np.any(q <= 0) or np.any(q >= 1):
+        raise ValueError(f"The saddle point only exists for quotas strictly between 0 and 1, got {q}")
+
+    lower = np.full(m, -1.0)
+    upper = np.full(m, 1.0)
+    for _ in range(2000):
+        too_high = _saddle_equation(lower, weights, q)[0] > 0
+        too_low = _saddle_equation(upper, weights, q)[0] < 0
+        if not (too_high.any() or too_low.any()):
+            break
+        lower[too_high] *= 2
+        upper[too_low] *= 2
+    else:
+        raise RuntimeError("Could not bracket the saddle point")
+
+    u = np.clip(np.full(m, np.log(guess)), lower, upper)
+    converged = np.zeros(m, dtype=bool)
+    for iteration in range(max_iterations):
+        value, derivative = _saddle_equation(u, weights, q)
+        lower = np.where(value < 0, u, lower)
+        upper = np.where(value > 0, u, upper)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = u - value / derivative
+        bisection = (lower + upper) / 2
+        step = np.where((newton > lower) & (newton < upper), newton, bisection)
+        converged |= (value == 0) | (np.abs(step - u) <= tolerance * (1 + np.abs(u))) | (upper - lower <= tolerance * (1 + np.abs(u)))
+        u = np.where(converged | (value == 0), u, step)
+        if converged.all():
+            if trace is not None:
+                trace({'iterations': iteration + 1, 'saddle_point': np.exp(u), 'residual': _saddle_equation(u, weights, q)[0]})
+            return u
+    raise RuntimeError(f"Saddle point did not converge in {max_iterations} iterations")
+
+def get_saddle_point(weights, q, guess=1.0, trace=None):
+    """
+    Find the saddle point x > 0 of sum_j w_j x^w_j / (1 + x^w_j) = q for the normalized weights.
+
+    weights may be one weight vector or a 2D array with one weight vector per row (zero padding is allowed),
+    q a scalar or one quota per row. Raises ValueError for quotas outside (0, 1) instead of returning the guess.
+    trace is an optional diagnostics hook, see _solve_saddle_log.
+    """
+    u = _solve_saddle_log(_normalized_weights(weights), q, guess, trace=trace)
+    if np.ndim(weights) == 1: return float(np.exp(u[0]))
+    return np.exp(u)
+
+def _limit_banzhaf_from_log(weights, u):
+    # (1 - s^w) / (1 + s^w) = -tanh(w log(s) / 2); at u = 0 (q = 1/2) the normalized limit is w itself
+    powers = -np.tanh(weights * u[:, None] / 2)
+    totals = powers.sum(axis=1, keepdims=True)
+    flat = (u == 0)[:, None]
+    return np.where(flat, weights, powers / np.where(flat, 1, totals))
+
+def get_limit_banzhaf_powers(weights, q, trace=None):
+    """
+    Compute limit Banzhaf powers for given weights and quota (row-wise for a 2D array of weights).
+
+    This is purely numeric and quiet; pass a trace callable to receive the saddle point diagnostics
+    (iteration count, saddle point, residual) of every evaluation, e.g. trace=print.
+    """
+    normalized = _normalized_weights(weights)
+    u = _solve_saddle_log(normalized, q, trace=trace)
+    powers = _limit_banzhaf_from_log(normalized, u)
+    if np.ndim(weights) == 1: return powers[0].tolist()
+    return powers
+
+def _limit_banzhaf_derivatives(weights, q):
+    """
+    Pieces of the derivative of the limit Banzhaf powers of one weight vector, by implicit differentiation
+    of the saddle point equation F(u, w) = sum_j w_j sigma(w_j u) - q sum_j w_j = 0 in u = log(x).
+
+    With p_j = -tanh(w_j u / 2) the unnormalized powers, dp/dw = diag(a u) + outer(a w, du).
+    """
+    weights = np.asarray(weights, dtype=float)
+    normalized = _normalized_weights(weights)
+    u = _solve_saddle_log(normalized, q)
+    w, u = normalized[0], u[0]
+    sigma = expit(w * u)
+    # sigma (1 - sigma) without the cancellation in 1 - sigma, which is 0 in floats once w u is above about 37
+    slope = sigma * expit(-w * u)
+    du = -(sigma + w * u * slope - q) / (w**2 * slope).sum()
+    p = -np.tanh(w * u / 2)
+    # dp / d(w u) = -(1 - tanh^2(w u / 2)) / 2 = -2 sigma (1 - sigma); 1 - p^2 cancels as well
+    a = -2 * slope
+    return weights.sum(), w, u, p, a, du
+
+def get_limit_banzhaf_jacobian(weights, q):
+    """
+    Jacobian J[j, k] = d powers_j / d weights_k of get_limit_banzhaf_powers for one weight vector.
+
+    Costs one saddle point solve instead of the n + 1 evaluations of a finite difference Jacobian.
+    """
+    total, w, u, p, a, du = _limit_banzhaf_derivatives(weights, q)
+    n = len(w)
+
+    # d normalized / d weights
+    normalize_jacobian = (np.eye(n) - np.outer(w, np.ones(n))) / total
+    if u == 0:
+        return normalize_jacobian
+
+    dp = np.diag(a * u) + np.outer(a * w, du)
+    powers = p / p.sum()
+    dpowers = (dp - np.outer(powers, dp.sum(axis=0))) / p.sum()
+    return dpowers @ normalize_jacobian
+
+def get_limit_banzhaf_newton_step(weights, q, residual):
+    """
+    Weight change dx with J dx = -residual for the Jacobian J of get_limit_banzhaf_powers, in O(n).
+
+    The residual has to sum to zero (powers minus a normalized target). dp/dw = a * (u I + outer(w, du))
+    is singular along w (the powers are scale invariant), so dp/dw dw = z is solvable iff du . (z / a) = 0,
+    with solutions z / (a u) + beta w. Normalizing the powers lets z = -p.sum() * residual + c * powers
+    for any c, which fixes c; beta is fixed by requiring that dx sums to zero.
+    Players far into saturation (w u >> 1) have powers that no longer depend on their weight in floats (z / a would
+    only amplify rounding errors). Their unnormalized powers are constant, so their residual fixes c = d p.sum(), and
+    their weights, which are free, take up the condition du . dw = du . (z / a) / u + beta du . w instead.
+    Returns None where the structured step does not exist (at quota 1/2 or degenerate weights).
+    """
+    total, w, u, p, a, du = _limit_banzhaf_derivatives(weights, q)
+    sensitive = np.abs(a) > SATURATION * np.abs(a).max()
+    if u == 0 or not sensitive.any():
+        return None
+    residual = np.asarray(residual)
+    powers = p / p.sum()
+    scale = np.where(sensitive, a, 1)
+    residual_scaled = np.where(sensitive, -p.sum() * residual / scale, 0)
+    powers_scaled = np.where(sensitive, powers / scale, 0)
+    if sensitive.all():
+        c = -(du @ residual_scaled) / (du @ powers_scaled)
+        y = (residual_scaled + c * powers_scaled) / u
+    else:
+        saturated = ~sensitive
+        c = p.sum() * residual[saturated].sum() / powers[saturated].sum()
+        y = (residual_scaled + c * powers_scaled) / u
+        y[saturated] = -du[saturated] * (du @ y) / (du[saturated] @ du[saturated])
+    step = total * (y - y.sum() * w)
+    if not np.all(np.isfinite(step)):
+        return None
+    return step
+
+def _gauss_newton(residual_func, jacobian_func, x0, tol, max_iterations=50, step_func=None):
+    """
+    Damped Gauss-Newton with least squares steps, which copes with the singular (scale invariant) Jacobian.
+    Steps are shortened to change no weight by more than itself (or the average weight) before the line search.
+    step_func(x, residual) may supply the step directly, returning None to fall back to least squares.
+    """
+    x = np.asarray(x0, dtype=float)
+    residual = residual_func(x)
+    norm = np.linalg.norm(residual)
+    for iteration in range(max_iterations):
+        if norm <= tol:
+            break
+        step = step_func(x, residual) if step_func else None
+        if step is None:
+            step = np.linalg.lstsq(jacobian_func(x), -residual, rcond=None)[0]
+        # the linearization only holds for moderate relative changes: a full step can push players far into
+        # saturation (w u >> 1), where the powers hardly move and the following steps are huge, so no weight
+        # moves by more than itself (or the average weight) per iteration
+        start = 1.0 / max(1.0, (np.abs(step) / np.maximum(np.abs(x), np.abs(x).sum() / len(x))).max())
+        t = start
+        while t > 1e-6 * start:
+            candidate = x + t * step
+            candidate_residual = residual_func(candidate)
+            candidate_norm = np.linalg.norm(candidate_residual)
+            if candidate_norm < norm:
+                break
+            t /= 2
+        else:
+            break
+        x = np.abs(candidate) / np.abs(candidate).sum()
+        residual, norm = residual_func(x), candidate_norm
+    return OptimizeResult(x=x, success=norm <= tol, nit=iteration)
+
+def solve_reverse_limit_banzhaf(target, quota=3/4, tolerance=1e-8, verbose=False, initial_guess=None, trace=None):
     """
     Find weights x such that limit_banzhaf_powers(x, quota) ≈ target.
     
@@ -38,6 +226,8 @@ def solve_reverse_limit_banzhaf(target, quota=3/4, tolerance=1e-8, verbose=False
     - quota: Voting quota (default 3/4)
     - tolerance: Convergence tolerance
     - verbose: Whether to print progress information
+    - initial_guess: Starting weights (default: the target itself)
+    - trace: Optional callable receiving the saddle point diagnostics of every evaluation
     
     Returns:
     - weights: The weight vector that produces the target powers in the limit (None if failed)
@@ -59,7 +249,7 @@ def solve_reverse_limit_banzhaf(target, quota=3/4, tolerance=1e-8, verbose=False
         print(f"Using quota: {quota}")
     
     # Define the function we want to find the preimage of
-    f = lambda x: get_limit_banzhaf_powers(x, quota)
+    f = lambda x: get_limit_banzhaf_powers(x, quota, trace)
     
     # Define residual function for root finding
     def residual_func(x):
@@ -71,12 +261,22 @@ def solve_reverse_limit_banzhaf(target, quota=3/4, tolerance=1e-8, verbose=False
             return fx_array - target_array
         except Exception:
             return np.full(len(target_normalized), 1e6)
+
+    def jacobian_func(x):
+        signs = np.where(np.asarray(x) < 0, -1.0, 1.0)
+        return get_limit_banzhaf_jacobian(np.abs(x), quota) * signs
+
+    def newton_step_func(x, residual):
+        signs = np.where(np.asarray(x) < 0, -1.0, 1.0)
+        step = get_limit_banzhaf_newton_step(np.abs(x), quota, residual)
+        return None if step is None else step * signs
     
     # Use target as initial guess (with small positive offset)
-    initial_guess = np.array(target_normalized) + 1e-6
+    if initial_guess is None:
+        initial_guess = np.array(target_normalized) + 1e-6
     
     # Try different numerical methods
-    methods = ['lm', 'hybr', 'broyden1']
+    methods = ['newton', 'lm', 'hybr', 'broyden1']
     
     best_solution = None
     best_residual = float('inf')
@@ -86,7 +286,11 @@ def solve_reverse_limit_banzhaf(target, quota=3/4, tolerance=1e-8, verbose=False
             print(f"  Trying method: {method}")
         
         try:
-            sol = root(residual_func, initial_guess, method=method, tol=tolerance)
+            if method == 'newton':
+                sol = _gauss_newton(residual_func, jacobian_func, initial_guess, tolerance, step_func=newton_step_func)
+            else:
+                jac = jacobian_func if method in ('lm', 'hybr') else None
+                sol = root(residual_func, initial_guess, method=method, jac=jac, tol=tolerance)
             
             if sol.success:
                 x_solution = np.abs(sol.x)
@@ -176,6 +380,295 @@ def solve_multiple_targets(targets_list, quota=3/4, tolerance=1e-8, verbose=True
     
     return results
 
+class _IndexEvaluator:
+    """
+    Forward map from integer weights to a normalized power index, evaluated on a scaled CountingTable
+    (by coalition size for Shapley and semivalues). Weight changes of at most SCALED_RESYNC_UPDATES players
+    update the table incrementally, and batches of single-player changes share the removal of that player.
+    """
+
+    def __init__(self, index, quota, distribution, strict):
+        self.index = index
+        self.quota = quota
+        self.distribution = distribution
+        self.strict = strict
+        self.table = None
+
+    def _powers(self, table):
+        table.set_quota(self.quota * table.total)
+        if self.index == 'banzhaf':
+            powers = np.array(table.banzhaf(False))
+        elif self.index == 'shapley':
+            powers = np.array(table.shapley())
+        else:
+            powers = np.array(table.semivalue(self.distribution, False))
+        total = powers.sum()
+        return powers / total if total > 0 else powers
+
+    def set_weights(self, weights):
+        if self.table is not None:
+            changed = [i for i, (old, new) in enumerate(zip(self.table.weights, weights)) if old != new]
+        # updates of the float table accumulate rounding errors, so it is rebuilt whenever many players change
+        if self.table is None or len(changed) > SCALED_RESYNC_UPDATES:
+            self.table = CountingTable(weights, 0, self.index != 'banzhaf', self.strict, scaled=True)
+        else:
+            for i in changed:
+                self.table.set_weight(i, weights[i])
+        return self._powers(self.table)
+
+    def batch(self, moves):
+        """Powers for each (player, weight) move applied to the current weights, one row per move."""
+        results = np.zeros((len(moves), self.table.n))
+        players = {}
+        for row, (player, weight) in enumerate(moves):
+            players.setdefault(player, []).append((row, weight))
+        for player, rows in players.items():
+            without = self.table.copy()
+            without.remove_player(player)
+            for row, weight in rows:
+                table = without.copy()
+                table.add_player(weight)
+                powers = self._powers(table)
+                results[row] = np.insert(powers[:-1], player, powers[-1])
+        return results
+
+def _index_distribution(index, n, distribution, decisiveness):
+    if index == 'generalized_banzhaf':
+        if decisiveness is None:
+            raise ValueError("The generalized Banzhaf index needs a decisiveness")
+        return [math.comb(n-1, i) * decisiveness**i * (1-decisiveness)**(n-1-i) for i in range(n)]
+    if index == 'semivalue':
+        if distribution is None or len(distribution) != n:
+            raise ValueError("A semivalue needs a distribution over the n coalition sizes 0..n-1")
+        return distribution
+    if index in ('banzhaf', 'shapley'):
+        return None
+    raise ValueError(f"Unknown index {index}, expected banzhaf, shapley, generalized_banzhaf or semivalue")
+
+def solve_reverse_index(target, index='banzhaf', quota=3/4, distribution=None, decisiveness=None, total_weight=None, p=2,
+                        max_iterations=200, newton_iterations=10, refine_passes=20, refine_players=20, tolerance=None,
+                        strict=None, verbose=False):
+    """
+    Find integer weights whose exact (finite n) normalized power index at the given quota is closest to target.
+
+    The index is 'banzhaf', 'shapley', 'generalized_banzhaf' (with the given decisiveness) or 'semivalue'
+    (with a distribution over coalition sizes), as in helpers; all are normalized to sum to one.
+    The quota is a fraction of the total weight, as in banzhaf_fast. The forward map is evaluated with
+    a scaled CountingTable that is updated incrementally whenever only a few weights change.
+
+    The solver runs three phases on integer weights:
+    1. the fixed point iteration weights <- weights + (target - powers) * total_weight on real weights,
+       rounded for every evaluation, until the integer weights cycle or stop improving;
+    2. Gauss-Newton steps with a finite difference Jacobian, whose n columns come from one batch of
+       single-player weight increases;
+    3. +1/-1 changes of single players (the refine_players with the largest errors in each pass),
+       while that improves the error.
+
+    Parameters:
+    - target: Target power distribution (will be normalized)
+    - index: Which power index to invert
+    - quota: Quota as a fraction of the total weight (default 3/4)
+    - distribution: Distribution over coalition sizes for 'semivalue'
+    - decisiveness: Decisiveness for 'generalized_banzhaf'
+    - total_weight: Scale of the integer weights (default 100 per player); larger is finer but slower
+    - p: Norm of the error that is minimized (1 or 2)
+    - max_iterations: Maximum number of fixed point iterations
+    - newton_iterations: Maximum number of finite difference Gauss-Newton steps
+    - refine_passes: Maximum number of passes of the +1/-1 refinement
+    - refine_players: Number of players tried per refinement pass
+    - tolerance: Error below which the solve counts as successful; by default n^(1/p) / total_weight, the error
+      of changing every weight by one unit, since integer weights cannot hit an arbitrary target exactly
+    - verbose: Whether to print progress information
+
+    Returns:
+    - weights: The best integer weights found
+    - residual: Their error ||index(weights) - target||_p
+    - success: Whether the error is within tolerance
+    """
+    target = np.array(make_distribution(target, exact=False), dtype=float)
+    n = len(target)
+    distribution = _index_distribution(index, n, distribution, decisiveness)
+    if total_weight is None:
+        total_weight = 100 * n
+    if tolerance is None:
+        tolerance = n ** (1 / p) / total_weight
+    evaluator = _IndexEvaluator(index, quota, distribution, strict)
+
+    def error(powers):
+        return np.linalg.norm(powers - target, ord=p)
+
+    real_weights = target * total_weight
+    weights = [max(1, int(round(w))) for w in real_weights]
+    powers = evaluator.set_weights(weights)
+    best_weights, best_error = list(weights), error(powers)
+    seen = {tuple(weights)}
+    last_improvement = 0
+    for iteration in range(max_iterations):
+        if iteration - last_improvement > 10:
+            break
+        real_weights = np.maximum(real_weights + (target - powers) * total_weight, 0)
+        weights = [int(round(w)) for w in real_weights]
+        if tuple(weights) in seen or sum(weights) == 0:
+            break
+        seen.add(tuple(weights))
+        powers = evaluator.set_weights(weights)
+        if error(powers) < best_error:
+            best_weights, best_error, last_improvement = list(weights), error(powers), iteration
+        if verbose:
+            print(f"  Iteration {iteration}: error {error(powers):.3e}")
+
+    powers = evaluator.set_weights(best_weights)
+    delta = max(1, total_weight // (10 * n))
+    for iteration in range(newton_iterations):
+        jacobian = (evaluator.batch([(j, best_weights[j] + delta) for j in range(n)]) - powers).T / delta
+        # the index is scale invariant, so keep the total weight fixed and the step moderate
+        jacobian = np.vstack([jacobian, np.ones(n)])
+        step = np.linalg.lstsq(jacobian, np.append(target - powers, 0), rcond=None)[0]
+        step *= min(1, total_weight / (2 * np.abs(step).sum() + 1e-300))
+        weights = [max(0, int(round(w + s))) for w, s in zip(best_weights, step)]
+        if weights == best_weights or sum(weights) == 0:
+            break
+        candidate_powers = evaluator.set_weights(weights)
+        if error(candidate_powers) >= best_error:
+            powers = evaluator.set_weights(best_weights)
+            break
+        best_weights, best_error, powers = weights, error(candidate_powers), candidate_powers
+        if verbose:
+            print(f"  Newton step {iteration}: error {best_error:.3e}")
+
+    for refine_pass in range(refine_passes):
+        improved = False
+        for player in np.argsort(-np.abs(powers - target))[:refine_players]:
+            moves = [(player, best_weights[player] + change) for change in (1, -1) if best_weights[player] + change >= 0]
+            candidates = evaluator.batch(moves)
+            errors = [error(candidate) for candidate in candidates]
+            best_move = int(np.argmin(errors))
+            if errors[best_move] < best_error:
+                best_weights[player] = moves[best_move][1]
+                best_error, improved = errors[best_move], True
+                powers = evaluator.set_weights(best_weights)
+        if verbose:
+            print(f"  Refinement pass {refine_pass}: error {best_error:.3e}")
+        if not improved or best_error <= tolerance:
+            break
+
+    # the exact index of the best weights, from exact swing counts (counting.modular_swings beyond 62 players)
+    if index == 'banzhaf':
+        powers = np.array(banzhaf_dp(best_weights, quota * sum(best_weights), True, False, strict))
+    else:
+        swings = swings_by_size(best_weights, quota * sum(best_weights), strict)
+        if index == 'shapley': powers = np.array(make_distribution(shapley_from_swings(swings, False), False))
+        else: powers = np.array(semivalue_from_swings(swings, distribution, True, False))
+    best_error = error(powers)
+
+    if verbose:
+        print(f"  Weights: {best_weights}")
+        print(f"  L1 error: {np.abs(powers - target).sum():.3e}, L2 error: {np.linalg.norm(powers - target):.3e}")
+    return best_weights, best_error, best_error <= tolerance
+
+def solve_reverse_exact_banzhaf(target, quota=3/4, total_weight=None, p=2, max_iterations=200, refine_passes=20,
+                                tolerance=None, strict=None, verbose=False):
+    """
+    Find integer weights whose exact (finite n) normalized Banzhaf index at the given quota is closest to target.
+
+    The quota is a fraction of the total weight, so the achieved powers are banzhaf(weights, quota * sum(weights))
+    and banzhaf_fast(weights, quota). See solve_reverse_index for the method and the parameters.
+    """
+    return solve_reverse_index(target, 'banzhaf', quota, total_weight=total_weight, p=p, max_iterations=max_iterations,
+                               refine_passes=refine_passes, tolerance=tolerance, strict=strict, verbose=verbose)
+
+def _warm_start_guess(target, quota, solved_targets, solved_weights):
+    """Initial guess for a target: the target itself, or the weights of the nearest solved target
+    shifted by the difference of the targets, whichever has the smaller residual."""
+    guesses = [target + 1e-6]
+    if solved_targets:
+        distances = np.abs(np.array(solved_targets) - target).sum(axis=1)
+        nearest = int(np.argmin(distances))
+        guesses.append(np.abs(solved_weights[nearest] + (target - solved_targets[nearest])) + 1e-12)
+    residuals = []
+    for guess in guesses:
+        try:
+            residuals.append(np.linalg.norm(np.array(get_limit_banzhaf_powers(guess, quota)) - target))
+        except (ValueError, RuntimeError):
+            residuals.append(np.inf)
+    best = int(np.argmin(residuals))
+    return guesses[best], best > 0
+
+def _solve_chunk(args):
+    """Solve a chunk of (normalized, nearby) targets in order, warm-starting from solved ones."""
+    targets, quota, tolerance, warm_start = args
+    solved_targets, solved_weights = [], []
+    results = []
+    for target in targets:
+        if warm_start:
+            guess, warm = _warm_start_guess(target, quota, solved_targets, solved_weights)
+        else:
+            guess, warm = target + 1e-6, False
+        weights, residual, success = solve_reverse_limit_banzhaf(target, quota, tolerance, initial_guess=guess)
+        if success:
+            weights = weights / weights.sum()
+            solved_targets.append(target)
+            solved_weights.append(weights)
+        results.append((weights, residual, success, warm))
+    return results
+
+def _nearest_neighbour_order(targets):
+    """Greedy ordering of the targets in which consecutive targets are close in L1 distance."""
+    remaining = np.ones(len(targets), dtype=bool)
+    order = [0]
+    remaining[0] = False
+    for _ in range(len(targets) - 1):
+        distances = np.abs(targets - targets[order[-1]]).sum(axis=1)
+        distances[~remaining] = np.inf
+        order.append(int(np.argmin(distances)))
+        remaining[order[-1]] = False
+    return np.array(order)
+
+def solve_reverse_limit_banzhaf_batch(targets, quota=3/4, tolerance=1e-8, workers=None, warm_start=True, chunk_size=None):
+    """
+    Solve the reverse limit Banzhaf problem for many targets with the same number of players.
+
+    Targets are ordered so that neighbours are close, split into contiguous chunks and the chunks are
+    solved in parallel processes. Within a chunk each target starts from the weights of the nearest
+    previously solved target (shifted by the target difference) or from the target itself,
+    whichever has the smaller residual.
+
+    Parameters:
+    - targets: 2D array-like, one target power distribution per row (rows will be normalized)
+    - quota: Voting quota
+    - tolerance: Convergence tolerance
+    - workers: Number of processes (default: all CPUs, 1 solves in this process)
+    - warm_start: Whether to warm-start from previously solved targets
+    - chunk_size: Targets per chunk (default: spread evenly over 4 chunks per worker)
+
+    Returns:
+    - results: Structured array in the order of targets with fields 'weights' (normalized, NaN if failed),
+      'residual', 'success' and 'warm_start' (whether the solve started from a solved neighbour)
+    """
+    targets = np.asarray(targets, dtype=float)
+    if targets.ndim != 2:
+        raise ValueError("targets needs to be a 2D array with one target per row")
+    targets = targets / targets.sum(axis=1, keepdims=True)
+    m, n = targets.shape
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-m // (4 * workers)))
+
+    order = _nearest_neighbour_order(targets) if warm_start and m > 1 else np.arange(m)
+    chunks = [order[i:i + chunk_size] for i in range(0, m, chunk_size)]
+    jobs = [(targets[chunk], quota, tolerance, warm_start) for chunk in chunks]
+    if workers == 1:
+        chunk_results = map(_solve_chunk, jobs)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunk_results = list(executor.map(_solve_chunk, jobs))
+
+    results = np.zeros(m, dtype=[('weights', float, (n,)), ('residual', float), ('success', bool), ('warm_start', bool)])
+    for chunk, chunk_result in zip(chunks, chunk_results):
+        for index, (weights, residual, success, warm) in zip(chunk, chunk_result):
+            results[index] = (weights if success else np.full(n, np.nan), residual, success, warm)
+    return results
+
 if __name__ == "__main__":
     # Quick test
     print("Testing reverse Banzhaf solver...")
@@ -187,4 +680,15 @@ if __name__ == "__main__":
         achieved = get_limit_banzhaf_powers(weights, 3/4)
         print(f"Target:   {make_distribution(target, exact=False)}")
         print(f"Achieved: {[float(x) for x in achieved]}")
-        print(f"Error:    {residual:.2e}") 
\ No newline at end of file
+        print(f"Error:    {residual:.2e}")
+
+    # Large n: Dirichlet targets at quota 3/4 have players far into saturation at the solution,
+    # where the structured Newton step has to stay exact (otherwise the solver falls back to dense methods)
+    target = np.random.default_rng(0).dirichlet([1]*1000)
+    weights, residual, success = solve_reverse_limit_banzhaf(target)
+    assert success and residual < 1e-8
+    start = 0.9 * weights + 0.1 * target
+    step_residual = np.array(get_limit_banzhaf_powers(start, 3/4)) - target
+    step = get_limit_banzhaf_newton_step(start, 3/4, step_residual)
+    assert np.linalg.norm(get_limit_banzhaf_jacobian(start, 3/4) @ step + step_residual) < 1e-10 * np.linalg.norm(step_residual)
+    print("Newton step at n = 1000 success")
@@ -1,269 +1,269 @@
-import sympy as sp
+from fractions import Fraction
 all_wvgs_at_quota = {
 	1: {
-		1/sp.Rational(20): {
+		Fraction(1, 20): {
 			"01": (1.0,),
 		},
-		1/sp.Rational(10): {
+		Fraction(1, 10): {
 			"01": (1.0,),
 		},
-		3/sp.Rational(20): {
+		Fraction(3, 20): {
 			"01": (1.0,),
 		},
-		1/sp.Rational(5): {
+		Fraction(1, 5): {
 			"01": (1.0,),
 		},
-		1/sp.Rational(4): {
+		Fraction(1, 4): {
 			"01": (1.0,),
 		},
-		3/sp.Rational(10): {
+		Fraction(3, 10): {
 			"01": (1.0,),
 		},
-		7/sp.Rational(20): {
+		Fraction(7, 20): {
 			"01": (1.0,),
 		},
-		2/sp.Rational(5): {
+		Fraction(2, 5): {
 			"01": (1.0,),
 		},
-		9/sp.Rational(20): {
+		Fraction(9, 20): {
 			"01": (1.0,),
 		},
-		1/sp.Rational(2): {
+		Fraction(1, 2): {
 			"01": (1.0,),
 		},
-		11/sp.Rational(20): {
+		Fraction(11, 20): {
 			"01": (1.0,),
 		},
-		3/sp.Rational(5): {
+		Fraction(3, 5): {
 			"01": (1.0,),
 		},
-		13/sp.Rational(20): {
+		Fraction(13, 20): {
 			"01": (1.0,),
 		},
-		7/sp.Rational(10): {
+		Fraction(7, 10): {
 			"01": (1.0,),
 		},
-		3/sp.Rational(4): {
+		Fraction(3, 4): {
 			"01": (1.0,),
 		},
-		4/sp.Rational(5): {
+		Fraction(4, 5): {
 			"01": (1.0,),
 		},
-		17/sp.Rational(20): {
+		Fraction(17, 20): {
 			"01": (1.0,),
 		},
-		9/sp.Rational(10): {
+		Fraction(9, 10): {
 			"01": (1.0,),
 		},
-		19/sp.Rational(20): {
+		Fraction(19, 20): {
 			"01": (1.0,),
 		},
-		2/sp.Rational(3): {
+		Fraction(2, 3): {
 			"01": (1.0,),
 		},
 	},
 	2: {
-		1/sp.Rational(20): {
+		Fraction(1, 20): {
 			"0011": (0.0, 1.0),
 			"0111": (0.1, 0.9),
 		},
-		1/sp.Rational(10): {
+		Fraction(1, 10): {
 			"0011": (0.0, 1.0),
 			"0111": (0.2, 0.8),
 		},
-		3/sp.Rational(20): {
+		Fraction(3, 20): {
 			"0011": (0.0, 1.0),
 			"0111": (0.3, 0.7),
 		},
-		1/sp.Rational(5): {
+		Fraction(1, 5): {
 			"0011": (0.0, 1.0),
 			"0111": (0.4, 0.6),
 		},
-		1/sp.Rational(4): {
+		Fraction(1, 4): {
 			"0011": (0.0, 1.0),
 			"0111": (0.5, 0.5),
 		},
-		3/sp.Rational(10): {
+		Fraction(3, 10): {
 			"0011": (0.0, 1.0),
 			"0111": (0.5, 0.5),
 		},
-		7/sp.Rational(20): {
+		Fraction(7, 20): {
 			"0011": (0.0, 1.0),
 			"0111": (0.5, 0.5),
 		},
-		2/sp.Rational(5): {
+		Fraction(2, 5): {
 			"0011": (0.0, 1.0),
 			"0111": (0.5, 0.5),
 		},
-		9/sp.Rational(20): {
+		Fraction(9, 20): {
 			"0011": (0.0, 1.0),
 			"0111": (0.5, 0.5),
 		},
-		1/sp.Rational(2): {
+		Fraction(1, 2): {
 			"0011": (0.0, 1.0),
 		},
-		11/sp.Rational(20): {
+		Fraction(11, 20): {
 			"0011": (0.0, 1.0),
 			"0001": (0.5, 0.5),
 		},
-		3/sp.Rational(5): {
+		Fraction(3, 5): {
 			"0011": (0.0, 1.0),
 			"0001": (0.5, 0.5),
 		},
-		13/sp.Rational(20): {
+		Fraction(13, 20): {
 			"0011": (0.0, 1.0),
 			"0001": (0.5, 0.5),
 		},
-		7/sp.Rational(10): {
+		Fraction(7, 10): {
 			"0011": (0.0, 1.0),
 			"0001": (0.5, 0.5),
 		},
-		3/sp.Rational(4): {
+		Fraction(3, 4): {
 			"0011": (0.0, 1.0),
 			"0001": (0.5, 0.5),
 		},
-		4/sp.Rational(5): {
+		Fraction(4, 5): {
 			"0011": (0.0, 1.0),
 			"0001": (0.4, 0.6),
 		},
-		17/sp.Rational(20): {
+		Fraction(17, 20): {
 			"0011": (0.0, 1.0),
 			"0001": (0.30000000000000004, 0.7),
 		},
-		9/sp.Rational(10): {
+		Fraction(9, 10): {
 			"0011": (0.0, 1.0),
 			"0001": (0.19999999999999996, 0.8),
 		},
-		19/sp.Rational(20): {
+		Fraction(19, 20): {
 			"0011": (0.0, 1.0),
 			"0001": (0.09999999999999998, 0.9),
 		},
-		2/sp.Rational(3): {
+		Fraction(2, 3): {
 			"0011": (0.0, 1.0),
 			"0001": (0.5, 0.5),
 		},
 	},
 	3: {
-		1/sp.Rational(20): {
+		Fraction(1, 20): {
 			"01111111": (0.1, 0.1, 0.8),
 			"00001111": (0.0, 0.0, 1.0),
 			"00011111": (0.03333333333333333, 0.03333333333333334, 0.9333333333333333),
 			"00111111": (0.0, 0.1, 0.9),
 		},
-		1/sp.Rational(10): {
+		Fraction(1, 10): {
 			"01111111": (0.2, 0.2, 0.6000000000000001),
 			"00001111": (0.0, 0.0, 1.0),
 			"00011111": (0.06666666666666667, 0.06666666666666668, 0.8666666666666667),
 			"00111111": (0.0, 0.2, 0.8),
 		},
-		3/sp.Rational(20): {
+		Fraction(3, 20): {
 			"01111111": (0.3, 0.3, 0.3999999999999999),
 			"00001111": (0.0, 0.0, 1.0),
 			"00011111": (0.1, 0.1, 0.8),
 			"00111111": (0.0, 0.3, 0.7),
 		},
-		1/sp.Rational(5): {
+		Fraction(1, 5): {
 			"01111111": (0.3333333333333333, 0.33333333333333337, 0.33333333333333337),
 			"00001111": (0.0, 0.0, 1.0),
 			"00011111": (0.13333333333333333, 0.13333333333333336, 0.7333333333333334),
 			"00111111": (0.0, 0.4, 0.6),
 		},
-		1/sp.Rational(4): {
+		Fraction(1, 4): {
 			"01111111": (0.3333333333333333, 0.33333333333333337, 0.33333333333333337),
 			"00001111": (0.0, 0.0, 1.0),
 			"00011111": (0.16666666666666666, 0.16666666666666669, 0.6666666666666667),
 			"00111111": (0.0, 0.5, 0.5),
 		},
-		3/sp.Rational(10): {
+		Fraction(3, 10): {
 			"01111111": (0.3333333333333333, 0.3333333333333333, 0.3333333333333333),
 			"00001111": (0.0, 0.0, 1.0),
 			"00011111": (0.2, 0.2, 0.6000000000000001),
 			"00111111": (0.0, 0.5, 0.5),
 		},
-		7/sp.Rational(20): {
+		Fraction(7, 20): {
 			"00001111": (0.0, 0.0, 1.0),
 			"00011111": (0.2333333333333333, 0.23333333333333334, 0.5333333333333333),
 			"00010111": (0.3333333333333333, 0.33333333333333337, 0.33333333333333337),
 			"00111111": (0.0, 0.5, 0.5),
 		},
-		2/sp.Rational(5): {
+		Fraction(2, 5): {
 			"00001111": (0.0, 0.0, 1.0),
 			"00011111": (0.2, 0.3, 0.5),
 			"00010111": (0.3333333333333333, 0.3333333333333333, 0.3333333333333333),
 			"00111111": (0.0, 0.5, 0.5),
 		},
-		9/sp.Rational(20): {
+		Fraction(9, 20): {
 			"00001111": (0.0, 0.0, 1.0),
 			"00011111": (0.09999999999999992, 0.4, 0.5),
 			"00010111": (0.33333333333333326, 0.33333333333333337, 0.33333333333333337),
 			"00111111": (0.0, 0.5, 0.5),
 		},
-		1/sp.Rational(2): {
+		Fraction(1, 2): {
 			"00001111": (0.0, 0.0, 1.0),
 			"00010111": (0.3333333333333333, 0.33333333333333337, 0.33333333333333337),
 		},
-		11/sp.Rational(20): {
+		Fraction(11, 20): {
 			"00000111": (0.1, 0.4, 0.5),
 			"00001111": (0.0, 0.0, 1.0),
 			"00000011": (0.0, 0.5, 0.5),
 			"00010111": (0.3333333333333333, 0.33333333333333337, 0.33333333333333337),
 		},
-		3/sp.Rational(5): {
+		Fraction(3, 5): {
 			"00000111": (0.2, 0.3, 0.5),
 			"00001111": (0.0, 0.0, 1.0),
 			"00000011": (0.0, 0.5, 0.5),
 			"00010111": (0.3333333333333333, 0.33333333333333337, 0.33333333333333337),
 		},
-		13/sp.Rational(20): {
+		Fraction(13, 20): {
 			"00000111": (0.23333333333333334, 0.23333333333333334, 0.5333333333333333),
 			"00001111": (0.0, 0.0, 1.0),
 			"00000011": (0.0, 0.5, 0.5),
 			"00010111": (0.3333333333333333, 0.33333333333333337, 0.33333333333333337),
 		},
-		7/sp.Rational(10): {
+		Fraction(7, 10): {
 			"00000111": (0.2, 0.2, 0.6),
 			"00001111": (0.0, 0.0, 1.0),
 			"00000011": (0.0, 0.5, 0.5),
 			"00000001": (0.3333333333333333, 0.33333333333333337, 0.33333333333333337),
 		},
-		3/sp.Rational(4): {
+		Fraction(3, 4): {
 			"00000111": (0.16666666666666666, 0.16666666666666674, 0.6666666666666666),
 			"00001111": (0.0, 0.0, 1.0),
 			"00000011": (0.0, 0.5, 0.5),
 			"00000001": (0.3333333333333333, 0.3333333333333333, 0.33333333333333337),
 		},
-		4/sp.Rational(5): {
+		Fraction(4, 5): {
 			"00000111": (0.13333333333333336, 0.13333333333333336, 0.7333333333333333),
 			"00001111": (0.0, 0.0, 1.0),
 			"00000011": (0.0, 0.4, 0.6),
 			"00000001": (0.3333333333333333, 0.33333333333333337, 0.33333333333333337),
 		},
-		17/sp.Rational(20): {
+		Fraction(17, 20): {
 			"00000111": (0.09999999999999998, 0.09999999999999998, 0.8),
 			"00001111": (0.0, 0.0, 1.0),
 			"00000011": (0.0, 0.30000000000000004, 0.7),
 			"00000001": (0.29999999999999993, 0.3, 0.4),
 		},
-		9/sp.Rational(10): {
+		Fraction(9, 10): {
 			"00000111": (0.06666666666666665, 0.06666666666666665, 0.8666666666666667),
 			"00001111": (0.0, 0.0, 1.0),
 			"00000011": (0.0, 0.19999999999999996, 0.8),
 			"00000001": (0.2, 0.20000000000000007, 0.6),
 		},
-		19/sp.Rational(20): {
+		Fraction(19, 20): {
 			"00000111": (0.033333333333333326, 0.033333333333333326, 0.9333333333333333),
 			"00001111": (0.0, 0.0, 1.0),
 			"00000011": (0.0, 0.09999999999999998, 0.9),
 			"00000001": (0.09999999999999998, 0.1, 0.8),
 		},
-		2/sp.Rational(3): {
+		Fraction(2, 3): {
 			"00000111": (0.2222222222222222, 0.2222222222222222, 0.5555555555555556),
 			"00001111": (0.0, 0.0, 1.0),
 			"00000011": (0.0, 0.5, 0.5),
 		},
 	},
 	4: {
-		1/sp.Rational(20): {
+		Fraction(1, 20): {
 			"0111111111111111": (0.1, 0.1, 0.1, 0.7000000000000001),
 			"0000001111111111": (0.0, 0.03333333333333333, 0.03333333333333334, 0.9333333333333333),
 			"0001111111111111": (0.03333333333333333, 0.03333333333333334, 0.06666666666666667, 0.8666666666666667),
@@ -274,7 +274,7 @@ all_wvgs_at_quota = {
 			"0000000111111111": (0.019999999999999997, 0.02, 0.020000000000000004, 0.94),
 			"0011111111111111": (0.0, 0.1, 0.1, 0.8),
 		},
-		1/sp.Rational(10): {
+		Fraction(1, 10): {
 			"0111111111111111": (0.2, 0.2, 0.2, 0.4000000000000001),
 			"0000001111111111": (0.0, 0.06666666666666667, 0.06666666666666668, 0.8666666666666667),
 			"0001111111111111": (0.06666666666666667, 0.06666666666666668, 0.13333333333333333, 0.7333333333333334),
@@ -285,7 +285,7 @@ all_wvgs_at_quota = {
 			"0000000111111111": (0.039999999999999994, 0.04, 0.04000000000000001, 0.8799999999999999),
 			"0011111111111111": (0.0, 0.2, 0.2, 0.6000000000000001),
 		},
-		3/sp.Rational(20): {
+		Fraction(3, 20): {
 			"0111111111111111": (0.24999999999999994, 0.24999999999999994, 0.24999999999999994, 0.25),
 			"0000001111111111": (0.0, 0.1, 0.1, 0.8),
 			"0001111111111111": (0.1, 0.1, 0.2, 0.6000000000000001),
@@ -296,7 +296,7 @@ all_wvgs_at_quota = {
 			"0000000111111111": (0.06, 0.06, 0.060000000000000005, 0.8199999999999998),
 			"0011111111111111": (0.0, 0.3, 0.3, 0.3999999999999999),
 		},
-		1/sp.Rational(5): {
+		Fraction(1, 5): {
 			"0111111111111111": (0.25, 0.25, 0.25, 0.25000000000000006),
 			"0000001111111111": (0.0, 0.13333333333333333, 0.13333333333333336, 0.7333333333333334),
 			"0001111111111111": (0.13333333333333333, 0.13333333333333336, 0.26666666666666666, 0.46666666666666673),
@@ -307,7 +307,7 @@ all_wvgs_at_quota = {
 			"0000000111111111": (0.07999999999999999, 0.08, 0.08000000000000002, 0.7600000000000001),
 			"0011111111111111": (0.0, 0.3333333333333333, 0.33333333333333337, 0.33333333333333337),
 		},
-		1/sp.Rational(4): {
+		Fraction(1, 4): {
 			"0000001111111111": (0.0, 0.16666666666666666, 0.16666666666666669, 0.6666666666666667),
 			"0001111111111111": (0.16666666666666663, 0.16666666666666669, 0.3333333333333333, 0.3333333333333333),
 			"0000011111111111": (0.09999999999999999, 0.09999999999999999, 0.2, 0.6000000000000001),
@@ -317,7 +317,7 @@ all_wvgs_at_quota = {
 			"0000000111111111": (0.09999999999999999, 0.1, 0.1, 0.7000000000000001),
 			"0011111111111111": (0.0, 0.3333333333333333, 0.33333333333333337, 0.33333333333333337),
 		},
-		3/sp.Rational(10): {
+		Fraction(3, 10): {
 			"0000001111111111": (0.0, 0.2, 0.2, 0.6000000000000001),
 			"0001111111111111": (0.0666666666666666, 0.2666666666666667, 0.3333333333333333, 0.3333333333333333),
 			"0000011111111111": (0.12, 0.12, 0.24, 0.52),
@@ -328,7 +328,7 @@ all_wvgs_at_quota = {
 			"0000000111111111": (0.12, 0.12, 0.12000000000000001, 0.64),
 			"0011111111111111": (0.0, 0.3333333333333333, 0.3333333333333333, 0.3333333333333333),
 		},
-		7/sp.Rational(20): {
+		Fraction(7, 20): {
 			"0000011101111111": (0.03333333333333334, 0.3, 0.33333333333333337, 0.33333333333333337),
 			"0000001111111111": (0.0, 0.2333333333333333, 0.23333333333333334, 0.5333333333333333),
 			"0000001100111111": (0.0, 0.3333333333333333, 0.33333333333333337, 0.33333333333333337),
@@ -340,7 +340,7 @@ all_wvgs_at_quota = {
 			"0000000111111111": (0.13999999999999999, 0.13999999999999999, 0.14, 0.58),
 			"0000001101111111": (0.020000000000000018, 0.31999999999999995, 0.32, 0.33999999999999997),
 		},
-		2/sp.Rational(5): {
+		Fraction(2, 5): {
 			"0000011101111111": (0.13333333333333336, 0.19999999999999996, 0.3333333333333333, 0.3333333333333333),
 			"0000001111111111": (0.0, 0.2, 0.3, 0.5),
 			"0000001100111111": (0.0, 0.3333333333333333, 0.3333333333333333, 0.3333333333333333),
@@ -351,7 +351,7 @@ all_wvgs_at_quota = {
 			"0000000111111111": (0.15999999999999998, 0.16, 0.16000000000000003, 0.52),
 			"0000001101111111": (0.08000000000000002, 0.27999999999999997, 0.27999999999999997, 0.36),
 		},
-		9/sp.Rational(20): {
+		Fraction(9, 20): {
 			"0000011101111111": (0.2, 0.2, 0.3, 0.3),
 			"0000000101111111": (0.19999999999999993, 0.2, 0.20000000000000004, 0.39999999999999997),
 			"0000001111111111": (0.0, 0.09999999999999992, 0.4, 0.5),
@@ -363,12 +363,12 @@ all_wvgs_at_quota = {
 			"0000000111111111": (0.09999999999999984, 0.09999999999999991, 0.30000000000000016, 0.5),
 			"0000001101111111": (0.15000000000000008, 0.25, 0.25, 0.3499999999999998),
 		},
-		1/sp.Rational(2): {
+		Fraction(1, 2): {
 			"0000000101111111": (0.19999999999999998, 0.19999999999999998, 0.20000000000000004, 0.4),
 			"0000001100111111": (0.0, 0.3333333333333333, 0.3333333333333333, 0.33333333333333337),
 			"0000000011111111": (0.0, 0.0, 0.0, 1.0),
 		},
-		11/sp.Rational(20): {
+		Fraction(11, 20): {
 			"0000000000111111": (0.0, 0.1, 0.4, 0.5),
 			"0000000101111111": (0.19999999999999993, 0.19999999999999998, 0.2, 0.4),
 			"0000000000001111": (0.0, 0.0, 0.5, 0.5),
@@ -380,7 +380,7 @@ all_wvgs_at_quota = {
 			"0000000011111111": (0.0, 0.0, 0.0, 1.0),
 			"0000000000011111": (0.05, 0.050000000000000024, 0.42499999999999993, 0.475),
 		},
-		3/sp.Rational(5): {
+		Fraction(3, 5): {
 			"0000000000111111": (0.0, 0.2, 0.3, 0.5),
 			"0000000000001111": (0.0, 0.0, 0.5, 0.5),
 			"0000000001111111": (0.15999999999999998, 0.16000000000000003, 0.16000000000000003, 0.5199999999999999),
@@ -391,7 +391,7 @@ all_wvgs_at_quota = {
 			"0000000011111111": (0.0, 0.0, 0.0, 1.0),
 			"0000000000011111": (0.09999999999999999, 0.1, 0.35000000000000003, 0.45),
 		},
-		13/sp.Rational(20): {
+		Fraction(13, 20): {
 			"0000000000111111": (0.0, 0.23333333333333334, 0.23333333333333334, 0.5333333333333333),
 			"0000000000001111": (0.0, 0.0, 0.5, 0.5),
 			"0000000001111111": (0.13999999999999999, 0.14, 0.14000000000000004, 0.58),
@@ -403,7 +403,7 @@ all_wvgs_at_quota = {
 			"0000000000011111": (0.13999999999999999, 0.13999999999999999, 0.27999999999999997, 0.44000000000000006),
 			"0000000000010111": (0.19999999999999998, 0.2, 0.2, 0.4),
 		},
-		7/sp.Rational(10): {
+		Fraction(7, 10): {
 			"0000000000111111": (0.0, 0.2, 0.2, 0.6),
 			"0000000000001111": (0.0, 0.0, 0.5, 0.5),
 			"0000000001111111": (0.11999999999999995, 0.12000000000000002, 0.12000000000000004, 0.6399999999999999),
@@ -414,7 +414,7 @@ all_wvgs_at_quota = {
 			"0000000000011111": (0.11999999999999997, 0.11999999999999998, 0.23999999999999985, 0.5200000000000001),
 			"0000000000010111": (0.2, 0.2, 0.2, 0.4),
 		},
-		3/sp.Rational(4): {
+		Fraction(3, 4): {
 			"0000000000111111": (0.0, 0.16666666666666666, 0.16666666666666674, 0.6666666666666666),
 			"0000000000001111": (0.0, 0.0, 0.5, 0.5),
 			"0000000001111111": (0.09999999999999998, 0.09999999999999998, 0.09999999999999998, 0.7000000000000001),
@@ -424,7 +424,7 @@ all_wvgs_at_quota = {
 			"0000000000011111": (0.09999999999999999, 0.1, 0.20000000000000007, 0.6),
 			"0000000000010111": (0.16666666666666666, 0.16666666666666666, 0.16666666666666674, 0.5),
 		},
-		4/sp.Rational(5): {
+		Fraction(4, 5): {
 			"0000000000111111": (0.0, 0.13333333333333336, 0.13333333333333336, 0.7333333333333333),
 			"0000000000001111": (0.0, 0.0, 0.4, 0.6),
 			"0000000001111111": (0.07999999999999999, 0.08000000000000003, 0.08000000000000004, 0.7599999999999999),
@@ -435,7 +435,7 @@ all_wvgs_at_quota = {
 			"0000000000011111": (0.07999999999999997, 0.07999999999999999, 0.15999999999999998, 0.68),
 			"0000000000010111": (0.13333333333333336, 0.13333333333333336, 0.13333333333333347, 0.5999999999999999),
 		},
-		17/sp.Rational(20): {
+		Fraction(17, 20): {
 			"0000000000111111": (0.0, 0.09999999999999998, 0.09999999999999998, 0.8),
 			"0000000000001111": (0.0, 0.0, 0.30000000000000004, 0.7),
 			"0000000001111111": (0.05999999999999998, 0.06000000000000001, 0.06000000000000002, 0.82),
@@ -446,7 +446,7 @@ all_wvgs_at_quota = {
 			"0000000000011111": (0.059999999999999984, 0.05999999999999999, 0.12000000000000006, 0.76),
 			"0000000000010111": (0.1, 0.1, 0.10000000000000006, 0.7),
 		},
-		9/sp.Rational(10): {
+		Fraction(9, 10): {
 			"0000000000111111": (0.0, 0.06666666666666665, 0.06666666666666665, 0.8666666666666667),
 			"0000000000001111": (0.0, 0.0, 0.19999999999999996, 0.8),
 			"0000000001111111": (0.03999999999999998, 0.040000000000000036, 0.040000000000000036, 0.8799999999999999),
@@ -457,7 +457,7 @@ all_wvgs_at_quota = {
 			"0000000000011111": (0.03999999999999998, 0.03999999999999998, 0.07999999999999985, 0.8400000000000001),
 			"0000000000010111": (0.06666666666666668, 0.06666666666666668, 0.06666666666666674, 0.7999999999999999),
 		},
-		19/sp.Rational(20): {
+		Fraction(19, 20): {
 			"0000000000111111": (0.0, 0.033333333333333326, 0.033333333333333326, 0.9333333333333333),
 			"0000000000001111": (0.0, 0.0, 0.09999999999999998, 0.9),
 			"0000000001111111": (0.019999999999999962, 0.020000000000000018, 0.020000000000000018, 0.94),
@@ -468,7 +468,7 @@ all_wvgs_at_quota = {
 			"0000000000011111": (0.019999999999999976, 0.01999999999999998, 0.039999999999999813, 0.9200000000000002),
 			"0000000000010111": (0.03333333333333331, 0.03333333333333334, 0.03333333333333334, 0.9),
 		},
-		2/sp.Rational(3): {
+		Fraction(2, 3): {
 			"0000000000111111": (0.0, 0.2222222222222222, 0.2222222222222222, 0.5555555555555556),
 			"0000000000001111": (0.0, 0.0, 0.5, 0.5),
 			"0000000001111111": (0.13333333333333333, 0.13333333333333333, 0.1333333333333334, 0.6),
@@ -479,7 +479,7 @@ all_wvgs_at_quota = {
 		},
 	},
 	5: {
-		1/sp.Rational(20): {
+		Fraction(1, 20): {
 			"00000000000111111111111111111111": (0.011111111111111103, 0.011111111111111112, 0.02222222222222222, 0.03333333333333334, 0.9222222222222223),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00010111011111111111111111111111": (0.033333333333333326, 0.03333333333333333, 0.03333333333333334, 0.03333333333333334, 0.8666666666666667),
@@ -507,7 +507,7 @@ all_wvgs_at_quota = {
 			"00000000001111111111111111111111": (0.0, 0.019999999999999997, 0.020000000000000007, 0.039999999999999994, 0.9199999999999999),
 			"00011111111111111111111111111111": (0.03333333333333333, 0.03333333333333334, 0.06666666666666667, 0.06666666666666667, 0.8),
 		},
-		1/sp.Rational(10): {
+		Fraction(1, 10): {
 			"00000000000111111111111111111111": (0.022222222222222206, 0.022222222222222223, 0.04444444444444444, 0.06666666666666668, 0.8444444444444444),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00010111011111111111111111111111": (0.06666666666666665, 0.06666666666666667, 0.06666666666666668, 0.06666666666666668, 0.7333333333333334),
@@ -535,7 +535,7 @@ all_wvgs_at_quota = {
 			"00000000001111111111111111111111": (0.0, 0.039999999999999994, 0.040000000000000015, 0.07999999999999999, 0.84),
 			"00011111111111111111111111111111": (0.06666666666666667, 0.06666666666666668, 0.13333333333333333, 0.13333333333333333, 0.6000000000000001),
 		},
-		3/sp.Rational(20): {
+		Fraction(3, 20): {
 			"00000000000111111111111111111111": (0.03333333333333332, 0.03333333333333333, 0.06666666666666668, 0.1, 0.7666666666666667),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00010111011111111111111111111111": (0.1, 0.1, 0.1, 0.1, 0.6000000000000001),
@@ -563,7 +563,7 @@ all_wvgs_at_quota = {
 			"00000000001111111111111111111111": (0.0, 0.06, 0.06, 0.12, 0.76),
 			"00011111111111111111111111111111": (0.1, 0.1, 0.2, 0.2, 0.4000000000000001),
 		},
-		1/sp.Rational(5): {
+		Fraction(1, 5): {
 			"00000000000111111111111111111111": (0.04444444444444441, 0.044444444444444446, 0.08888888888888888, 0.13333333333333336, 0.6888888888888889),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00010111011111111111111111111111": (0.1333333333333333, 0.13333333333333333, 0.13333333333333336, 0.13333333333333336, 0.4666666666666668),
@@ -590,7 +590,7 @@ all_wvgs_at_quota = {
 			"00000000001111111111111111111111": (0.0, 0.07999999999999999, 0.08000000000000003, 0.15999999999999998, 0.68),
 			"00011111111111111111111111111111": (0.10000000000000003, 0.14999999999999997, 0.25, 0.25, 0.25),
 		},
-		1/sp.Rational(4): {
+		Fraction(1, 4): {
 			"00000000000111111111111111111111": (0.055555555555555525, 0.05555555555555555, 0.1111111111111111, 0.16666666666666669, 0.6111111111111109),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00010111011111110111111111111111": (0.2, 0.2, 0.2, 0.2, 0.2),
@@ -616,7 +616,7 @@ all_wvgs_at_quota = {
 			"00000001001111111111111111111111": (0.055555555555555525, 0.1111111111111111, 0.11111111111111113, 0.16666666666666669, 0.5555555555555554),
 			"00000000001111111111111111111111": (0.0, 0.09999999999999999, 0.09999999999999999, 0.2, 0.6000000000000001),
 		},
-		3/sp.Rational(10): {
+		Fraction(3, 10): {
 			"00000000000111111111111111111111": (0.06666666666666664, 0.06666666666666667, 0.13333333333333336, 0.2, 0.5333333333333334),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00010111011111110111111111111111": (0.2, 0.2, 0.2, 0.2, 0.20000000000000007),
@@ -646,7 +646,7 @@ all_wvgs_at_quota = {
 			"00000001011111110111111111111111": (0.14285714285714285, 0.14285714285714285, 0.14285714285714285, 0.2857142857142857, 0.2857142857142857),
 			"00000111011111110111111111111111": (0.10000000000000005, 0.1499999999999999, 0.25, 0.25, 0.25),
 		},
-		7/sp.Rational(20): {
+		Fraction(7, 20): {
 			"00000000000111111111111111111111": (0.07777777777777778, 0.07777777777777778, 0.15555555555555553, 0.23333333333333334, 0.4555555555555556),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00010111011111110111111111111111": (0.19999999999999996, 0.19999999999999996, 0.2, 0.2, 0.20000000000000004),
@@ -685,7 +685,7 @@ all_wvgs_at_quota = {
 			"00000001011111110111111111111111": (0.14285714285714285, 0.14285714285714285, 0.14285714285714288, 0.2857142857142857, 0.2857142857142857),
 			"00000111011111110111111111111111": (0.15714285714285714, 0.15714285714285714, 0.22857142857142856, 0.22857142857142856, 0.22857142857142856),
 		},
-		2/sp.Rational(5): {
+		Fraction(2, 5): {
 			"00000000000111111111111111111111": (0.06666666666666665, 0.06666666666666665, 0.1333333333333333, 0.3, 0.4333333333333333),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00000000000011110001111111111111": (0.0444444444444444, 0.044444444444444446, 0.28888888888888886, 0.2888888888888889, 0.33333333333333337),
@@ -717,7 +717,7 @@ all_wvgs_at_quota = {
 			"00000001011111110111111111111111": (0.14285714285714285, 0.14285714285714285, 0.1428571428571429, 0.2857142857142857, 0.2857142857142857),
 			"00000000000101110111111111111111": (0.12499999999999996, 0.125, 0.12500000000000003, 0.25, 0.37499999999999994),
 		},
-		9/sp.Rational(20): {
+		Fraction(9, 20): {
 			"00000000000111111111111111111111": (0.0333333333333333, 0.033333333333333305, 0.06666666666666653, 0.4000000000000001, 0.4666666666666666),
 			"00000000000000010111111111111111": (0.14285714285714282, 0.14285714285714282, 0.14285714285714285, 0.14285714285714288, 0.42857142857142855),
 			"00000000000001110011111111111111": (0.05555555555555562, 0.1555555555555555, 0.2111111111111111, 0.2111111111111111, 0.3666666666666666),
@@ -758,7 +758,7 @@ all_wvgs_at_quota = {
 			"00000000000101110111111111111111": (0.13333333333333336, 0.13333333333333336, 0.13333333333333336, 0.23333333333333328, 0.36666666666666664),
 			"00000000000000110111111111111111": (0.07142857142857142, 0.17142857142857135, 0.1714285714285714, 0.17142857142857146, 0.4142857142857143),
 		},
-		1/sp.Rational(2): {
+		Fraction(1, 2): {
 			"00000000000000010111111111111111": (0.14285714285714285, 0.14285714285714285, 0.14285714285714285, 0.14285714285714285, 0.42857142857142855),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00000001000101110001011101111111": (0.19999999999999998, 0.2, 0.2, 0.2, 0.20000000000000007),
@@ -767,7 +767,7 @@ all_wvgs_at_quota = {
 			"00000000000101110001011111111111": (0.1428571428571428, 0.14285714285714288, 0.1428571428571429, 0.2857142857142857, 0.2857142857142857),
 			"00000000000000110011111111111111": (0.0, 0.19999999999999998, 0.2, 0.20000000000000004, 0.39999999999999997),
 		},
-		11/sp.Rational(20): {
+		Fraction(11, 20): {
 			"00000000000000010000000111111111": (0.050000000000000024, 0.050000000000000024, 0.050000000000000044, 0.42499999999999993, 0.425),
 			"00000000000000010111111111111111": (0.14285714285714282, 0.14285714285714282, 0.14285714285714282, 0.14285714285714282, 0.42857142857142855),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
@@ -808,7 +808,7 @@ all_wvgs_at_quota = {
 			"00000000000000000001011111111111": (0.05, 0.05, 0.050000000000000024, 0.37499999999999994, 0.475),
 			"00000000000000000011111111111111": (0.0, 0.1, 0.1, 0.30000000000000004, 0.5),
 		},
-		3/sp.Rational(5): {
+		Fraction(3, 5): {
 			"00000000000000010000000111111111": (0.10000000000000002, 0.10000000000000002, 0.10000000000000009, 0.3499999999999999, 0.3499999999999999),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00000000000000010000001101111111": (0.1111111111111111, 0.15555555555555556, 0.15555555555555556, 0.26666666666666666, 0.3111111111111111),
@@ -840,7 +840,7 @@ all_wvgs_at_quota = {
 			"00000000000000000001011101111111": (0.14285714285714285, 0.14285714285714285, 0.14285714285714285, 0.14285714285714285, 0.4285714285714286),
 			"00000000000000000011111111111111": (0.0, 0.15999999999999998, 0.16000000000000003, 0.16000000000000003, 0.5199999999999999),
 		},
-		13/sp.Rational(20): {
+		Fraction(13, 20): {
 			"00000000000000010000000111111111": (0.03333333333333331, 0.03333333333333334, 0.26666666666666666, 0.3333333333333333, 0.33333333333333337),
 			"00000000000000010000000100011111": (0.15714285714285714, 0.15714285714285717, 0.22857142857142856, 0.22857142857142856, 0.2285714285714286),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
@@ -879,7 +879,7 @@ all_wvgs_at_quota = {
 			"00000000000000000001011101111111": (0.13999999999999985, 0.13999999999999996, 0.14, 0.14000000000000012, 0.43999999999999995),
 			"00000000000000000011111111111111": (0.0, 0.13999999999999999, 0.14, 0.14000000000000004, 0.58),
 		},
-		7/sp.Rational(10): {
+		Fraction(7, 10): {
 			"00000000000000010000000100011111": (0.0999999999999999, 0.1500000000000001, 0.24999999999999992, 0.24999999999999997, 0.25),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00000000000000010000000101111111": (0.14285714285714285, 0.14285714285714285, 0.14285714285714288, 0.2857142857142857, 0.2857142857142857),
@@ -909,7 +909,7 @@ all_wvgs_at_quota = {
 			"00000000000000000011111111111111": (0.0, 0.11999999999999995, 0.12000000000000002, 0.12000000000000004, 0.6399999999999999),
 			"00000000000000000000000100111111": (0.09999999999999991, 0.16666666666666666, 0.16666666666666666, 0.2333333333333334, 0.3333333333333333),
 		},
-		3/sp.Rational(4): {
+		Fraction(3, 4): {
 			"00000000000000000000000000010111": (0.14285714285714285, 0.14285714285714288, 0.14285714285714288, 0.2857142857142857, 0.2857142857142857),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00000000000000000000001111111111": (0.0, 0.09999999999999999, 0.1, 0.20000000000000007, 0.6),
@@ -935,7 +935,7 @@ all_wvgs_at_quota = {
 			"00000000000000000011111111111111": (0.0, 0.09999999999999998, 0.09999999999999998, 0.09999999999999998, 0.7000000000000001),
 			"00000000000000000000000100111111": (0.07142857142857137, 0.14285714285714285, 0.14285714285714285, 0.21428571428571427, 0.42857142857142866),
 		},
-		4/sp.Rational(5): {
+		Fraction(4, 5): {
 			"00000000000000000000000000010111": (0.13333333333333336, 0.13333333333333336, 0.13333333333333336, 0.26666666666666666, 0.3333333333333333),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00000000000000000000001111111111": (0.0, 0.07999999999999997, 0.07999999999999999, 0.15999999999999998, 0.68),
@@ -962,7 +962,7 @@ all_wvgs_at_quota = {
 			"00000000000000000011111111111111": (0.0, 0.07999999999999999, 0.08000000000000003, 0.08000000000000004, 0.7599999999999999),
 			"00000000000000000000000100111111": (0.05714285714285714, 0.11428571428571424, 0.11428571428571428, 0.17142857142857137, 0.5428571428571429),
 		},
-		17/sp.Rational(20): {
+		Fraction(17, 20): {
 			"00000000000000000000000000010111": (0.09999999999999999, 0.09999999999999999, 0.10000000000000002, 0.2, 0.5),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00000000000000000000001111111111": (0.0, 0.059999999999999984, 0.05999999999999999, 0.12000000000000006, 0.76),
@@ -990,7 +990,7 @@ all_wvgs_at_quota = {
 			"00000000000000000011111111111111": (0.0, 0.05999999999999998, 0.06000000000000001, 0.06000000000000002, 0.82),
 			"00000000000000000000000100111111": (0.042857142857142864, 0.08571428571428569, 0.0857142857142857, 0.12857142857142853, 0.6571428571428573),
 		},
-		9/sp.Rational(10): {
+		Fraction(9, 10): {
 			"00000000000000000000000000010111": (0.06666666666666667, 0.0666666666666667, 0.0666666666666667, 0.1333333333333333, 0.6666666666666666),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00000000000000000000001111111111": (0.0, 0.03999999999999998, 0.03999999999999998, 0.07999999999999985, 0.8400000000000001),
@@ -1018,7 +1018,7 @@ all_wvgs_at_quota = {
 			"00000000000000000011111111111111": (0.0, 0.03999999999999998, 0.040000000000000036, 0.040000000000000036, 0.8799999999999999),
 			"00000000000000000000000100111111": (0.028571428571428515, 0.057142857142857106, 0.05714285714285711, 0.08571428571428567, 0.7714285714285716),
 		},
-		19/sp.Rational(20): {
+		Fraction(19, 20): {
 			"00000000000000000000000000010111": (0.033333333333333305, 0.03333333333333332, 0.03333333333333332, 0.06666666666666668, 0.8333333333333334),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00000000000000000000001111111111": (0.0, 0.019999999999999976, 0.01999999999999998, 0.039999999999999813, 0.9200000000000002),
@@ -1046,7 +1046,7 @@ all_wvgs_at_quota = {
 			"00000000000000000011111111111111": (0.0, 0.019999999999999962, 0.020000000000000018, 0.020000000000000018, 0.94),
 			"00000000000000000000000100111111": (0.014285714285714174, 0.02857142857142854, 0.028571428571428543, 0.04285714285714281, 0.8857142857142859),
 		},
-		2/sp.Rational(3): {
+		Fraction(2, 3): {
 			"00000000000000010000000100011111": (0.14285714285714288, 0.14285714285714288, 0.23809523809523805, 0.23809523809523808, 0.2380952380952381),
 			"00000000000000001111111111111111": (0.0, 0.0, 0.0, 0.0, 1.0),
 			"00000000000000010000000101111111": (0.14285714285714285, 0.14285714285714285, 0.1428571428571429, 0.2857142857142857, 0.2857142857142857),
@@ -1071,7 +1071,7 @@ all_wvgs_at_quota = {
 		},
 	},
 	6: {
-		1/sp.Rational(20): {
+		Fraction(1, 20): {
 			"0000000100010111000101111111111111111111111111111111111111111111": (0.01818181818181818, 0.018181818181818184, 0.018181818181818188, 0.02727272727272727, 0.02727272727272727, 0.890909090909091),
 			"0000000000000000000000010001111111111111111111111111111111111111": (0.007692307692307692, 0.007692307692307698, 0.01538461538461538, 0.015384615384615382, 0.023076923076923078, 0.9307692307692309),
 			"0111111111111111111111111111111111111111111111111111111111111111": (0.1, 0.1, 0.1, 0.1, 0.1, 0.5000000000000001),
@@ -1191,7 +1191,7 @@ all_wvgs_at_quota = {
 			"0000000000111111011111111111111111111111111111111111111111111111": (0.009090909090909092, 0.01818181818181818, 0.01818181818181818, 0.03636363636363636, 0.045454545454545456, 0.8727272727272728),
 			"0000000100011111111111111111111111111111111111111111111111111111": (0.014285714285714285, 0.014285714285714285, 0.02857142857142857, 0.02857142857142857, 0.05714285714285714, 0.8571428571428572),
 		},
-		1/sp.Rational(10): {
+		Fraction(1, 10): {
 			"0000000100010111000101111111111111111111111111111111111111111111": (0.03636363636363636, 0.03636363636363637, 0.036363636363636376, 0.05454545454545454, 0.05454545454545454, 0.7818181818181817),
 			"0000000000000000000000010001111111111111111111111111111111111111": (0.015384615384615384, 0.015384615384615396, 0.03076923076923076, 0.030769230769230764, 0.046153846153846156, 0.8615384615384615),
 			"0111111111111111111111111111111111111111111111111111111111111111": (0.16666666666666666, 0.16666666666666669, 0.16666666666666669, 0.16666666666666669, 0.16666666666666669, 0.16666666666666669),
@@ -1311,7 +1311,7 @@ all_wvgs_at_quota = {
 			"0000000000111111011111111111111111111111111111111111111111111111": (0.018181818181818184, 0.03636363636363636, 0.03636363636363636, 0.07272727272727272, 0.09090909090909091, 0.7454545454545454),
 			"0000000100011111111111111111111111111111111111111111111111111111": (0.02857142857142857, 0.02857142857142857, 0.05714285714285714, 0.05714285714285714, 0.11428571428571428, 0.7142857142857142),
 		},
-		3/sp.Rational(20): {
+		Fraction(3, 20): {
 			"0000000100010111000101111111111111111111111111111111111111111111": (0.05454545454545454, 0.05454545454545454, 0.05454545454545455, 0.08181818181818182, 0.08181818181818182, 0.6727272727272727),
 			"0000000000000000000000010001111111111111111111111111111111111111": (0.02307692307692307, 0.023076923076923078, 0.046153846153846156, 0.046153846153846156, 0.06923076923076923, 0.7923076923076924),
 			"0111111111111111111111111111111111111111111111111111111111111111": (0.16666666666666666, 0.16666666666666666, 0.16666666666666666, 0.16666666666666666, 0.16666666666666666, 0.16666666666666666),
@@ -1431,7 +1431,7 @@ all_wvgs_at_quota = {
 			"0000000000111111011111111111111111111111111111111111111111111111": (0.02727272727272728, 0.05454545454545454, 0.05454545454545454, 0.10909090909090909, 0.13636363636363638, 0.6181818181818182),
 			"0000000100011111111111111111111111111111111111111111111111111111": (0.04285714285714286, 0.042857142857142864, 0.08571428571428572, 0.08571428571428572, 0.17142857142857143, 0.5714285714285714),
 		},
-		1/sp.Rational(5): {
+		Fraction(1, 5): {
 			"0000000100010111000101111111111111111111111111111111111111111111": (0.07272727272727272, 0.07272727272727274, 0.07272727272727275, 0.10909090909090909, 0.10909090909090909, 0.5636363636363635),
 			"0000000000000000000000010001111111111111111111111111111111111111": (0.030769230769230767, 0.030769230769230792, 0.06153846153846152, 0.06153846153846153, 0.09230769230769231, 0.7230769230769231),
 			"0000000000000001000000011111111111111111111111111111111111111111": (0.03636363636363634, 0.03636363636363636, 0.03636363636363636, 0.10909090909090906, 0.1090909090909091, 0.6727272727272727),
@@ -1549,7 +1549,7 @@ all_wvgs_at_quota = {
 			"0000000000111111011111111111111111111111111111111111111111111111": (0.03636363636363637, 0.07272727272727272, 0.07272727272727272, 0.14545454545454545, 0.18181818181818182, 0.4909090909090908),
 			"0000000100011111111111111111111111111111111111111111111111111111": (0.05714285714285714, 0.05714285714285714, 0.11428571428571428, 0.11428571428571428, 0.22857142857142856, 0.4285714285714285),
 		},
-		1/sp.Rational(4): {
+		Fraction(1, 4): {
 			"0000000100010111000101111111111111111111111111111111111111111111": (0.09090909090909091, 0.09090909090909093, 0.09090909090909094, 0.13636363636363635, 0.13636363636363635, 0.4545454545454545),
 			"0000000000000000000000010001111111111111111111111111111111111111": (0.03846153846153846, 0.03846153846153848, 0.07692307692307691, 0.07692307692307691, 0.11538461538461539, 0.653846153846154),
 			"0000000000000001000000011111111111111111111111111111111111111111": (0.04545454545454545, 0.045454545454545456, 0.045454545454545456, 0.13636363636363635, 0.13636363636363638, 0.590909090909091),
@@ -1665,7 +1665,7 @@ all_wvgs_at_quota = {
 			"0000000000111111011111111111111111111111111111111111111111111111": (0.045454545454545456, 0.09090909090909088, 0.09090909090909088, 0.18181818181818182, 0.22727272727272727, 0.36363636363636376),
 			"0000000100011111111111111111111111111111111111111111111111111111": (0.07142857142857142, 0.07142857142857142, 0.14285714285714285, 0.14285714285714288, 0.2857142857142857, 0.2857142857142857),
 		},
-		3/sp.Rational(10): {
+		Fraction(3, 10): {
 			"0000000100010111000101111111111111111111111111111111111111111111": (0.10909090909090909, 0.10909090909090909, 0.1090909090909091, 0.16363636363636364, 0.16363636363636364, 0.34545454545454557),
 			"0000000000000000000000010001111111111111111111111111111111111111": (0.04615384615384614, 0.046153846153846156, 0.09230769230769231, 0.09230769230769231, 0.13846153846153847, 0.5846153846153846),
 			"0000000000000001000000011111111111111111111111111111111111111111": (0.05454545454545455, 0.05454545454545455, 0.05454545454545458, 0.16363636363636364, 0.16363636363636364, 0.509090909090909),
@@ -1814,7 +1814,7 @@ all_wvgs_at_quota = {
 			"0000000000111111011111111111111111111111111111111111111111111111": (0.028571428571428543, 0.05714285714285705, 0.05714285714285708, 0.25714285714285723, 0.2857142857142857, 0.3142857142857143),
 			"0000000000000111001111111111111101111111111111111111111111111111": (0.018181818181818177, 0.12727272727272726, 0.14545454545454545, 0.14545454545454545, 0.2727272727272727, 0.2909090909090909),
 		},
-		7/sp.Rational(20): {
+		Fraction(7, 20): {
 			"0000000000000011000001111111111100001111111111111111111111111111": (0.007692307692307688, 0.015384615384615377, 0.030769230769230754, 0.3076923076923077, 0.31538461538461543, 0.3230769230769231),
 			"0000000000000000000000001111111100000011111111111111111111111111": (0.0, 0.011111111111111112, 0.01111111111111115, 0.3222222222222222, 0.32222222222222224, 0.3333333333333333),
 			"0000000000000000000000010001111111111111111111111111111111111111": (0.05384615384615382, 0.05384615384615385, 0.10769230769230771, 0.10769230769230771, 0.16153846153846152, 0.5153846153846153),
@@ -2065,7 +2065,7 @@ all_wvgs_at_quota = {
 			"0000000000000001000011111111111100011111111111111111111111111111": (0.014285714285714287, 0.01428571428571429, 0.042857142857142864, 0.2857142857142857, 0.3142857142857143, 0.32857142857142857),
 			"0000000000000001001111111111111100111111111111111111111111111111": (0.019999999999999983, 0.04000000000000001, 0.04000000000000001, 0.26, 0.32, 0.32),
 		},
-		2/sp.Rational(5): {
+		Fraction(2, 5): {
 			"0000000000000011000001111111111100001111111111111111111111111111": (0.030769230769230778, 0.06153846153846156, 0.12307692307692311, 0.23076923076923073, 0.2615384615384615, 0.29230769230769227),
 			"0000000000000000000000001111111100000011111111111111111111111111": (0.0, 0.0444444444444444, 0.044444444444444446, 0.28888888888888886, 0.2888888888888889, 0.33333333333333337),
 			"0000000000000000000000010001111111111111111111111111111111111111": (0.061538461538461535, 0.061538461538461584, 0.12307692307692304, 0.12307692307692306, 0.18461538461538463, 0.4461538461538462),
@@ -2262,7 +2262,7 @@ all_wvgs_at_quota = {
 			"0000000000000001001111111111111100111111111111111111111111111111": (0.03636363636363641, 0.12727272727272726, 0.12727272727272726, 0.12727272727272726, 0.2909090909090909, 0.2909090909090909),
 			"0000000000000001000000010011111101111111111111111111111111111111": (0.0833333333333333, 0.11666666666666665, 0.11666666666666665, 0.15, 0.15, 0.3833333333333333),
 		},
-		9/sp.Rational(20): {
+		Fraction(9, 20): {
 			"0000000000000000000000010111111100011111111111111111111111111111": (0.049999999999999954, 0.049999999999999954, 0.09999999999999991, 0.14999999999999986, 0.2750000000000002, 0.3750000000000001),
 			"0000000000000011000001111111111100001111111111111111111111111111": (0.024999999999999967, 0.04999999999999995, 0.19375, 0.21875000000000006, 0.24374999999999997, 0.26875),
 			"0000000000000000000000001111111100000011111111111111111111111111": (0.0, 0.07777777777777775, 0.07777777777777779, 0.2555555555555555, 0.25555555555555554, 0.3333333333333333),
@@ -2567,7 +2567,7 @@ all_wvgs_at_quota = {
 			"0000000000000001000000010011111101111111111111111111111111111111": (0.08666666666666675, 0.0933333333333333, 0.09333333333333331, 0.18, 0.18, 0.3666666666666666),
 			"0000000000000011000000110011111100000011111111111111111111111111": (0.0, 0.1555555555555555, 0.1555555555555555, 0.2111111111111111, 0.21111111111111114, 0.26666666666666666),
 		},
-		1/sp.Rational(2): {
+		Fraction(1, 2): {
 			"0000000000000000000000000001011100010111111111111111111111111111": (0.09090909090909088, 0.09090909090909091, 0.090909090909091, 0.18181818181818177, 0.18181818181818177, 0.36363636363636365),
 			"0000000000000000000000010001111100000111011111111111111111111111": (0.07692307692307691, 0.07692307692307698, 0.15384615384615383, 0.15384615384615385, 0.23076923076923073, 0.3076923076923077),
 			"0000000000000000000000000000000101111111111111111111111111111111": (0.1111111111111111, 0.1111111111111111, 0.1111111111111111, 0.1111111111111111, 0.11111111111111116, 0.4444444444444445),
@@ -2590,7 +2590,7 @@ all_wvgs_at_quota = {
 			"0000000000000000000000000000000011111111111111111111111111111111": (0.0, 0.0, 0.0, 0.0, 0.0, 1.0),
 			"0000000000000000000000010111111100000001011111111111111111111111": (0.09090909090909088, 0.09090909090909091, 0.09090909090909091, 0.18181818181818182, 0.2727272727272727, 0.2727272727272727),
 		},
-		11/sp.Rational(20): {
+		Fraction(11, 20): {
 			"0000000000000000000000010001111100000001000111110111111111111111": (0.08333333333333329, 0.08333333333333333, 0.1666666666666666, 0.16666666666666669, 0.25, 0.25),
 			"0000000000000000000000000000000100000000000000111111111111111111": (0.02000000000000001, 0.040000000000000015, 0.04000000000000002, 0.04000000000000002, 0.41999999999999993, 0.43999999999999995),
 			"0000000000000000000000000000111100000000000111110111111111111111": (0.03333333333333333, 0.033333333333333375, 0.18333333333333338, 0.21666666666666667, 0.24999999999999994, 0.2833333333333333),
@@ -2895,7 +2895,7 @@ all_wvgs_at_quota = {
 			"0000000000000000000000010001011100000011001111111111111111111111": (0.033333333333333215, 0.1333333333333333, 0.13333333333333336, 0.13333333333333336, 0.26666666666666666, 0.3),
 			"0000000000000000000000000000001100000011001111110011111111111111": (0.0, 0.16666666666666666, 0.16666666666666666, 0.16666666666666666, 0.16666666666666666, 0.33333333333333337),
 		},
-		3/sp.Rational(5): {
+		Fraction(3, 5): {
 			"0000000000000000000000000000000100000011001111110111111111111111": (0.04999999999999993, 0.125, 0.125, 0.125, 0.20000000000000004, 0.375),
 			"0000000000000000000000000000000100000000000000111111111111111111": (0.040000000000000015, 0.08, 0.08000000000000003, 0.08000000000000003, 0.3399999999999999, 0.37999999999999995),
 			"0000000000000000000000000000111100000000000111110111111111111111": (0.03636363636363631, 0.03636363636363644, 0.10909090909090913, 0.23636363636363636, 0.2727272727272727, 0.309090909090909),
@@ -3092,7 +3092,7 @@ all_wvgs_at_quota = {
 			"0000000000000000000000000001111100000000000111110111111111111111": (0.044444444444444384, 0.04444444444444447, 0.08888888888888881, 0.2444444444444445, 0.28888888888888886, 0.2888888888888889),
 			"0000000000000000000000000000001100000011001111110011111111111111": (0.0, 0.16666666666666666, 0.16666666666666666, 0.16666666666666666, 0.16666666666666669, 0.3333333333333333),
 		},
-		13/sp.Rational(20): {
+		Fraction(13, 20): {
 			"0000000000000000000000000000011100000000000001110000111111111111": (0.055555555555555525, 0.07777777777777774, 0.18888888888888888, 0.18888888888888888, 0.24444444444444446, 0.24444444444444452),
 			"0000000000000000000000000000000100000000000000111111111111111111": (0.019999999999999976, 0.039999999999999966, 0.039999999999999966, 0.24000000000000005, 0.32, 0.33999999999999997),
 			"0000000000000000000000000000111100000000000111110111111111111111": (0.009090909090909049, 0.009090909090909084, 0.02727272727272717, 0.3090909090909091, 0.3181818181818183, 0.32727272727272727),
@@ -3343,7 +3343,7 @@ all_wvgs_at_quota = {
 			"0000000000000000000000000000000000000001000111110011111111111111": (0.04666666666666667, 0.09333333333333337, 0.13999999999999996, 0.14, 0.18666666666666662, 0.39333333333333337),
 			"0000000000000000000000000000001100000011001111110011111111111111": (0.0, 0.16666666666666666, 0.16666666666666666, 0.16666666666666666, 0.16666666666666669, 0.3333333333333333),
 		},
-		7/sp.Rational(10): {
+		Fraction(7, 10): {
 			"0000000000000000000000000000011100000000000001110000111111111111": (0.03333333333333316, 0.03333333333333334, 0.2166666666666667, 0.21666666666666673, 0.24999999999999992, 0.2500000000000001),
 			"0000000000000000000000000000001100000000000001110000111111111111": (0.024999999999999887, 0.049999999999999906, 0.21250000000000005, 0.21250000000000008, 0.23749999999999996, 0.2625),
 			"0000000000000000000000000000000000000000000000010000011111111111": (0.04000000000000006, 0.04000000000000006, 0.08000000000000013, 0.23999999999999985, 0.27999999999999986, 0.32),
@@ -3492,7 +3492,7 @@ all_wvgs_at_quota = {
 			"0000000000000000000000000000000000000000111111111111111111111111": (0.0, 0.0, 0.0, 0.2, 0.2, 0.6),
 			"0000000000000000000000000000000000000001000111110011111111111111": (0.040000000000000036, 0.08, 0.11999999999999991, 0.12000000000000001, 0.15999999999999986, 0.4800000000000001),
 		},
-		3/sp.Rational(4): {
+		Fraction(3, 4): {
 			"0000000000000000000000000000000000000000000000000000001101111111": (0.05555555555555555, 0.1111111111111111, 0.1111111111111111, 0.16666666666666663, 0.2777777777777778, 0.2777777777777778),
 			"0000000000000000000000000000000000000000000000010000011111111111": (0.05555555555555556, 0.05555555555555556, 0.1111111111111111, 0.16666666666666666, 0.22222222222222227, 0.3888888888888889),
 			"0000000000000000000000000000000000000000011111111111111111111111": (0.038461538461538484, 0.038461538461538484, 0.038461538461538484, 0.11538461538461545, 0.15384615384615394, 0.6153846153846153),
@@ -3608,7 +3608,7 @@ all_wvgs_at_quota = {
 			"0000000000000000000000000000000000000001000111110011111111111111": (0.03333333333333329, 0.06666666666666662, 0.09999999999999995, 0.09999999999999996, 0.13333333333333328, 0.5666666666666668),
 			"0000000000000000000000000000000000000000000000010000000100010111": (0.14285714285714285, 0.14285714285714285, 0.14285714285714285, 0.14285714285714285, 0.14285714285714285, 0.28571428571428575),
 		},
-		4/sp.Rational(5): {
+		Fraction(4, 5): {
 			"0000000000000000000000000000000000000000000000000000001101111111": (0.04444444444444444, 0.08888888888888886, 0.08888888888888886, 0.1333333333333333, 0.22222222222222218, 0.42222222222222233),
 			"0000000000000000000000000000000000000000000000000000000000010111": (0.11111111111111102, 0.1111111111111111, 0.11111111111111112, 0.2222222222222222, 0.22222222222222224, 0.22222222222222224),
 			"0000000000000000000000000000000000000000000000010000011111111111": (0.04444444444444443, 0.04444444444444444, 0.08888888888888888, 0.13333333333333333, 0.17777777777777765, 0.5111111111111112),
@@ -3726,7 +3726,7 @@ all_wvgs_at_quota = {
 			"0000000000000000000000000000000000000001000111110011111111111111": (0.02666666666666672, 0.053333333333333434, 0.07999999999999988, 0.08000000000000002, 0.10666666666666647, 0.6533333333333334),
 			"0000000000000000000000000000000000000000000000010000000100010111": (0.13333333333333336, 0.13333333333333336, 0.13333333333333336, 0.13333333333333336, 0.13333333333333341, 0.33333333333333326),
 		},
-		17/sp.Rational(20): {
+		Fraction(17, 20): {
 			"0000000000000000000000000000000000000000000000000000001101111111": (0.033333333333333326, 0.06666666666666665, 0.06666666666666665, 0.10000000000000002, 0.16666666666666663, 0.5666666666666668),
 			"0000000000000000000000000000000000000000000000000000000000010111": (0.1, 0.1, 0.10000000000000009, 0.2, 0.2, 0.3),
 			"0000000000000000000000000000000000000000000000010000011111111111": (0.03333333333333332, 0.033333333333333326, 0.06666666666666665, 0.09999999999999998, 0.1333333333333332, 0.6333333333333334),
@@ -3846,7 +3846,7 @@ all_wvgs_at_quota = {
 			"0000000000000000000000000000000000000001000111110011111111111111": (0.01999999999999994, 0.039999999999999994, 0.05999999999999997, 0.060000000000000026, 0.0800000000000001, 0.74),
 			"0000000000000000000000000000000000000000000000010000000100010111": (0.1, 0.1, 0.1, 0.1, 0.10000000000000003, 0.5),
 		},
-		9/sp.Rational(10): {
+		Fraction(9, 10): {
 			"0000000000000000000000000000000000000000000000000000001101111111": (0.022222222222222213, 0.04444444444444442, 0.04444444444444442, 0.06666666666666683, 0.11111111111111105, 0.711111111111111),
 			"0000000000000000000000000000000000000000000000000000000000010111": (0.0666666666666666, 0.06666666666666668, 0.06666666666666668, 0.13333333333333333, 0.13333333333333333, 0.5333333333333334),
 			"0000000000000000000000000000000000000000000000010000011111111111": (0.022222222222222213, 0.022222222222222213, 0.04444444444444441, 0.06666666666666662, 0.08888888888888871, 0.7555555555555558),
@@ -3966,7 +3966,7 @@ all_wvgs_at_quota = {
 			"0000000000000000000000000000000000000001000111110011111111111111": (0.013333333333333272, 0.02666666666666666, 0.03999999999999995, 0.04000000000000003, 0.05333333333333342, 0.8266666666666667),
 			"0000000000000000000000000000000000000000000000010000000100010111": (0.06666666666666668, 0.06666666666666668, 0.06666666666666668, 0.06666666666666668, 0.06666666666666671, 0.6666666666666666),
 		},
-		19/sp.Rational(20): {
+		Fraction(19, 20): {
 			"0000000000000000000000000000000000000000000000000000001101111111": (0.0111111111111111, 0.0222222222222222, 0.0222222222222222, 0.033333333333333194, 0.05555555555555549, 0.8555555555555557),
 			"0000000000000000000000000000000000000000000000000000000000010111": (0.0333333333333333, 0.03333333333333334, 0.03333333333333334, 0.06666666666666667, 0.06666666666666667, 0.7666666666666667),
 			"0000000000000000000000000000000000000000000000010000011111111111": (0.011111111111111098, 0.0111111111111111, 0.0222222222222222, 0.0333333333333333, 0.04444444444444433, 0.877777777777778),
@@ -4086,7 +4086,7 @@ all_wvgs_at_quota = {
 			"0000000000000000000000000000000000000001000111110011111111111111": (0.006666666666666715, 0.013333333333333442, 0.019999999999999844, 0.020000000000000028, 0.026666666666666523, 0.9133333333333334),
 			"0000000000000000000000000000000000000000000000010000000100010111": (0.03333333333333334, 0.03333333333333334, 0.03333333333333334, 0.03333333333333334, 0.03333333333333341, 0.8333333333333333),
 		},
-		2/sp.Rational(3): {
+		Fraction(2, 3): {
 			"0000000000000000000000000000011100000000000001110000111111111111": (0.05555555555555556, 0.055555555555555663, 0.19444444444444442, 0.19444444444444442, 0.24999999999999992, 0.25000000000000006),
 			"0000000000000000000000000000001100000000000001110000111111111111": (0.04166666666666674, 0.08333333333333341, 0.18749999999999997, 0.1875, 0.2291666666666666, 0.2708333333333333),
 			"0000000000000000000000000000000100000000000000010001111111111111": (0.08333333333333337, 0.08333333333333343, 0.1388888888888889, 0.1388888888888889, 0.27777777777777773, 0.2777777777777778),
@@ -0,0 +1,106 @@
+import ast
+import os
+import re
+from collections.abc import Mapping
+from fractions import Fraction
+
+ALL_WVGS_AT_QUOTA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'all_wvgs_at_quota.py')
+
+N_LINE = re.compile(r'\t(\d+): \{$')
+QUOTA_LINE = re.compile(r'\t\t(?:(\d+)/sp\.Rational\((\d+)\)|Fraction\((\d+), (\d+)\)): \{$')
+
+def quota_key(quota):
+    ''' Storage key of a quota: sympy Rationals, Fractions, ints and (short) floats like 0.55 all map to the same Fraction.'''
+    return Fraction(str(quota))
+
+
+class _QuotaTable(Mapping):
+    def __init__(self, table, n):
+        self.table = table
+        self.n = n
+
+    def __getitem__(self, quota):
+        return self.table.load(self.n, quota)
+
+    def __iter__(self):
+        return iter(self.table.offsets()[self.n])
+
+    def __len__(self):
+        return len(self.table.offsets()[self.n])
+
+
+class LazyWVGTable(Mapping):
+    '''
+    Read-only view of storage/all_wvgs_at_quota.py that is used as table[n][quota] like the stored dict.
+
+    Instead of executing the whole file, the first access scans it once for the byte offset of every
+    (n, quota) block, and a block is only parsed (with ast.literal_eval) and cached when it is requested.
+    Quotas can be given as anything quota_key accepts.
+    '''
+
+    def __init__(self, path = ALL_WVGS_AT_QUOTA_PATH):
+        self.path = path
+        self._offsets = None
+        self._cache = dict()
+
+    def offsets(self):
+        if self._offsets is None:
+            offsets = dict()
+            n = None
+            with open(self.path, 'rb') as file:
+                position = 0
+                for line in file:
+                    position += len(line)
+                    text = line.decode().rstrip('\r\n')
+                    if (match := N_LINE.match(text)):
+                        n = int(match.group(1))
+                        offsets[n] = dict()
+                    elif (match := QUOTA_LINE.match(text)):
+                        numerator, denominator = [int(ele) for ele in match.groups() if ele is not None]
+                        offsets[n][Fraction(numerator, denominator)] = position
+            self._offsets = offsets
+        return self._offsets
+
+    def load(self, n, quota):
+        key = (n, quota_key(quota))
+        if key not in self._cache:
+            position = self.offsets()[n][key[1]]
+            lines = []
+            with open(self.path, 'rb') as file:
+                file.seek(position)
+                for line in file:
+                    text = line.decode()
+                    if text.rstrip('\r\n') == '\t\t},': break
+                    lines.append(text)
+            self._cache[key] = ast.literal_eval('{' + ''.join(lines) + '}')
+        return self._cache[key]
+
+    def __getitem__(self, n):
+        if n not in self.offsets(): raise KeyError(n)
+        return _QuotaTable(self, n)
+
+    def __iter__(self):
+        return iter(self.offsets())
+
+    def __len__(self):
+        return len(self.offsets())
+
+
+all_wvgs_at_quota = LazyWVGTable()
+
+
+if __name__ == "__main__":
+    print("Running tests:")
+    table = LazyWVGTable()
+    assert table.load(4, Fraction(3, 4)) is table[4][0.75] is table[4]["3/4"]
+    assert table[3][Fraction(1, 2)] is table[3][0.5]
+    assert set(table._cache) == {(4, Fraction(3, 4)), (3, Fraction(1, 2))}
+    # Every block is the same as in the dict from executing the whole file
+    stored = dict()
+    with open(ALL_WVGS_AT_QUOTA_PATH) as file: exec(file.read(), stored)
+    stored = stored['all_wvgs_at_quota']
+    assert list(table) == list(stored)
+    for n in stored:
+        assert list(table[n]) == list(stored[n])
+        for quota in stored[n]: assert table[n][quota] == stored[n][quota]
+    print("Success")
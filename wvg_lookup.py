@@ -0,0 +1,102 @@
+import numpy as np
+from scipy.spatial import cKDTree
+from helpers import banzhaf, shapley, no_veto_index
+
+INDICES = {'banzhaf': lambda weights, q: banzhaf(weights, q, True, False),
+           'shapley': lambda weights, q: shapley(weights, q, False),
+           'no_veto': no_veto_index}
+
+class WVGLookup:
+    '''
+    Nearest stored WVGs to a target power distribution, as an exact inverse for small n.
+
+    Games are read (lazily per (n, quota)) from storage/all_wvgs_at_quota.py, so n <= 6 and the quota has to be one of the stored quotas.
+    For each (n, quota, index) the power vectors of all stored games are computed once, sorted and put in a
+    KD-tree, so a query is a tree lookup. Since every permutation of a stored game is a WVG as well and sorted
+    vectors are the closest permutations of each other, the target is sorted before the lookup and the
+    weights are permuted back to the order of the target.
+
+    lookup = WVGLookup()
+    for distance, func, weights, powers in lookup.nearest(target, 3/4, 'banzhaf', k=3): ...
+    '''
+
+    def __init__(self, p = 1, table = None):
+        if p not in (1, 2, 'infty'): raise ValueError(f"p needs to be 1, 2 or 'infty', got {p}")
+        self.p = np.inf if p == 'infty' else p
+        if table is None:
+            from storage.loader import all_wvgs_at_quota as table
+        self.table = table
+        self._trees = dict()
+
+    def _stored_quota(self, n, quota):
+        if n not in self.table: raise ValueError(f"No stored WVGs for n={n}")
+        for stored_quota in self.table[n]:
+            if abs(float(stored_quota) - float(quota)) < 1e-9: return stored_quota
+        raise ValueError(f"No stored WVGs for n={n} at quota {quota}")
+
+    def _tree(self, n, quota, index):
+        key = (n, quota, index)
+        if key not in self._trees:
+            functions, weights, powers = [], [], []
+            for func, stored_weights in self.table[n][quota].items():
+                power = np.array([float(ele) for ele in INDICES[index](stored_weights, quota)])
+                order = np.argsort(power, kind = 'stable')
+                functions.append(func)
+                weights.append(np.array(stored_weights)[order])
+                powers.append(power[order])
+            self._trees[key] = (cKDTree(np.array(powers)), functions, weights, powers)
+        return self._trees[key]
+
+    def prebuild(self, indices = tuple(INDICES)):
+        ''' Builds the trees for all stored (n, quota) up front, so no query pays for it.'''
+        for n in self.table:
+            for quota in self.table[n]:
+                for index in indices: self._tree(n, quota, index)
+        return self
+
+    def nearest(self, target, quota, index = 'banzhaf', k = 1):
+        ''' The k stored games whose index is closest to target, as (distance, function, weights, powers) with
+        weights and powers in the order of target. The function string refers to the stored (sorted) game.'''
+        if index not in INDICES: raise ValueError(f"Unknown index {index}, expected one of {list(INDICES)}")
+        target = np.array([float(ele) for ele in target])
+        n = len(target)
+        tree, functions, weights, powers = self._tree(n, self._stored_quota(n, quota), index)
+        k = min(k, len(functions))
+        order = np.argsort(target, kind = 'stable')
+        distances, found = tree.query(target[order], k = k, p = self.p)
+        results = []
+        for distance, i in zip(np.atleast_1d(distances), np.atleast_1d(found)):
+            unsorted_weights, unsorted_powers = np.empty(n), np.empty(n)
+            unsorted_weights[order] = weights[i]
+            unsorted_powers[order] = powers[i]
+            results.append((float(distance), functions[i], tuple(unsorted_weights.tolist()), unsorted_powers.tolist()))
+        return results
+
+
+if __name__ == "__main__":
+    import itertools
+    import random
+    from fractions import Fraction
+    from helpers import find_closest
+    print("Running tests:")
+    random.seed(0)
+    rng = np.random.default_rng(0)
+    quota = Fraction(3, 4)
+    for p in (1, 2, 'infty'):
+        lookup = WVGLookup(p)
+        stored = [[float(ele) for ele in INDICES['banzhaf'](weights, quota)] for weights in lookup.table[4][quota].values()]
+        # A stored game in any order of its players is found at distance 0, with weights that give the target back
+        for powers in stored:
+            target = random.sample(powers, len(powers))
+            distance, func, weights, found = lookup.nearest(target, 0.75)[0]
+            assert distance < 1e-12
+            assert max(abs(ele1 - ele2) for ele1, ele2 in zip(found, target)) < 1e-12
+            assert max(abs(float(ele1) - ele2) for ele1, ele2 in zip(INDICES['banzhaf'](weights, quota), target)) < 1e-12
+        # Other targets are as close to the nearest game as to the closest permutation of any stored game
+        candidates = [list(permuted) for powers in stored for permuted in itertools.permutations(powers)]
+        norm = np.inf if p == 'infty' else p
+        for _ in range(50):
+            target = rng.dirichlet(np.ones(4)).tolist()
+            closest = find_closest(target, candidates, p, False)
+            assert abs(lookup.nearest(target, quota)[0][0] - np.linalg.norm(np.array(closest) - target, norm)) < 1e-12
+    print("Success")